@@ -0,0 +1,478 @@
+"""End-to-end load benchmark for the green agent.
+
+Starts a stand-in purple agent in a child process, then drives assessments
+against it either in process (``run_assessment``) or through a local server
+(``/v1/message:send`` or JSON-RPC ``message/stream``). Prints one JSON report:
+questions/sec, assessment and question latency percentiles, peak RSS and
+event-loop lag of the green side.
+
+    PYTHONPATH=src python benchmarks/load.py --mode stream --participants 4 \\
+        --questions 50 --assessments 8 --latency lognormal:-2.5,0.6
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import socket
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+import aiohttp
+from aiohttp import web
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Answer delay distribution, parsed from ``kind:param[,param]``."""
+
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.05,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, _, raw = spec.partition(":")
+        params = tuple(float(value) for value in raw.split(",") if value)
+        expected = {"fixed": 1, "uniform": 2, "exponential": 1, "lognormal": 2}
+        if kind not in expected or len(params) != expected[kind]:
+            raise argparse.ArgumentTypeError(
+                "latency must be fixed:S, uniform:LO,HI, exponential:MEAN or lognormal:MU,SIGMA"
+            )
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+        return rng.lognormvariate(*self.params)
+
+
+@dataclass(frozen=True)
+class PurpleSettings:
+    latency: Latency
+    error_rate: float
+    error_status: int
+    answer_bytes: int
+    streaming: bool
+    chunk_bytes: int
+    seed: int
+
+
+class FakePurpleAgent:
+    """A2A participant that answers ``question N`` with ``answer N`` plus filler."""
+
+    def __init__(self, settings: PurpleSettings, url: str):
+        self.settings = settings
+        self.url = url
+        self.rng = random.Random(settings.seed)
+
+    def _answer(self, idx: int) -> str:
+        text = f"answer {idx}"
+        filler = self.settings.answer_bytes - len(text) - 1
+        return text + (" " + "x" * filler if filler > 0 else "")
+
+    async def card(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "name": "bench-purple",
+                "url": self.url,
+                "capabilities": {"streaming": self.settings.streaming},
+            }
+        )
+
+    async def rpc(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        message = payload["params"]["message"]
+        idx = int(message["parts"][0]["text"].rsplit(" ", 1)[-1])
+        await asyncio.sleep(self.settings.latency.sample(self.rng))
+        if self.rng.random() < self.settings.error_rate:
+            return web.json_response({"error": "injected"}, status=self.settings.error_status)
+        if payload["method"] == "message/stream":
+            return await self._stream(request, payload, idx)
+        return web.json_response(
+            {
+                "jsonrpc": "2.0",
+                "id": payload["id"],
+                "result": {
+                    "kind": "message",
+                    "messageId": uuid4().hex,
+                    "contextId": message["contextId"],
+                    "parts": [{"kind": "text", "text": self._answer(idx)}],
+                },
+            }
+        )
+
+    async def _stream(self, request: web.Request, payload: dict, idx: int) -> web.StreamResponse:
+        context_id = payload["params"]["message"]["contextId"]
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        answer = self._answer(idx)
+        size = max(1, self.settings.chunk_bytes)
+        for offset in range(0, len(answer), size):
+            event = {
+                "kind": "artifact-update",
+                "contextId": context_id,
+                "artifact": {
+                    "artifactId": "answer",
+                    "parts": [{"kind": "text", "text": answer[offset : offset + size]}],
+                },
+                "append": offset > 0,
+            }
+            body = {"jsonrpc": "2.0", "id": payload["id"], "result": event}
+            await response.write(f"data: {json.dumps(body)}\n\n".encode())
+        final = {
+            "kind": "status-update",
+            "contextId": context_id,
+            "status": {"state": "completed"},
+            "final": True,
+        }
+        body = {"jsonrpc": "2.0", "id": payload["id"], "result": final}
+        await response.write(f"data: {json.dumps(body)}\n\n".encode())
+        await response.write_eof()
+        return response
+
+
+def _serve_purple(settings: PurpleSettings, port: int) -> None:
+    # Runs in a child process so its CPU, memory and event loop stay out of
+    # the green agent's measurements.
+    agent = FakePurpleAgent(settings, f"http://127.0.0.1:{port}")
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_get("/.well-known/agent-card.json", agent.card)
+    app.router.add_post("/", agent.rpc)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_up(url: str, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(url) as response:
+                    if response.status < 500:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout} seconds.")
+            await asyncio.sleep(0.05)
+
+
+def write_dataset(path: str, count: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["Question", "Rubric"])
+        writer.writeheader()
+        for idx in range(count):
+            rubric = [{"operator": "correctness", "criteria": f"answer {idx}"}]
+            writer.writerow({"Question": f"question {idx}", "Rubric": repr(rubric)})
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes a sleeper that asked for ``interval``."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+def _percentile(values: list[float], percent: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percent / 100 * len(ordered))) - 1]
+
+
+def _distribution(values: list[float]) -> dict[str, float | None]:
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else None,
+        "p50": _percentile(values, 50),
+        "p99": _percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _eval_request(args: argparse.Namespace, purple_url: str, dataset: str) -> str:
+    return json.dumps(
+        {
+            "participants": {f"participant-{i}": purple_url for i in range(args.participants)},
+            "config": {
+                "participantRole": "participant-0",
+                "datasetPath": dataset,
+                "maxQuestions": args.questions,
+                "maxConcurrency": args.max_concurrency,
+                "maxInFlight": args.max_in_flight,
+                "timeoutSeconds": args.timeout,
+                "streaming": args.streaming,
+                "seed": args.seed,
+            },
+        }
+    )
+
+
+def _rows(result: dict[str, Any]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for participant in (result.get("participants") or {}).values():
+        rows.extend(participant.get("results") or [])
+    return rows
+
+
+def _result_from_task(task: dict[str, Any]) -> dict[str, Any]:
+    for artifact in task.get("artifacts") or []:
+        if artifact.get("name") == "EvaluationResult":
+            return artifact["parts"][1]["data"]["data"]
+    raise RuntimeError(f"Task ended without a result: {task.get('status')}")
+
+
+async def _run_direct(request: str, session: aiohttp.ClientSession) -> dict[str, Any]:
+    from finance_green_agent.green_eval import run_assessment
+
+    result, _ = await run_assessment(request, session=session)
+    return result
+
+
+async def _run_send(request: str, client: tuple[aiohttp.ClientSession, str]) -> dict[str, Any]:
+    session, base_url = client
+    payload = {
+        "message": {
+            "messageId": uuid4().hex,
+            "role": "ROLE_USER",
+            "content": [{"text": request}],
+        },
+        "configuration": {"acceptedOutputModes": ["text"]},
+    }
+    async with session.post(f"{base_url}/v1/message:send", json=payload) as response:
+        response.raise_for_status()
+        return _result_from_task((await response.json())["task"])
+
+
+async def _run_stream(request: str, client: tuple[aiohttp.ClientSession, str]) -> dict[str, Any]:
+    session, base_url = client
+    payload = {
+        "jsonrpc": "2.0",
+        "id": uuid4().hex,
+        "method": "message/stream",
+        "params": {
+            "message": {
+                "kind": "message",
+                "messageId": uuid4().hex,
+                "role": "user",
+                "parts": [{"kind": "text", "text": request}],
+            }
+        },
+    }
+    result = None
+    async with session.post(f"{base_url}/", json=payload) as response:
+        response.raise_for_status()
+        # Split lines by hand: the result event is one line, often longer
+        # than aiohttp's readline limit.
+        buffer = bytearray()
+        async for chunk in response.content.iter_any():
+            buffer += chunk
+            newline = buffer.find(b"\n", max(0, len(buffer) - len(chunk)))
+            while newline != -1:
+                line = bytes(buffer[:newline])
+                del buffer[: newline + 1]
+                newline = buffer.find(b"\n")
+                if not line.startswith(b"data: "):
+                    continue
+                event = json.loads(line[len(b"data: ") :])["result"]
+                artifact = event.get("artifact") or {}
+                if event.get("kind") == "artifact-update" and artifact.get("name") == "EvaluationResult":
+                    result = artifact["parts"][1]["data"]
+    if result is None:
+        raise RuntimeError("Stream ended without a result.")
+    return result
+
+
+async def _start_green_server(port: int):
+    import uvicorn
+
+    from finance_green_agent.server import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="on")
+    )
+    task = asyncio.create_task(server.serve())
+    await _wait_until_up(f"http://127.0.0.1:{port}/.well-known/agent-card.json")
+    return server, task
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    purple_port = _free_port()
+    purple_url = f"http://127.0.0.1:{purple_port}"
+    settings = PurpleSettings(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        answer_bytes=args.answer_bytes,
+        streaming=args.streaming,
+        chunk_bytes=args.chunk_bytes,
+        seed=args.seed,
+    )
+    purple = multiprocessing.get_context("spawn").Process(
+        target=_serve_purple, args=(settings, purple_port), daemon=True
+    )
+    purple.start()
+    server = server_task = client_session = None
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            await _wait_until_up(purple_url + "/.well-known/agent-card.json")
+            dataset = os.path.join(workdir, "questions.csv")
+            write_dataset(dataset, args.questions)
+            request = _eval_request(args, purple_url, dataset)
+
+            client: Any
+            runner = _run_direct
+            if args.mode == "direct":
+                from finance_green_agent.http_pool import create_session
+
+                # Mirror the server, which shares one pool across assessments.
+                client = client_session = create_session()
+            else:
+                green_port = _free_port()
+                server, server_task = await _start_green_server(green_port)
+                client_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=None))
+                client = (client_session, f"http://127.0.0.1:{green_port}")
+                runner = _run_send if args.mode == "send" else _run_stream
+
+            limit = asyncio.Semaphore(args.concurrency)
+            latencies: list[float] = []
+            rows: list[dict[str, Any]] = []
+            failures = 0
+
+            async def _one() -> None:
+                nonlocal failures
+                async with limit:
+                    started = time.perf_counter()
+                    try:
+                        result = await runner(request, client)
+                    except Exception:  # noqa: BLE001 - counted, not fatal
+                        failures += 1
+                        return
+                    latencies.append(time.perf_counter() - started)
+                    rows.extend(_rows(result))
+
+            monitor = LoopLagMonitor(args.lag_interval)
+            monitor.start()
+            started = time.perf_counter()
+            await asyncio.gather(*(_one() for _ in range(args.assessments)))
+            duration = time.perf_counter() - started
+            await monitor.stop()
+        finally:
+            if client_session is not None:
+                await client_session.close()
+            if server is not None:
+                server.should_exit = True
+                await server_task
+            purple.terminate()
+            purple.join()
+
+    question_latencies = [
+        float(row["latency_seconds"])
+        for row in rows
+        if row.get("latency_seconds") is not None and not row.get("error")
+    ]
+    return {
+        "benchmark": "load",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            key: (asdict(value) if isinstance(value, Latency) else value)
+            for key, value in vars(args).items()
+            if key != "output"
+        },
+        "duration_seconds": duration,
+        "assessments_completed": len(latencies),
+        "assessments_failed": failures,
+        "questions": len(rows),
+        "question_errors": sum(1 for row in rows if row.get("error")),
+        "questions_per_second": len(rows) / duration if duration > 0 else 0.0,
+        "assessment_latency_seconds": _distribution(latencies),
+        "question_latency_seconds": _distribution(question_latencies),
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "event_loop_lag_seconds": _distribution(monitor.samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the green agent")
+    parser.add_argument("--mode", choices=["direct", "send", "stream"], default="direct")
+    parser.add_argument("--participants", type=int, default=1)
+    parser.add_argument(
+        "--questions", type=int, default=50, help="Dataset size (assessments cap it at 50)"
+    )
+    parser.add_argument("--assessments", type=int, default=1, help="Assessments to run in total")
+    parser.add_argument("--concurrency", type=int, default=1, help="Assessments run at once")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="maxConcurrency config")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="maxInFlight config")
+    parser.add_argument("--timeout", type=float, default=30.0, help="timeoutSeconds config")
+    parser.add_argument(
+        "--latency",
+        type=Latency.parse,
+        default=Latency(),
+        help="Purple answer delay: fixed:S, uniform:LO,HI, exponential:MEAN, lognormal:MU,SIGMA",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--answer-bytes", type=int, default=1024)
+    parser.add_argument("--chunk-bytes", type=int, default=4096, help="Bytes per streamed event")
+    parser.add_argument(
+        "--streaming", action="store_true", help="Purple advertises and answers message/stream"
+    )
+    parser.add_argument("--lag-interval", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="", help="Also write the JSON report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
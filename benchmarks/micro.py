@@ -0,0 +1,325 @@
+"""Microbenchmarks for the grading and cache hot paths.
+
+    PYTHONPATH=src python benchmarks/micro.py run [--filter search] [--full]
+    PYTHONPATH=src python benchmarks/micro.py save       # refresh baselines.json
+    PYTHONPATH=src python benchmarks/micro.py compare    # exit 1 on regressions
+
+Each benchmark reports the best per-call time over several timed rounds.
+``compare`` flags any benchmark more than ``--threshold`` slower than its
+stored baseline. Baselines are machine-specific: refresh them on the machine
+that runs the comparison. ``--full`` adds the slow tiers (1M-entry manifests).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+import synthetic
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_THRESHOLD = 0.2
+
+KB = 1024
+MB = 1024 * KB
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    # Builds the inputs (untimed) and returns the call to time.
+    setup: Callable[[str], Callable[[], object]]
+    full_only: bool = False
+
+
+def _normalize_text(size: int):
+    def setup(_: str):
+        from finance_green_agent.tools.unit_normalizer import normalize_text
+
+        text = synthetic.make_answer(size)
+        return lambda: normalize_text(text)
+
+    return setup
+
+
+def _evaluate_answer(size: int, criteria: int):
+    def setup(_: str):
+        from finance_green_agent.eval.rubric import compile_rubric, evaluate_answer
+
+        answer = synthetic.make_answer(size)
+        rubric = compile_rubric(synthetic.make_rubric(criteria))
+        return lambda: evaluate_answer(answer, rubric)
+
+    return setup
+
+
+def _extract_citations(size: int):
+    def setup(_: str):
+        from finance_green_agent.tools.citation_validator import extract_citations
+
+        answer = synthetic.make_answer(size, source_ids=[f"web-{i}" for i in range(0, 20, 2)])
+        return lambda: extract_citations(answer)
+
+    return setup
+
+
+def _validate_citations(size: int):
+    def setup(workdir: str):
+        from finance_green_agent.tools.citation_validator import validate_citations
+
+        cache_dir = os.path.join(workdir, "citations")
+        synthetic.write_manifest(cache_dir, synthetic.make_manifest_entries(1000))
+        os.environ["FINANCE_GREEN_CACHE_DIR"] = cache_dir
+        answer = synthetic.make_answer(size, source_ids=[f"web-{i}" for i in range(0, 20, 2)])
+        return lambda: validate_citations(answer)
+
+    return setup
+
+
+def _manifest(workdir: str, count: int):
+    from finance_green_agent.tools.cache_manifest import CacheManifest
+
+    cache_dir = os.path.join(workdir, f"manifest-{count}")
+    if not os.path.exists(os.path.join(cache_dir, "manifest.json")):
+        synthetic.write_manifest(cache_dir, synthetic.make_manifest_entries(count))
+    return CacheManifest(cache_dir)
+
+
+def _manifest_load(count: int):
+    def setup(workdir: str):
+        manifest = _manifest(workdir, count)
+        return manifest._load
+
+    return setup
+
+
+def _compiled_manifest_load(count: int):
+    # The same load, served from ``cache build`` output.
+    def setup(workdir: str):
+        from finance_green_agent.tools.cache_manifest import CacheManifest
+
+        cache_dir = _manifest(workdir, count).cache_dir
+        build_dir = os.path.join(workdir, f"build-{count}")
+        CacheManifest(cache_dir, build_dir).write_compiled()
+        manifest = CacheManifest(cache_dir, build_dir)
+        assert manifest.compiled
+        return manifest._load
+
+    return setup
+
+
+def _search_web(count: int):
+    def setup(workdir: str):
+        manifest = _manifest(workdir, count)
+        return lambda: manifest.search_web("nvidia free cash flow", top_n=10)
+
+    return setup
+
+
+def _search_sec(count: int):
+    def setup(workdir: str):
+        manifest = _manifest(workdir, count)
+        return lambda: manifest.search_sec("apple 10-k", ["10-K"], None, top_n=10)
+
+    return setup
+
+
+def _filing(workdir: str, size: int) -> str:
+    cache_dir = os.path.join(workdir, f"filing-{size}")
+    path = os.path.join(cache_dir, "10k.htm")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        synthetic.write_manifest(cache_dir, [])
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(synthetic.make_filing_html(size))
+    return path
+
+
+def _parse_cached_html(size: int):
+    # Repeat reads of one filing: served by the extracted-text cache.
+    def setup(workdir: str):
+        from finance_green_agent.tools.parse_cached_html import ParseCachedHtml
+
+        path = _filing(workdir, size)
+        os.environ["FINANCE_GREEN_CACHE_DIR"] = os.path.dirname(path)
+        tool = ParseCachedHtml()
+        loop = asyncio.new_event_loop()
+        return lambda: loop.run_until_complete(tool.call_tool({"path": path}, {}))
+
+    return setup
+
+
+def _extract_text(size: int):
+    # A cache miss: streaming the filing from disk through the extractor.
+    def setup(workdir: str):
+        from finance_green_agent.tools.html_text import extract_file_text
+
+        path = _filing(workdir, size)
+        return lambda: extract_file_text(path)
+
+    return setup
+
+
+BENCHMARKS = [
+    *(
+        Benchmark(f"normalize_text[{label}]", _normalize_text(size))
+        for label, size in (("1KB", KB), ("64KB", 64 * KB), ("1MB", MB))
+    ),
+    *(
+        Benchmark(f"evaluate_answer[{label},{criteria}]", _evaluate_answer(size, criteria))
+        for label, size in (("1KB", KB), ("64KB", 64 * KB), ("1MB", MB))
+        for criteria in (5, 100)
+    ),
+    *(
+        Benchmark(f"extract_citations[{label}]", _extract_citations(size))
+        for label, size in (("1KB", KB), ("1MB", MB))
+    ),
+    *(
+        Benchmark(f"validate_citations[{label}]", _validate_citations(size))
+        for label, size in (("1KB", KB), ("1MB", MB))
+    ),
+    *(
+        Benchmark(f"{kind}[{label}]", factory(count), full_only=count > 100_000)
+        for kind, factory in (
+            ("manifest_load", _manifest_load),
+            ("compiled_manifest_load", _compiled_manifest_load),
+            ("search_web", _search_web),
+            ("search_sec", _search_sec),
+        )
+        for label, count in (("1k", 1_000), ("100k", 100_000), ("1M", 1_000_000))
+    ),
+    Benchmark("extract_text[5MB]", _extract_text(5 * MB)),
+    Benchmark("parse_cached_html[5MB]", _parse_cached_html(5 * MB)),
+]
+
+
+def measure(call: Callable[[], object], rounds: int) -> dict:
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(rounds, number)) / number
+    return {"seconds": best, "loops": number}
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for benchmark in BENCHMARKS:
+            if args.filter and args.filter not in benchmark.name:
+                continue
+            if benchmark.full_only and not args.full:
+                continue
+            try:
+                call = benchmark.setup(workdir)
+            except ImportError as exc:
+                results[benchmark.name] = {"skipped": f"missing dependency: {exc.name}"}
+            else:
+                results[benchmark.name] = measure(call, args.rounds)
+            print(f"{benchmark.name}: {_describe(results[benchmark.name])}", file=sys.stderr)
+    return results
+
+
+def _describe(result: dict) -> str:
+    if "skipped" in result:
+        return f"skipped ({result['skipped']})"
+    return f"{result['seconds'] * 1e6:,.1f} us/call"
+
+
+def _environment() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def load_baselines(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"environment": {}, "benchmarks": {}}
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(results: dict, baselines: dict, threshold: float) -> tuple[list[dict], bool]:
+    """Per-benchmark ratio to baseline; True if any exceeds ``1 + threshold``."""
+    rows = []
+    regressed = False
+    stored = baselines.get("benchmarks", {})
+    for name, result in results.items():
+        baseline = stored.get(name, {}).get("seconds")
+        current = result.get("seconds")
+        row = {"name": name, "baseline": baseline, "current": current, "ratio": None}
+        if baseline and current is not None:
+            row["ratio"] = current / baseline
+            if row["ratio"] > 1 + threshold:
+                row["status"] = "REGRESSION"
+                regressed = True
+            elif row["ratio"] < 1 - threshold:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        else:
+            row["status"] = "skipped" if current is None else "no baseline"
+        rows.append(row)
+    return rows, regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Grading and cache microbenchmarks")
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this text")
+    parser.add_argument("--full", action="store_true", help="Include the slow 1M-entry tiers")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before flagging, as a fraction (0.2 = 20%%)",
+    )
+    parser.add_argument("--output", default="", help="Also write the JSON report here")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    report: dict = {"environment": _environment(), "benchmarks": results}
+
+    if args.command == "save":
+        baselines = load_baselines(args.baselines)
+        baselines["environment"] = report["environment"]
+        baselines.setdefault("benchmarks", {}).update(
+            {name: result for name, result in results.items() if "seconds" in result}
+        )
+        baselines["benchmarks"] = dict(sorted(baselines["benchmarks"].items()))
+        with open(args.baselines, "w", encoding="utf-8") as handle:
+            json.dump(baselines, handle, indent=2)
+            handle.write("\n")
+
+    regressed = False
+    if args.command == "compare":
+        baselines = load_baselines(args.baselines)
+        rows, regressed = compare(results, baselines, args.threshold)
+        report["baseline_environment"] = baselines.get("environment", {})
+        report["comparison"] = rows
+        report["regressed"] = regressed
+        for row in rows:
+            ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+            print(f"{row['status']:>12}  {ratio:>7}  {row['name']}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    print(text)
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
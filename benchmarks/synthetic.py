@@ -0,0 +1,137 @@
+"""Deterministic synthetic inputs for the benchmarks: answers, manifests, filings."""
+
+import json
+import os
+import random
+
+_WORDS = (
+    "revenue net income operating margin guidance fiscal quarter segment growth "
+    "diluted earnings per share free cash flow capital expenditures backlog "
+    "gross profit consensus estimate year over year subscription services "
+    "acquisition goodwill impairment dividend buyback liquidity debt covenant"
+).split()
+_UNITS = ("$", "", "")
+_SUFFIXES = (" billion", " million", "%", " bps", "bn", "")
+_COMPANIES = (
+    "Apple", "Microsoft", "Alphabet", "Amazon", "Nvidia", "Meta", "Tesla", "Netflix",
+    "Oracle", "Salesforce", "Adobe", "Intel", "Cisco", "Qualcomm", "Broadcom", "IBM",
+)
+_FORMS = ("10-K", "10-Q", "8-K", "DEF 14A", "S-1")
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(_WORDS, k=rng.randint(6, 14))
+    amount = f"{rng.choice(_UNITS)}{rng.randint(1, 9999):,}.{rng.randint(0, 9)}{rng.choice(_SUFFIXES)}"
+    words.insert(rng.randrange(len(words)), amount)
+    return " ".join(words).capitalize() + "."
+
+
+def make_text(size: int, seed: int = 0) -> str:
+    """Finance-flavoured prose of about ``size`` characters."""
+    rng = random.Random(seed)
+    sentences: list[str] = []
+    length = 0
+    while length < size:
+        sentence = _sentence(rng)
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)[:size]
+
+
+def make_answer(size: int, seed: int = 0, source_ids: list[str] | None = None) -> str:
+    """A participant answer of about ``size`` characters, ending in a sources block."""
+    sources = [{"id": source_id, "title": source_id} for source_id in (source_ids or [])]
+    tail = " Revenue was $4.2 billion, up 12% year over year.\n" + json.dumps(
+        {"sources": sources}
+    )
+    return make_text(max(0, size - len(tail)), seed) + tail
+
+
+def make_rubric(count: int = 5) -> str:
+    rubric = [{"operator": "correctness", "criteria": "revenue was $4.2 billion"}]
+    rubric += [
+        {"operator": "contradiction", "criteria": f"revenue declined {idx}%"}
+        for idx in range(count - 1)
+    ]
+    return repr(rubric)
+
+
+def make_manifest_entries(count: int, seed: int = 0) -> list[dict]:
+    """``count`` manifest entries, alternating web pages and SEC filings."""
+    rng = random.Random(seed)
+    entries = []
+    for idx in range(count):
+        company = rng.choice(_COMPANIES)
+        year = rng.randint(2015, 2025)
+        if idx % 2:
+            form = rng.choice(_FORMS)
+            cik = f"{rng.randint(1, 1999999):010d}"
+            entries.append(
+                {
+                    "source_id": f"sec-{idx}",
+                    "type": "sec",
+                    "title": f"{company} {form} {year}",
+                    "url": f"https://www.sec.gov/Archives/edgar/data/{cik}/{idx}.htm",
+                    "queries": [f"{company} {form} {year}", f"{company} annual report"],
+                    "local_path": f"sec/{idx}.htm",
+                    "metadata": {"form_types": [form], "ciks": [cik]},
+                }
+            )
+        else:
+            topic = " ".join(rng.choices(_WORDS, k=3))
+            entries.append(
+                {
+                    "source_id": f"web-{idx}",
+                    "type": "web",
+                    "title": f"{company} {topic} {year}",
+                    "url": f"https://news.example.com/{company.lower()}/{idx}",
+                    "queries": [f"{company} {topic}"],
+                    "local_path": f"web/{idx}.html",
+                    "metadata": {},
+                }
+            )
+    return entries
+
+
+def write_manifest(cache_dir: str, entries: list[dict]) -> str:
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, "manifest.json")
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"entries": entries}, handle)
+    return path
+
+
+def make_filing_html(size: int, seed: int = 0) -> str:
+    """A 10-K-like HTML document of about ``size`` bytes.
+
+    Mixes headings, prose, financial tables and the inline script and style
+    blocks that extraction has to drop.
+    """
+    rng = random.Random(seed)
+    parts = [
+        "<html><head><title>Form 10-K</title>",
+        "<style>td { padding: 2px; } .num { text-align: right; }</style>",
+        "<script>window.dataLayer = window.dataLayer || [];</script>",
+        "</head><body>",
+    ]
+    length = sum(map(len, parts))
+    item = 0
+    while length < size:
+        item += 1
+        block = [f"<h2>Item {item}. {' '.join(rng.choices(_WORDS, k=3)).title()}</h2>"]
+        for _ in range(rng.randint(2, 5)):
+            block.append(f"<p>{' '.join(_sentence(rng) for _ in range(4))}</p>")
+        rows = []
+        for _ in range(rng.randint(4, 10)):
+            cells = "".join(
+                f'<td class="num">{rng.randint(1, 99999):,}</td>' for _ in range(4)
+            )
+            rows.append(f"<tr><td>{' '.join(rng.choices(_WORDS, k=2))}</td>{cells}</tr>")
+        block.append(f"<table>{''.join(rows)}</table>")
+        if item % 7 == 0:
+            block.append('<script type="text/javascript">track("item", 1);</script>')
+        chunk = "\n".join(block) + "\n"
+        parts.append(chunk)
+        length += len(chunk)
+    parts.append("</body></html>")
+    return "".join(parts)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import aiohttp
+
+
+DEFAULT_CARD_TTL_SECONDS = 300.0
+DEFAULT_MAX_CARDS = 256
+
+
+@dataclass
+class _CachedCard:
+    card: dict[str, Any]
+    expires_at: float
+    etag: str | None
+    last_modified: str | None
+
+
+def _freshness(headers: Any, default_ttl: float) -> float | None:
+    """Seconds a response may be reused for, or None if it must not be stored.
+
+    ``max-age`` wins over the default TTL; ``no-cache`` stores the card but
+    revalidates it on every use.
+    """
+    directives: dict[str, str | None] = {}
+    for item in headers.get("Cache-Control", "").split(","):
+        name, _, value = item.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(0.0, float(max_age))
+        except ValueError:
+            pass
+    return default_ttl
+
+
+class AgentCardCache:
+    """Agent cards shared across assessments, keyed by participant base URL.
+
+    A card is reused while fresh (``Cache-Control: max-age``, else
+    ``ttl_seconds``). Once stale it is revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` so an unchanged card costs a bodiless 304.
+    Concurrent lookups of the same URL share one request.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_CARD_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_CARDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, _CachedCard] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get(
+        self, session: aiohttp.ClientSession, base_url: str, timeout: aiohttp.ClientTimeout
+    ) -> dict[str, Any]:
+        key = base_url.rstrip("/")
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() < entry.expires_at:
+            self._entries.move_to_end(key)
+            return entry.card
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(session, key, entry, timeout))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda done: self._settle(key, done))
+        return await asyncio.shield(pending)
+
+    def _settle(self, key: str, done: asyncio.Future[dict[str, Any]]) -> None:
+        self._pending.pop(key, None)
+        if not done.cancelled():
+            # Mark the error as seen even if every waiter was cancelled.
+            done.exception()
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        key: str,
+        entry: _CachedCard | None,
+        timeout: aiohttp.ClientTimeout,
+    ) -> dict[str, Any]:
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        async with session.get(
+            key + "/.well-known/agent-card.json", headers=headers, timeout=timeout
+        ) as response:
+            if response.status == 304 and entry is not None:
+                card = entry.card
+            else:
+                response.raise_for_status()
+                card = await response.json()
+            ttl = _freshness(response.headers, self.ttl_seconds)
+            etag = response.headers.get("ETag") or (entry.etag if entry else None)
+            last_modified = response.headers.get("Last-Modified") or (
+                entry.last_modified if entry else None
+            )
+
+        if ttl is None:
+            self._entries.pop(key, None)
+            return card
+        self._entries[key] = _CachedCard(card, self._clock() + ttl, etag, last_modified)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return card
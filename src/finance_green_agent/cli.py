@@ -0,0 +1,42 @@
+import argparse
+import json
+from dataclasses import asdict
+
+from .tools.cache_build import build_cache
+
+
+def _cache_build(args: argparse.Namespace) -> int:
+    report = build_cache(
+        cache_dir=args.cache_dir, build_dir=args.out, jobs=args.jobs, force=args.force
+    )
+    print(json.dumps(asdict(report), indent=2))
+    return 1 if report.failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="finance-green-agent")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cache = commands.add_parser("cache", help="Manage the offline document cache")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    build = cache_commands.add_parser(
+        "build", help="Precompile extracted text, search indexes and metadata"
+    )
+    build.add_argument(
+        "--cache-dir", default=None, help="Cache directory (default: FINANCE_GREEN_CACHE_DIR)"
+    )
+    build.add_argument(
+        "--out",
+        default=None,
+        help="Build directory (default: FINANCE_GREEN_CACHE_BUILD_DIR or <cache-dir>/.build)",
+    )
+    build.add_argument("--jobs", type=int, default=None, help="Worker processes (default: cores)")
+    build.add_argument("--force", action="store_true", help="Rebuild every document")
+    build.set_defaults(handler=_cache_build)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
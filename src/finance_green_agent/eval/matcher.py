@@ -0,0 +1,92 @@
+from typing import Iterable
+
+# Below this many distinct patterns, repeated C-level ``in`` scans beat a
+# pure-Python automaton walk over the text; above it the single pass wins.
+AUTOMATON_MIN_PATTERNS = 64
+
+
+class MultiPatternMatcher:
+    """Aho-Corasick automaton that finds every pattern in one pass over a text.
+
+    ``find`` returns the indices of the patterns that occur in the text as
+    substrings, which is exactly ``{i for i, p in enumerate(patterns) if p in
+    text}``. Transitions are resolved lazily into a per-state table, so after
+    warm-up each character costs a single dict lookup. Small pattern sets are
+    matched with ``in`` per distinct pattern instead (see
+    ``AUTOMATON_MIN_PATTERNS``); both paths give identical results.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(patterns)
+        self._always = frozenset(idx for idx, pattern in enumerate(self.patterns) if not pattern)
+        self._by_pattern: dict[str, list[int]] = {}
+        for idx, pattern in enumerate(self.patterns):
+            if pattern:
+                self._by_pattern.setdefault(pattern, []).append(idx)
+        self.use_automaton = len(self._by_pattern) >= AUTOMATON_MIN_PATTERNS
+
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[set[int]] = [set()]
+        for idx, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(idx)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[nxt] = goto[fallback].get(char, 0)
+                outputs[nxt] |= outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [frozenset(out) for out in outputs]
+        self._delta: list[dict[str, int]] = [dict(edges) for edges in goto]
+
+    def _step(self, state: int, char: str) -> int:
+        origin = state
+        while state and char not in self._goto[state]:
+            state = self._fail[state]
+        target = self._goto[state].get(char, 0)
+        self._delta[origin][char] = target
+        return target
+
+    def find(self, text: str) -> set[int]:
+        found = set(self._always)
+        pending = len(self.patterns) - len(found)
+        if not pending or not text:
+            return found
+
+        if not self.use_automaton:
+            for pattern, indices in self._by_pattern.items():
+                if pattern in text:
+                    found.update(indices)
+            return found
+
+        delta = self._delta
+        outputs = self._outputs
+        step = self._step
+        state = 0
+        for char in text:
+            nxt = delta[state].get(char)
+            state = step(state, char) if nxt is None else nxt
+            matched = outputs[state]
+            if matched and not matched <= found:
+                found |= matched
+                if len(found) == len(self.patterns):
+                    break
+        return found
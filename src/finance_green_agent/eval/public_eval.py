@@ -1,19 +1,17 @@
 import argparse
 import asyncio
-import csv
 import json
 import os
 from datetime import datetime
 
 from ..agent_core.get_agent import Parameters, get_agent
 from ..agent_core.determinism import set_determinism
+from .question_bank import load_question_bank
 from .rubric import evaluate_answer
 
 
 def load_questions(csv_path: str) -> list[dict]:
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return [row for row in reader]
+    return load_question_bank(csv_path).rows()
 
 
 async def run_eval(
@@ -25,7 +23,7 @@ async def run_eval(
     seed: int,
 ):
     set_determinism(seed)
-    questions = load_questions(csv_path)
+    questions = list(load_question_bank(csv_path).questions)
     if max_questions:
         questions = questions[:max_questions]
 
@@ -43,11 +41,10 @@ async def run_eval(
     agent = get_agent(parameters)
 
     results = []
-    for row in questions:
-        question = row.get("Question", "")
-        rubric = row.get("Rubric", "")
+    for compiled in questions:
+        question = compiled.question
         answer, metadata = await agent.run(question)
-        scoring = evaluate_answer(answer, rubric)
+        scoring = evaluate_answer(answer, compiled.rubric)
         results.append(
             {
                 "question": question,
@@ -0,0 +1,59 @@
+import csv
+import os
+import threading
+from dataclasses import dataclass
+
+from .rubric import CompiledRubric, compile_rubric
+
+
+@dataclass(frozen=True)
+class CompiledQuestion:
+    row: dict[str, str]
+    question: str
+    rubric: CompiledRubric
+
+
+@dataclass(frozen=True)
+class QuestionBank:
+    path: str
+    signature: tuple[int, int]
+    questions: tuple[CompiledQuestion, ...]
+
+    def rows(self) -> list[dict[str, str]]:
+        return [dict(question.row) for question in self.questions]
+
+
+_banks: dict[str, QuestionBank] = {}
+_banks_lock = threading.Lock()
+
+
+def _compile(path: str, signature: tuple[int, int]) -> QuestionBank:
+    with open(path, "r", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        questions = tuple(
+            CompiledQuestion(
+                row=row,
+                question=row.get("Question") or "",
+                rubric=compile_rubric(row.get("Rubric") or ""),
+            )
+            for row in reader
+        )
+    return QuestionBank(path=path, signature=signature, questions=questions)
+
+
+def load_question_bank(csv_path: str) -> QuestionBank:
+    """Return the compiled questions for ``csv_path``.
+
+    Rubrics are parsed and their criteria normalized once per file version;
+    the bank is cached in process and rebuilt when the file's mtime or size
+    changes. The returned bank is shared and must not be mutated.
+    """
+    path = os.path.abspath(csv_path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _banks_lock:
+        bank = _banks.get(path)
+        if bank is None or bank.signature != signature:
+            bank = _compile(path, signature)
+            _banks[path] = bank
+    return bank
@@ -1,7 +1,22 @@
 import ast
+from dataclasses import dataclass, field
 from typing import Any
 
 from ..tools.unit_normalizer import normalize_text
+from .matcher import MultiPatternMatcher
+
+
+@dataclass(frozen=True)
+class RubricItem:
+    operator: str
+    criteria: str
+    normalized_criteria: str
+
+
+@dataclass(frozen=True)
+class CompiledRubric:
+    items: tuple[RubricItem, ...]
+    matcher: MultiPatternMatcher = field(compare=False, repr=False)
 
 
 def _parse_rubric(rubric_str: str) -> list[dict[str, Any]]:
@@ -14,31 +29,46 @@ def _parse_rubric(rubric_str: str) -> list[dict[str, Any]]:
         return []
 
 
-def evaluate_answer(answer_text: str, rubric_str: str) -> dict[str, Any]:
-    rubric_items = _parse_rubric(rubric_str)
-    if not rubric_items:
+def compile_rubric(rubric_str: str) -> CompiledRubric:
+    items = []
+    for item in _parse_rubric(rubric_str):
+        criteria = item.get("criteria") or ""
+        items.append(
+            RubricItem(
+                operator=(item.get("operator") or "").lower(),
+                criteria=criteria,
+                normalized_criteria=normalize_text(criteria),
+            )
+        )
+    return CompiledRubric(
+        items=tuple(items),
+        matcher=MultiPatternMatcher(item.normalized_criteria for item in items),
+    )
+
+
+def evaluate_answer(answer_text: str, rubric: str | CompiledRubric) -> dict[str, Any]:
+    if not isinstance(rubric, CompiledRubric):
+        rubric = compile_rubric(rubric)
+    if not rubric.items:
         return {"passed": False, "score": 0.0, "details": []}
 
-    normalized_answer = normalize_text(answer_text)
+    # One pass over the answer finds every criterion it contains.
+    found = rubric.matcher.find(normalize_text(answer_text))
     details = []
     passes = []
 
-    for item in rubric_items:
-        operator = (item.get("operator") or "").lower()
-        criteria = item.get("criteria") or ""
-        normalized_criteria = normalize_text(criteria)
-
-        if operator == "correctness":
-            ok = normalized_criteria in normalized_answer
-        elif operator == "contradiction":
-            ok = normalized_criteria not in normalized_answer
+    for idx, item in enumerate(rubric.items):
+        if item.operator == "correctness":
+            ok = idx in found
+        elif item.operator == "contradiction":
+            ok = idx not in found
         else:
             ok = False
 
         details.append(
             {
-                "operator": operator,
-                "criteria": criteria,
+                "operator": item.operator,
+                "criteria": item.criteria,
                 "passed": ok,
             }
         )
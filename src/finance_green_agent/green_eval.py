@@ -1,22 +1,66 @@
 from __future__ import annotations
 
-import csv
+import asyncio
 import json
+import math
 import os
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 from uuid import uuid4
 
 import aiohttp
 from pydantic import BaseModel, Field, ValidationError
 
+from .agent_card_cache import AgentCardCache
 from .agent_core.determinism import set_determinism
+from .eval.question_bank import CompiledQuestion, load_question_bank
 from .eval.rubric import evaluate_answer
+from .hedging import PRIMARY, Hedger
+from .http_pool import DEFAULT_CONNECT_TIMEOUT_SECONDS, create_session, request_timeout
+from .metrics import DEFAULT_CPU_BUCKETS, REGISTRY
+from .resilience import CircuitBreaker, RetryPolicy, with_retries
+from .scheduler import FairScheduler
 from .tools.citation_validator import validate_citations
 
 
 DEFAULT_MAX_QUESTIONS = 50
+DEFAULT_MAX_CONCURRENCY = 1
+DEFAULT_MAX_IN_FLIGHT = 16
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.5
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5
+DEFAULT_CIRCUIT_BREAKER_RESET_SECONDS = 30.0
+DEFAULT_HEDGE_PERCENTILE = 90.0
+DEFAULT_HEDGE_MIN_SAMPLES = 5
+DEFAULT_MAX_HEDGES = 10
+DEFAULT_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+RESPONSE_CHUNK_BYTES = 64 * 1024
+
+ANSWER_LATENCY = REGISTRY.histogram(
+    "finance_green_participant_answer_seconds",
+    "Time for a participant to answer one question, including retries and hedges.",
+    labels=("role", "outcome"),
+)
+GRADING_SECONDS = REGISTRY.histogram(
+    "finance_green_grading_seconds",
+    "Time spent scoring one answer against its rubric.",
+    buckets=DEFAULT_CPU_BUCKETS,
+)
+CITATION_SECONDS = REGISTRY.histogram(
+    "finance_green_citation_validation_seconds",
+    "Time spent extracting and validating the citations of one answer.",
+    buckets=DEFAULT_CPU_BUCKETS,
+)
+QUESTIONS_QUEUED = REGISTRY.gauge(
+    "finance_green_questions_queued",
+    "Questions of running assessments waiting for a concurrency slot.",
+)
+QUESTIONS_IN_FLIGHT = REGISTRY.gauge(
+    "finance_green_questions_in_flight",
+    "Questions currently awaiting a participant's answer or being graded.",
+)
 
 
 class EvalRequest(BaseModel):
@@ -32,6 +76,44 @@ class EvalConfig:
     dataset_path: str
     timeout_seconds: float
     participant_role: str
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS
+    max_retries: int = DEFAULT_MAX_RETRIES
+    retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS
+    circuit_breaker_threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD
+    circuit_breaker_reset_seconds: float = DEFAULT_CIRCUIT_BREAKER_RESET_SECONDS
+    hedge: bool = False
+    hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE
+    hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES
+    max_hedges: int = DEFAULT_MAX_HEDGES
+    streaming: bool = True
+    max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES
+    debug: bool = False
+
+    @property
+    def request_timeout(self) -> aiohttp.ClientTimeout:
+        return request_timeout(self.timeout_seconds, self.connect_timeout_seconds)
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return RetryPolicy(
+            max_retries=self.max_retries, backoff_seconds=self.retry_backoff_seconds
+        )
+
+    def circuit_breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(
+            self.circuit_breaker_threshold, self.circuit_breaker_reset_seconds
+        )
+
+    def hedger(self) -> Hedger | None:
+        if not self.hedge:
+            return None
+        return Hedger(self.hedge_percentile, self.hedge_min_samples, self.max_hedges)
+
+
+class ResponseTooLargeError(Exception):
+    """A participant's response exceeded ``maxResponseBytes``."""
 
 
 @dataclass
@@ -40,6 +122,13 @@ class ParticipantAnswer:
     raw: dict[str, Any] | None
     context_id: str | None
     error: str | None = None
+    attempts: int = 1
+    latency_seconds: float | None = None
+    time_to_first_event: float | None = None
+    streamed: bool = False
+    truncated: bool = False
+    timed_out: bool = False
+    bytes_received: int = 0
 
 
 def _get_config_value(config: dict[str, Any], *keys: str, default: Any = None) -> Any:
@@ -70,9 +159,89 @@ def parse_eval_config(config: dict[str, Any]) -> EvalConfig:
     timeout_seconds = float(
         _get_config_value(config, "timeoutSeconds", "timeout_seconds", default=120)
     )
+    connect_timeout_seconds = float(
+        _get_config_value(
+            config,
+            "connectTimeoutSeconds",
+            "connect_timeout_seconds",
+            default=DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        )
+    )
+    max_retries = max(
+        0,
+        int(_get_config_value(config, "maxRetries", "max_retries", default=DEFAULT_MAX_RETRIES)),
+    )
+    retry_backoff_seconds = float(
+        _get_config_value(
+            config,
+            "retryBackoffSeconds",
+            "retry_backoff_seconds",
+            default=DEFAULT_RETRY_BACKOFF_SECONDS,
+        )
+    )
+    circuit_breaker_threshold = max(
+        0,
+        int(
+            _get_config_value(
+                config,
+                "circuitBreakerThreshold",
+                "circuit_breaker_threshold",
+                default=DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+            )
+        ),
+    )
+    circuit_breaker_reset_seconds = float(
+        _get_config_value(
+            config,
+            "circuitBreakerResetSeconds",
+            "circuit_breaker_reset_seconds",
+            default=DEFAULT_CIRCUIT_BREAKER_RESET_SECONDS,
+        )
+    )
+    hedge = bool(_get_config_value(config, "hedge", default=False))
+    hedge_percentile = float(
+        _get_config_value(
+            config, "hedgePercentile", "hedge_percentile", default=DEFAULT_HEDGE_PERCENTILE
+        )
+    )
+    hedge_min_samples = int(
+        _get_config_value(
+            config, "hedgeMinSamples", "hedge_min_samples", default=DEFAULT_HEDGE_MIN_SAMPLES
+        )
+    )
+    max_hedges = int(
+        _get_config_value(config, "maxHedges", "max_hedges", default=DEFAULT_MAX_HEDGES)
+    )
+    streaming = bool(_get_config_value(config, "streaming", default=True))
+    max_response_bytes = max(
+        1,
+        int(
+            _get_config_value(
+                config,
+                "maxResponseBytes",
+                "max_response_bytes",
+                default=DEFAULT_MAX_RESPONSE_BYTES,
+            )
+        ),
+    )
+    debug = bool(
+        _get_config_value(
+            config, "debug", default=os.environ.get("FINANCE_GREEN_VERBOSE", "0") == "1"
+        )
+    )
     participant_role = str(
         _get_config_value(config, "participantRole", "participant_role", default="participant")
     )
+    max_concurrency = int(
+        _get_config_value(
+            config, "maxConcurrency", "max_concurrency", default=DEFAULT_MAX_CONCURRENCY
+        )
+    )
+    max_concurrency = max(1, max_concurrency)
+    max_in_flight = int(
+        _get_config_value(config, "maxInFlight", "max_in_flight", default=DEFAULT_MAX_IN_FLIGHT)
+    )
+    max_in_flight = max(1, max_in_flight)
     dataset_path = _resolve_dataset_path(config)
     return EvalConfig(
         allow_network=allow_network,
@@ -81,13 +250,25 @@ def parse_eval_config(config: dict[str, Any]) -> EvalConfig:
         dataset_path=dataset_path,
         timeout_seconds=timeout_seconds,
         participant_role=participant_role,
+        max_concurrency=max_concurrency,
+        max_in_flight=max_in_flight,
+        connect_timeout_seconds=connect_timeout_seconds,
+        max_retries=max_retries,
+        retry_backoff_seconds=retry_backoff_seconds,
+        circuit_breaker_threshold=circuit_breaker_threshold,
+        circuit_breaker_reset_seconds=circuit_breaker_reset_seconds,
+        hedge=hedge,
+        hedge_percentile=hedge_percentile,
+        hedge_min_samples=hedge_min_samples,
+        max_hedges=max_hedges,
+        streaming=streaming,
+        max_response_bytes=max_response_bytes,
+        debug=debug,
     )
 
 
 def load_questions(csv_path: str) -> list[dict[str, Any]]:
-    with open(csv_path, "r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return [row for row in reader]
+    return load_question_bank(csv_path).rows()
 
 
 def merge_parts(parts: list[dict[str, Any]]) -> str:
@@ -130,28 +311,224 @@ def extract_text_from_task(task: dict[str, Any]) -> str:
 
 
 async def fetch_agent_card(
-    session: aiohttp.ClientSession, base_url: str, timeout: float
+    session: aiohttp.ClientSession,
+    base_url: str,
+    timeout: aiohttp.ClientTimeout,
+    cache: AgentCardCache | None = None,
 ) -> tuple[dict[str, Any], str]:
-    card_url = base_url.rstrip("/") + "/.well-known/agent-card.json"
-    async with session.get(card_url, timeout=timeout) as response:
-        response.raise_for_status()
-        card = await response.json()
+    if cache is not None:
+        card = await cache.get(session, base_url, timeout)
+    else:
+        card_url = base_url.rstrip("/") + "/.well-known/agent-card.json"
+        async with session.get(card_url, timeout=timeout) as response:
+            response.raise_for_status()
+            card = await response.json()
     agent_url = str(card.get("url") or base_url).rstrip("/")
     return card, agent_url
 
 
+class _StreamState:
+    """Answer assembled from the events of a ``message/stream`` response.
+
+    Events are folded into the task they describe: the latest status
+    message, and artifacts keyed by id (``append`` extends the parts of an
+    earlier chunk). A direct ``message`` event is the answer itself.
+    """
+
+    def __init__(self, keep_events: bool = False) -> None:
+        self.events: list[dict[str, Any]] | None = [] if keep_events else None
+        self.message: dict[str, Any] | None = None
+        self.status_message: dict[str, Any] | None = None
+        self.artifacts: dict[Any, dict[str, Any]] = {}
+        self.context_id: str | None = None
+        self.first_event_at: float | None = None
+        self.received = False
+        self.bytes_received = 0
+        self.truncated = False
+
+    def apply(self, event: dict[str, Any]) -> None:
+        if self.events is not None:
+            self.events.append(event)
+        self.received = True
+        self.context_id = event.get("contextId") or self.context_id
+        kind = event.get("kind")
+        if kind == "message":
+            self.message = _prune_message(event)
+        elif kind == "task":
+            status_message = (event.get("status") or {}).get("message")
+            if isinstance(status_message, dict):
+                self.status_message = _prune_message(status_message)
+            for artifact in event.get("artifacts") or []:
+                if isinstance(artifact, dict):
+                    self._store_artifact(artifact, append=False)
+        elif kind == "status-update":
+            status_message = (event.get("status") or {}).get("message")
+            if isinstance(status_message, dict):
+                self.status_message = _prune_message(status_message)
+        elif kind == "artifact-update" and isinstance(event.get("artifact"), dict):
+            self._store_artifact(event["artifact"], append=bool(event.get("append")))
+
+    def _store_artifact(self, artifact: dict[str, Any], append: bool) -> None:
+        key = artifact.get("artifactId", len(self.artifacts))
+        parts = [part for part in artifact.get("parts") or [] if isinstance(part, dict)]
+        existing = self.artifacts.get(key)
+        if append and existing is not None:
+            # Streamed text arrives as deltas: continue the last text part
+            # rather than starting a new line per chunk.
+            previous = existing["parts"][-1] if existing["parts"] else None
+            if (
+                parts
+                and isinstance(previous, dict)
+                and isinstance(previous.get("text"), str)
+                and isinstance(parts[0].get("text"), str)
+            ):
+                existing["parts"][-1] = {**previous, "text": previous["text"] + parts[0]["text"]}
+                parts = parts[1:]
+            existing["parts"].extend(parts)
+        else:
+            self.artifacts[key] = {"parts": parts}
+
+    def text(self) -> str:
+        if self.message is not None:
+            return extract_text_from_message(self.message)
+        return extract_text_from_task(
+            {
+                "status": {"message": self.status_message},
+                "artifacts": list(self.artifacts.values()),
+            }
+        )
+
+
+def _prune_message(message: dict[str, Any]) -> dict[str, Any]:
+    # Only the parts (or legacy content) and context are read downstream.
+    return {key: message[key] for key in ("parts", "content", "contextId") if key in message}
+
+
+async def _iter_sse_data(
+    response: aiohttp.ClientResponse, max_bytes: int, state: _StreamState
+) -> AsyncIterator[str]:
+    """Yield the ``data`` payload of each server-sent event.
+
+    Lines are split by hand rather than with ``readline``, which refuses
+    lines longer than aiohttp's buffer limit (a single large artifact event).
+    Bytes read are counted on ``state``; raises ``ResponseTooLargeError``
+    once the stream passes ``max_bytes``.
+    """
+    buffer = bytearray()
+    data_lines: list[str] = []
+    async for chunk in response.content.iter_any():
+        state.bytes_received += len(chunk)
+        if state.bytes_received > max_bytes:
+            raise ResponseTooLargeError(f"Response exceeded {max_bytes} bytes.")
+        scan_from = len(buffer)
+        buffer += chunk
+        pos = 0
+        newline = buffer.find(b"\n", scan_from)
+        while newline != -1:
+            line = bytes(buffer[pos:newline]).rstrip(b"\r")
+            pos = newline + 1
+            newline = buffer.find(b"\n", pos)
+            if not line:
+                if data_lines:
+                    yield "\n".join(data_lines)
+                    data_lines = []
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                data_lines.append((value[1:] if value.startswith(b" ") else value).decode("utf-8"))
+        del buffer[:pos]
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+async def _read_stream(
+    response: aiohttp.ClientResponse, sent_at: float, max_bytes: int, keep_events: bool
+) -> _StreamState:
+    state = _StreamState(keep_events)
+    try:
+        async for data in _iter_sse_data(response, max_bytes, state):
+            if state.first_event_at is None:
+                state.first_event_at = time.perf_counter() - sent_at
+            event = json.loads(data)
+            if isinstance(event, dict) and isinstance(event.get("result"), dict):
+                event = event["result"]
+            if isinstance(event, dict):
+                state.apply(event)
+    except asyncio.TimeoutError:
+        # Deadline hit mid-stream: grade what arrived instead of nothing.
+        if not state.received:
+            raise
+        state.truncated = True
+    return state
+
+
+async def _read_json(response: aiohttp.ClientResponse, max_bytes: int) -> tuple[Any, int]:
+    # The stdlib has no incremental JSON parser, so the body is read in
+    # chunks up to the cap and parsed once; an oversized answer is rejected
+    # without ever being buffered whole.
+    if response.content_length is not None and response.content_length > max_bytes:
+        raise ResponseTooLargeError(
+            f"Response of {response.content_length} bytes exceeds {max_bytes} bytes."
+        )
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_BYTES):
+        body += chunk
+        if len(body) > max_bytes:
+            raise ResponseTooLargeError(f"Response exceeded {max_bytes} bytes.")
+    return json.loads(body), len(body)
+
+
+def _answer_from_envelope(data: Any, context_id: str) -> tuple[str, str]:
+    payload_result = data.get("result") if isinstance(data, dict) else None
+    if isinstance(payload_result, dict):
+        envelope = payload_result
+    else:
+        envelope = data
+
+    answer_text = ""
+    response_context = None
+    if isinstance(envelope, dict):
+        if "message" in envelope and isinstance(envelope.get("message"), dict):
+            answer_text = extract_text_from_message(envelope.get("message", {}))
+            response_context = envelope["message"].get("contextId")
+        elif "task" in envelope and isinstance(envelope.get("task"), dict):
+            answer_text = extract_text_from_task(envelope.get("task", {}))
+            response_context = envelope["task"].get("contextId")
+        elif envelope.get("kind") == "message":
+            answer_text = merge_parts(envelope.get("parts") or envelope.get("content") or [])
+            response_context = envelope.get("contextId")
+        elif envelope.get("kind") == "task":
+            answer_text = extract_text_from_task(envelope)
+            response_context = envelope.get("contextId")
+    return answer_text, response_context or context_id
+
+
 async def send_message(
     session: aiohttp.ClientSession,
     agent_url: str,
     question: str,
     context_id: str,
     message_id: str,
-    timeout: float,
+    timeout: aiohttp.ClientTimeout,
+    retry: RetryPolicy | None = None,
+    stream: bool = False,
+    max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    keep_raw: bool = False,
 ) -> ParticipantAnswer:
+    """Ask one question over JSON-RPC ``message/send``, or ``message/stream``.
+
+    With ``stream`` the SSE events are merged into the answer as they
+    arrive; if the deadline passes mid-stream, the text received so far is
+    returned with ``truncated`` set. A participant that answers a stream
+    request with plain JSON is read as if it had been sent ``message/send``.
+
+    Responses larger than ``max_response_bytes`` are abandoned with an
+    error. Only the fields needed for the answer are kept; the payload (or
+    the stream's events) is returned in ``raw`` only with ``keep_raw``.
+    """
     payload: dict[str, Any] = {
         "jsonrpc": "2.0",
         "id": uuid4().hex,
-        "method": "message/send",
+        "method": "message/stream" if stream else "message/send",
         "params": {
             "message": {
                 "kind": "message",
@@ -163,47 +540,77 @@ async def send_message(
             "configuration": {"acceptedOutputModes": ["text"]},
         },
     }
-    try:
+    attempts = 0
+    bytes_received = 0
+    sent_at = time.perf_counter()
+
+    async def _attempt() -> Any:
+        nonlocal attempts, bytes_received, sent_at
+        attempts += 1
+        sent_at = time.perf_counter()
         async with session.post(
             agent_url.rstrip("/") + "/",
             json=payload,
             timeout=timeout,
         ) as response:
             response.raise_for_status()
-            data = await response.json()
-    except Exception as exc:  # noqa: BLE001 - capture transport errors
-        return ParticipantAnswer(text="", raw=None, context_id=context_id, error=str(exc))
+            if stream and response.content_type == "text/event-stream":
+                state = await _read_stream(response, sent_at, max_response_bytes, keep_raw)
+                bytes_received = state.bytes_received
+                return state
+            data, bytes_received = await _read_json(response, max_response_bytes)
+            return data
 
-    payload_result = data.get("result") if isinstance(data, dict) else None
-    if isinstance(payload_result, dict):
-        envelope = payload_result
-    else:
-        envelope = data
+    try:
+        data = await with_retries(_attempt, retry or RetryPolicy(max_retries=0))
+    except Exception as exc:  # noqa: BLE001 - capture transport errors
+        return ParticipantAnswer(
+            text="",
+            raw=None,
+            context_id=context_id,
+            error=str(exc) or type(exc).__name__,
+            attempts=attempts,
+            latency_seconds=time.perf_counter() - sent_at,
+            timed_out=isinstance(exc, asyncio.TimeoutError),
+        )
+    latency = time.perf_counter() - sent_at
 
-    answer_text = ""
-    response_context = None
-    if isinstance(envelope, dict):
-        if "message" in envelope and isinstance(envelope.get("message"), dict):
-            answer_text = extract_text_from_message(envelope.get("message", {}))
-            response_context = envelope["message"].get("contextId")
-        elif "task" in envelope and isinstance(envelope.get("task"), dict):
-            answer_text = extract_text_from_task(envelope.get("task", {}))
-            response_context = envelope["task"].get("contextId")
-        elif envelope.get("kind") == "message":
-            answer_text = merge_parts(envelope.get("parts") or envelope.get("content") or [])
-            response_context = envelope.get("contextId")
-        elif envelope.get("kind") == "task":
-            answer_text = extract_text_from_task(envelope)
-            response_context = envelope.get("contextId")
+    if isinstance(data, _StreamState):
+        return ParticipantAnswer(
+            text=data.text(),
+            raw={"events": data.events} if keep_raw else None,
+            context_id=data.context_id or context_id,
+            attempts=attempts,
+            latency_seconds=latency,
+            time_to_first_event=data.first_event_at,
+            streamed=True,
+            truncated=data.truncated,
+            timed_out=data.truncated,
+            bytes_received=bytes_received,
+        )
 
+    answer_text, response_context = _answer_from_envelope(data, context_id)
     return ParticipantAnswer(
         text=answer_text,
-        raw=data,
-        context_id=response_context or context_id,
+        raw=data if keep_raw else None,
+        context_id=response_context,
+        attempts=attempts,
+        latency_seconds=latency,
+        bytes_received=bytes_received,
     )
 
 
-def summarize_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+def _percentile(ordered: list[float], percent: float) -> float | None:
+    # Nearest-rank percentile of an already sorted list.
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_results(
+    results: list[dict[str, Any]], duration_seconds: float | None = None
+) -> dict[str, Any]:
     total = len(results)
     passed = sum(1 for item in results if item.get("score", {}).get("passed"))
     score_sum = sum(float(item.get("score", {}).get("score", 0.0)) for item in results)
@@ -211,80 +618,335 @@ def summarize_results(results: list[dict[str, Any]]) -> dict[str, Any]:
         1 for item in results if item.get("citations", {}).get("valid")
     )
     errors = sum(1 for item in results if item.get("error"))
-    return {
+    latencies = sorted(
+        float(item["latency_seconds"])
+        for item in results
+        if item.get("latency_seconds") is not None and not item.get("error")
+    )
+    summary = {
         "total": total,
         "passed": passed,
         "average_score": score_sum / total if total else 0.0,
         "citation_valid": citation_valid,
         "errors": errors,
+        "timeouts": sum(1 for item in results if item.get("timed_out")),
+        "bytes_received": sum(int(item.get("bytes_received") or 0) for item in results),
+        "latency_p50_seconds": _percentile(latencies, 50),
+        "latency_p90_seconds": _percentile(latencies, 90),
+        "latency_p99_seconds": _percentile(latencies, 99),
+        "latency_max_seconds": latencies[-1] if latencies else None,
     }
+    if duration_seconds is not None:
+        summary["duration_seconds"] = round(duration_seconds, 3)
+        summary["questions_per_minute"] = (
+            round(total * 60 / duration_seconds, 2) if duration_seconds > 0 else 0.0
+        )
+    return summary
 
 
-async def evaluate_participant(
+def _transport_fields(
+    answer: ParticipantAnswer | None,
+    hedge_winner: str | None = None,
+    latency_seconds: float | None = None,
+) -> dict[str, Any]:
+    # ``latency_seconds`` is the question's wall time from the first send to
+    # the final answer; ``attempt_latency_seconds`` covers only the attempt
+    # (the last retry, or the winning hedge copy) that produced it.
+    return {
+        "attempts": answer.attempts if answer is not None else 0,
+        "circuit_open": answer is None,
+        "hedged": hedge_winner is not None,
+        "hedge_winner": hedge_winner,
+        "streamed": answer.streamed if answer is not None else False,
+        "truncated": answer.truncated if answer is not None else False,
+        "latency_seconds": latency_seconds,
+        "attempt_latency_seconds": answer.latency_seconds if answer is not None else None,
+        "time_to_first_event": answer.time_to_first_event if answer is not None else None,
+        "timed_out": answer.timed_out if answer is not None else False,
+        "bytes_received": answer.bytes_received if answer is not None else 0,
+    }
+
+
+def _failed_row(question: str, error: str, transport: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "question": question,
+        "answer": "",
+        "score": {"passed": False, "score": 0.0, "details": []},
+        "citations": {"valid": False, "missing": [], "cited": []},
+        "error": error,
+        **transport,
+    }
+
+
+async def _evaluate_question(
+    session: aiohttp.ClientSession,
+    agent_url: str,
     role: str,
-    url: str,
-    questions: list[dict[str, Any]],
+    idx: int,
+    compiled: CompiledQuestion,
     config: EvalConfig,
+    breaker: CircuitBreaker | None = None,
+    hedger: Hedger | None = None,
+    streaming: bool = False,
 ) -> dict[str, Any]:
-    set_determinism(config.seed)
-    results: list[dict[str, Any]] = []
-    start = time.perf_counter()
+    question = compiled.question.strip()
+    if breaker is not None and not breaker.allow():
+        now = time.time()
+        return _failed_row(
+            question,
+            f"Circuit open after {breaker.failures} consecutive failures.",
+            {**_transport_fields(None), "sent_at": None, "received_at": None, "graded_at": now},
+        )
+
+    context_id = f"eval-{config.seed}-{role}-{idx}"
+    message_id = f"msg-{config.seed}-{role}-{idx}"
+
+    def _send(copy: str) -> Awaitable[ParticipantAnswer]:
+        return send_message(
+            session,
+            agent_url,
+            question,
+            context_id,
+            message_id if copy == PRIMARY else f"{message_id}-{copy}",
+            config.request_timeout,
+            retry=config.retry_policy,
+            stream=streaming,
+            max_response_bytes=config.max_response_bytes,
+            keep_raw=config.debug,
+        )
+
+    hedge_winner = None
+    sent_at = time.time()
+    started = time.perf_counter()
+    if hedger is None:
+        answer = await _send(PRIMARY)
+    else:
+        answer, hedge_winner = await hedger.run(_send, lambda item: not item.error)
+    latency = time.perf_counter() - started
+    ANSWER_LATENCY.observe(latency, role=role, outcome="error" if answer.error else "ok")
+    transport = _transport_fields(answer, hedge_winner, latency)
+    transport["sent_at"] = sent_at
+    transport["received_at"] = time.time()
+    if config.debug:
+        transport["raw"] = answer.raw
+    if answer.error:
+        if breaker is not None:
+            breaker.record_failure()
+        return _failed_row(question, answer.error, {**transport, "graded_at": time.time()})
+    if breaker is not None:
+        breaker.record_success()
+
+    with CITATION_SECONDS.time():
+        citations = validate_citations(answer.text)
+    with GRADING_SECONDS.time():
+        scoring = evaluate_answer(answer.text, compiled.rubric)
+    return {
+        "question": question,
+        "answer": answer.text,
+        "score": scoring,
+        "citations": citations,
+        "error": None,
+        **transport,
+        "graded_at": time.time(),
+    }
+
 
-    async with aiohttp.ClientSession() as session:
+@asynccontextmanager
+async def _question_slot(
+    semaphore: asyncio.Semaphore, scheduler: FairScheduler, role: str
+) -> AsyncIterator[None]:
+    # Hold the participant's and the assessment's concurrency slots; the wait
+    # for them is reported as queued, the rest as in flight.
+    with QUESTIONS_QUEUED.track():
+        await semaphore.acquire()
         try:
-            _, agent_url = await fetch_agent_card(
-                session, url, config.timeout_seconds
-            )
-        except Exception as exc:  # noqa: BLE001 - surface connection errors
-            summary = summarize_results([])
-            summary["duration_seconds"] = round(time.perf_counter() - start, 3)
-            summary["errors"] = 1
-            return {
+            await scheduler.acquire(role)
+        except BaseException:
+            semaphore.release()
+            raise
+    try:
+        with QUESTIONS_IN_FLIGHT.track():
+            yield
+    finally:
+        scheduler.release()
+        semaphore.release()
+
+
+@dataclass
+class QuestionProgress:
+    role: str
+    index: int
+    total: int
+    graded: int
+    running_score: float
+    result: dict[str, Any]
+
+
+class AssessmentProgress:
+    """Results recorded as soon as they are produced.
+
+    A cancelled or failed assessment loses whatever ``asyncio.gather`` was
+    still collecting; the progress object keeps every graded question so the
+    caller can still report partial results. Each graded question is also
+    published as a ``QuestionProgress`` to listeners and ``events()``
+    iterators.
+    """
+
+    def __init__(self) -> None:
+        self.config: EvalConfig | None = None
+        self.participants: dict[str, str] = {}
+        self.total_questions = 0
+        self._started = time.perf_counter()
+        self._graded: dict[str, dict[int, dict[str, Any]]] = {}
+        self._score_sums: dict[str, float] = {}
+        self._finished: dict[str, dict[str, Any]] = {}
+        self._listeners: list[Callable[[QuestionProgress], None]] = []
+        self._queues: list[asyncio.Queue[QuestionProgress | None]] = []
+        self.closed = False
+
+    def add_listener(self, listener: Callable[[QuestionProgress], None]) -> None:
+        self._listeners.append(listener)
+
+    async def events(self) -> AsyncIterator[QuestionProgress]:
+        """Yield every graded question until the assessment ends."""
+        queue: asyncio.Queue[QuestionProgress | None] = asyncio.Queue()
+        if self.closed:
+            return
+        self._queues.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            self._queues.remove(queue)
+
+    def close(self) -> None:
+        self.closed = True
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+    def start(
+        self, config: EvalConfig, participants: dict[str, str], total_questions: int
+    ) -> None:
+        self.config = config
+        self.participants = dict(participants)
+        self.total_questions = total_questions
+        self._started = time.perf_counter()
+
+    def record_question(self, role: str, idx: int, row: dict[str, Any]) -> None:
+        graded = self._graded.setdefault(role, {})
+        graded[idx] = row
+        score_sum = self._score_sums.get(role, 0.0) + float(
+            row.get("score", {}).get("score", 0.0)
+        )
+        self._score_sums[role] = score_sum
+        event = QuestionProgress(
+            role=role,
+            index=idx,
+            total=self.total_questions,
+            graded=len(graded),
+            running_score=score_sum / len(graded),
+            result=row,
+        )
+        for listener in self._listeners:
+            listener(event)
+        for queue in self._queues:
+            queue.put_nowait(event)
+
+    def record_participant(self, role: str, evaluation: dict[str, Any]) -> None:
+        self._finished[role] = evaluation
+
+    def graded_count(self) -> int:
+        return sum(len(rows) for rows in self._graded.values())
+
+    def partial_result(self) -> dict[str, Any]:
+        if self.config is None:
+            raise RuntimeError("Assessment has not started.")
+        participants = {}
+        for role, url in self.participants.items():
+            if role in self._finished:
+                participants[role] = self._finished[role]
+                continue
+            rows = [row for _, row in sorted(self._graded.get(role, {}).items())]
+            summary = summarize_results(rows, time.perf_counter() - self._started)
+            participants[role] = {
                 "role": role,
                 "url": url,
                 "summary": summary,
-                "results": [],
-                "error": str(exc),
+                "results": rows,
+                "partial": True,
             }
-        for idx, row in enumerate(questions):
-            question = (row.get("Question") or "").strip()
-            rubric = row.get("Rubric") or ""
-            context_id = f"eval-{config.seed}-{role}-{idx}"
-            message_id = f"msg-{config.seed}-{role}-{idx}"
-            answer = await send_message(
-                session,
-                agent_url,
-                question,
-                context_id,
-                message_id,
-                config.timeout_seconds,
-            )
-            if answer.error:
-                results.append(
-                    {
-                        "question": question,
-                        "answer": "",
-                        "score": {"passed": False, "score": 0.0, "details": []},
-                        "citations": {"valid": False, "missing": [], "cited": []},
-                        "error": answer.error,
-                    }
+        result = _assemble_result(participants, self.config)
+        result["partial"] = True
+        return result
+
+
+async def evaluate_participant(
+    role: str,
+    url: str,
+    questions: list[CompiledQuestion],
+    config: EvalConfig,
+    scheduler: FairScheduler | None = None,
+    progress: AssessmentProgress | None = None,
+    session: aiohttp.ClientSession | None = None,
+    card: tuple[dict[str, Any], str] | None = None,
+) -> dict[str, Any]:
+    """Ask ``questions`` to one participant and grade the answers.
+
+    Requests go through ``session`` when given (normally the server's shared
+    pool); otherwise a pooled session is opened for this call only. ``card``
+    is the participant's already fetched ``(agent card, agent url)``.
+    """
+    set_determinism(config.seed)
+    if scheduler is None:
+        scheduler = FairScheduler(config.max_concurrency)
+    start = time.perf_counter()
+
+    async with _session_scope(session) as session:
+        if card is None:
+            try:
+                card = await fetch_agent_card(session, url, config.request_timeout)
+            except Exception as exc:  # noqa: BLE001 - surface connection errors
+                return _unreachable_participant(role, url, exc, start)
+        card, agent_url = card
+
+        # Keep up to max_concurrency questions in flight (subject to the shared
+        # scheduler's global cap); gather preserves dataset order regardless of
+        # which answers arrive first.
+        semaphore = asyncio.Semaphore(config.max_concurrency)
+        breaker = config.circuit_breaker()
+        hedger = config.hedger()
+        capabilities = card.get("capabilities") if isinstance(card, dict) else None
+        streaming = config.streaming and bool(
+            isinstance(capabilities, dict) and capabilities.get("streaming")
+        )
+
+        async def _bounded(idx: int, compiled: CompiledQuestion) -> dict[str, Any]:
+            async with _question_slot(semaphore, scheduler, role):
+                row = await _evaluate_question(
+                    session,
+                    agent_url,
+                    role,
+                    idx,
+                    compiled,
+                    config,
+                    breaker=breaker,
+                    hedger=hedger,
+                    streaming=streaming,
                 )
-                continue
+            if progress is not None:
+                progress.record_question(role, idx, row)
+            return row
 
-            citations = validate_citations(answer.text)
-            scoring = evaluate_answer(answer.text, rubric)
-            results.append(
-                {
-                    "question": question,
-                    "answer": answer.text,
-                    "score": scoring,
-                    "citations": citations,
-                    "error": None,
-                }
+        results = list(
+            await asyncio.gather(
+                *(_bounded(idx, compiled) for idx, compiled in enumerate(questions))
             )
+        )
 
-    summary = summarize_results(results)
-    summary["duration_seconds"] = round(time.perf_counter() - start, 3)
+    summary = summarize_results(results, time.perf_counter() - start)
     return {
         "role": role,
         "url": url,
@@ -293,34 +955,39 @@ async def evaluate_participant(
     }
 
 
-async def run_assessment(request_json: str) -> tuple[dict[str, Any], EvalConfig]:
-    try:
-        request = EvalRequest.model_validate_json(request_json)
-    except ValidationError as exc:
-        raise ValueError(exc.json()) from exc
+def _unreachable_participant(
+    role: str, url: str, exc: BaseException, start: float
+) -> dict[str, Any]:
+    summary = summarize_results([], time.perf_counter() - start)
+    summary["errors"] = 1
+    return {
+        "role": role,
+        "url": url,
+        "summary": summary,
+        "results": [],
+        "error": str(exc) or type(exc).__name__,
+    }
 
-    config = parse_eval_config(request.config)
-    if config.participant_role not in request.participants:
-        raise ValueError(
-            f"Missing required participant role '{config.participant_role}'."
-        )
 
-    questions = load_questions(config.dataset_path)[: config.max_questions]
-    participants = {}
-    for role, url in request.participants.items():
-        participants[role] = await evaluate_participant(
-            role,
-            url,
-            questions,
-            config,
-        )
+@asynccontextmanager
+async def _session_scope(
+    session: aiohttp.ClientSession | None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    if session is not None:
+        yield session
+        return
+    async with create_session() as owned:
+        yield owned
+
 
+def _assemble_result(
+    participants: dict[str, dict[str, Any]], config: EvalConfig
+) -> dict[str, Any]:
     winner = max(
         participants.values(),
         key=lambda item: item.get("summary", {}).get("average_score", 0.0),
     )
-
-    result = {
+    return {
         "winner": winner.get("role"),
         "participants": participants,
         "dataset": os.path.basename(config.dataset_path),
@@ -328,4 +995,85 @@ async def run_assessment(request_json: str) -> tuple[dict[str, Any], EvalConfig]
         "seed": config.seed,
     }
 
-    return result, config
+
+async def run_assessment(
+    request_json: str,
+    progress: AssessmentProgress | None = None,
+    session: aiohttp.ClientSession | None = None,
+    card_cache: AgentCardCache | None = None,
+) -> tuple[dict[str, Any], EvalConfig]:
+    """Evaluate every participant and return the result with its config.
+
+    Cancelling the coroutine cancels in-flight participant calls. Pass
+    ``progress`` to follow graded questions as they complete
+    (``progress.events()``) and to keep them if the run fails or is
+    cancelled. Pass ``session`` to reuse a long-lived connection pool; it is
+    left open. Pass ``card_cache`` to reuse agent cards across assessments.
+    """
+    if progress is None:
+        progress = AssessmentProgress()
+    try:
+        return await _run_assessment(request_json, progress, session, card_cache)
+    finally:
+        progress.close()
+
+
+async def _run_assessment(
+    request_json: str,
+    progress: AssessmentProgress,
+    session: aiohttp.ClientSession | None,
+    card_cache: AgentCardCache | None,
+) -> tuple[dict[str, Any], EvalConfig]:
+    try:
+        request = EvalRequest.model_validate_json(request_json)
+    except ValidationError as exc:
+        raise ValueError(exc.json()) from exc
+
+    config = parse_eval_config(request.config)
+    if config.participant_role not in request.participants:
+        raise ValueError(
+            f"Missing required participant role '{config.participant_role}'."
+        )
+
+    questions = list(load_question_bank(config.dataset_path).questions[: config.max_questions])
+    progress.start(config, request.participants, len(questions))
+    scheduler = FairScheduler(config.max_in_flight)
+
+    async def _evaluate(
+        role: str, url: str, card: tuple[dict[str, Any], str] | BaseException
+    ) -> dict[str, Any]:
+        if isinstance(card, BaseException):
+            evaluation = _unreachable_participant(role, url, card, started)
+        else:
+            evaluation = await evaluate_participant(
+                role,
+                url,
+                questions,
+                config,
+                scheduler=scheduler,
+                progress=progress,
+                session=session,
+                card=card,
+            )
+        progress.record_participant(role, evaluation)
+        return evaluation
+
+    started = time.perf_counter()
+    async with _session_scope(session) as session:
+        # Pre-flight: fetch every card at once, so an unreachable participant
+        # is reported straight away instead of after the others' questions.
+        cards = await asyncio.gather(
+            *(
+                fetch_agent_card(session, url, config.request_timeout, card_cache)
+                for url in request.participants.values()
+            ),
+            return_exceptions=True,
+        )
+        evaluations = await asyncio.gather(
+            *(
+                _evaluate(role, url, card)
+                for (role, url), card in zip(request.participants.items(), cards)
+            )
+        )
+    participants = dict(zip(request.participants, evaluations))
+    return _assemble_result(participants, config), config
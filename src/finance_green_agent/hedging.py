@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from bisect import insort
+from typing import Awaitable, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+PRIMARY = "primary"
+HEDGE = "hedge"
+
+
+class Hedger:
+    """Sends a second copy of a straggling request for one participant.
+
+    Latencies of answered questions are tracked per participant. Once
+    ``min_samples`` have been seen, a question still unanswered after the
+    ``percentile`` latency so far is sent again, and whichever copy answers
+    first wins. At most ``max_hedges`` questions are hedged.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        min_samples: int,
+        max_hedges: int,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.percentile = min(max(percentile, 0.0), 100.0)
+        self.min_samples = max(1, min_samples)
+        self.remaining = max(0, max_hedges)
+        self._latencies: list[float] = []
+        self._clock = clock
+
+    def record(self, seconds: float) -> None:
+        insort(self._latencies, seconds)
+
+    def delay(self) -> float | None:
+        """Seconds to wait before hedging, or None when hedging is off."""
+        count = len(self._latencies)
+        if not self.remaining or count < self.min_samples:
+            return None
+        rank = max(1, math.ceil(self.percentile / 100 * count))
+        return self._latencies[rank - 1]
+
+    async def run(
+        self,
+        call: Callable[[str], Awaitable[T]],
+        succeeded: Callable[[T], bool],
+    ) -> tuple[T, str | None]:
+        """Await ``call(PRIMARY)``, racing ``call(HEDGE)`` if it straggles.
+
+        Returns the result and which copy produced it (None if no hedge was
+        sent). A failed copy only wins if the other one fails too.
+        """
+        started = self._clock()
+        delay = self.delay()
+        primary = asyncio.ensure_future(call(PRIMARY))
+        copies = {primary: PRIMARY}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self.remaining:
+                    self.remaining -= 1
+                    copies[asyncio.ensure_future(call(HEDGE))] = HEDGE
+            pending = set(copies)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if succeeded(task.result())), None)
+                if winner is None and not pending:
+                    winner = next(iter(done))
+                if winner is not None:
+                    break
+            result = winner.result()
+            if succeeded(result):
+                self.record(self._clock() - started)
+            return result, copies[winner] if len(copies) > 1 else None
+        finally:
+            for task in copies:
+                task.cancel()
+            # Let the losing copy unwind, releasing its slot and connection,
+            # and retrieve its exception, before the result is returned.
+            await asyncio.gather(*copies, return_exceptions=True)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import aiohttp
+
+
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    return int(raw) if raw else default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    return float(raw) if raw else default
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connector settings for participant traffic (``FINANCE_GREEN_HTTP_*``).
+
+    ``limit`` caps open connections across all hosts and ``limit_per_host``
+    per participant host; 0 disables a cap. Idle connections are kept alive
+    for ``keepalive_seconds`` and resolved addresses cached for
+    ``dns_ttl_seconds``.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 32
+    keepalive_seconds: float = 30.0
+    dns_ttl_seconds: int = 300
+
+    @classmethod
+    def from_env(cls) -> PoolSettings:
+        return cls(
+            limit=_env_int("FINANCE_GREEN_HTTP_LIMIT", cls.limit),
+            limit_per_host=_env_int("FINANCE_GREEN_HTTP_LIMIT_PER_HOST", cls.limit_per_host),
+            keepalive_seconds=_env_float(
+                "FINANCE_GREEN_HTTP_KEEPALIVE_SECONDS", cls.keepalive_seconds
+            ),
+            dns_ttl_seconds=_env_int("FINANCE_GREEN_HTTP_DNS_TTL_SECONDS", cls.dns_ttl_seconds),
+        )
+
+
+def create_session(settings: PoolSettings | None = None) -> aiohttp.ClientSession:
+    """Open a pooled session; requests pass their own ``request_timeout``.
+
+    Must be called from a running event loop. The caller owns the session and
+    closes it when done.
+    """
+    if settings is None:
+        settings = PoolSettings.from_env()
+    connector = aiohttp.TCPConnector(
+        limit=settings.limit,
+        limit_per_host=settings.limit_per_host,
+        keepalive_timeout=settings.keepalive_seconds,
+        use_dns_cache=settings.dns_ttl_seconds > 0,
+        ttl_dns_cache=settings.dns_ttl_seconds or None,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def request_timeout(
+    read_seconds: float, connect_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS
+) -> aiohttp.ClientTimeout:
+    """Deadline for one participant call.
+
+    ``connect_seconds`` bounds getting a connection (pool wait included) and
+    ``read_seconds`` bounds waiting for the answer, so a dead host fails fast
+    instead of holding the question for the whole answer budget. The total is
+    capped at the sum so a response that trickles in still ends.
+    """
+    return aiohttp.ClientTimeout(
+        total=connect_seconds + read_seconds,
+        connect=connect_seconds,
+        sock_read=read_seconds,
+    )
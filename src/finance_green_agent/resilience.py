@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+import aiohttp
+import backoff
+
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether a failed participant call is worth repeating.
+
+    Rate limiting, server errors and dropped or refused connections are.
+    Timeouts are not: the participant already used its whole budget, and
+    retrying would multiply the time a stuck participant costs.
+    """
+    if isinstance(exc, asyncio.TimeoutError):
+        return False
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in RETRYABLE_STATUSES
+    return isinstance(exc, aiohttp.ClientConnectionError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 2
+    backoff_seconds: float = 0.5
+    max_backoff_seconds: float = 10.0
+
+
+async def with_retries(call: Callable[[], Awaitable[T]], policy: RetryPolicy) -> T:
+    """Await ``call()``, repeating it on transient errors.
+
+    Waits grow exponentially from ``backoff_seconds`` with full jitter, so
+    concurrent questions that failed together do not retry in lockstep.
+    """
+    if policy.max_retries <= 0:
+        return await call()
+    retrying = backoff.on_exception(
+        backoff.expo,
+        aiohttp.ClientError,
+        max_tries=policy.max_retries + 1,
+        giveup=lambda exc: not is_transient(exc),
+        jitter=backoff.full_jitter,
+        logger=None,
+        factor=policy.backoff_seconds,
+        max_value=policy.max_backoff_seconds,
+    )(call)
+    return await retrying()
+
+
+class CircuitBreaker:
+    """Fails calls fast once a participant looks dead.
+
+    After ``threshold`` consecutive failures the circuit opens and ``allow``
+    refuses calls. Once ``reset_seconds`` have passed a single probe call is
+    let through: success closes the circuit, failure re-opens it. A
+    ``threshold`` of 0 disables the breaker.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = max(0, threshold)
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.trips = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._clock = clock
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._probing or self._clock() - self._opened_at < self.reset_seconds:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if not self.threshold:
+            return
+        if self._probing or (self._opened_at is None and self.failures >= self.threshold):
+            self._opened_at = self._clock()
+            self._probing = False
+            self.trips += 1
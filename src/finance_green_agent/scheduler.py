@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class FairScheduler:
+    """Global in-flight cap shared by every participant of an assessment.
+
+    Slots are requested under a key (the participant role). While the cap is
+    reached, waiters queue per key and freed slots are handed out round-robin
+    across keys, so a participant with a deep backlog or slow answers cannot
+    starve the others.
+    """
+
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._in_flight = 0
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {}
+        self._ready: deque[str] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, key: str) -> None:
+        if self._in_flight < self.max_in_flight and not self._ready:
+            self._in_flight += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters.get(key)
+        if queue is None:
+            queue = self._waiters[key] = deque()
+            self._ready.append(key)
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted right before cancellation; hand it back.
+                self.release()
+            else:
+                self._discard(key, future)
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _discard(self, key: str, future: asyncio.Future[None]) -> None:
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[key]
+            self._ready.remove(key)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._ready and self._in_flight < self.max_in_flight:
+            key = self._ready.popleft()
+            queue = self._waiters[key]
+            future = queue.popleft()
+            if queue:
+                self._ready.append(key)
+            else:
+                del self._waiters[key]
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
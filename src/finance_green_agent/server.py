@@ -1,11 +1,15 @@
 import argparse
+import asyncio
 import json
 import os
-from typing import Any, AsyncGenerator
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator
 from uuid import uuid4
 
+import aiohttp
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import ValidationError
 
 from .a2a_schemas import (
@@ -21,20 +25,104 @@ from .a2a_schemas import (
     SendMessageRequest,
     SendMessageResponse,
     StreamResponse,
-    TaskArtifactUpdateEvent,
+    Task,
     TaskState,
-    TaskStatusUpdateEvent,
     new_artifact,
     new_data_part,
     new_message,
     new_text_part,
 )
-from .green_eval import run_assessment
-from .task_store import InMemoryTaskStore
+from .agent_card_cache import DEFAULT_CARD_TTL_SECONDS, AgentCardCache
+from .green_eval import AssessmentProgress, QuestionProgress, run_assessment
+from .http_pool import create_session
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY
+from .task_store import TERMINAL_STATES, create_task_store
+
+
+task_store = create_task_store()
+# Assessments in progress, keyed by task id. Holding the references keeps the
+# asyncio tasks alive until they finish and lets cancel_task stop them.
+running_assessments: dict[str, asyncio.Task] = {}
+# Connection pool for participant traffic, shared by every assessment for the
+# lifetime of the app. None outside the lifespan (e.g. bare ASGI transports),
+# in which case each assessment opens its own.
+participant_session: aiohttp.ClientSession | None = None
+# Participant agent cards, reused across assessments for the app's lifetime.
+agent_card_cache: AgentCardCache | None = None
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "finance_green_http_requests_total",
+    "HTTP requests handled, by route template and status code.",
+    labels=("method", "route", "status"),
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "finance_green_http_request_duration_seconds",
+    "Time until the response headers are sent (streams keep running after).",
+    labels=("method", "route"),
+)
+ASSESSMENTS_FINISHED = REGISTRY.counter(
+    "finance_green_assessments_total",
+    "Assessments that have ended, by outcome.",
+    labels=("outcome",),
+)
+REGISTRY.gauge(
+    "finance_green_assessments_running",
+    "Assessments currently running, blocking or in the background.",
+    function=lambda: len(running_assessments),
+)
+REGISTRY.gauge(
+    "finance_green_task_store_tasks",
+    "Tasks held by the task store.",
+    function=lambda: task_store.task_count(),
+)
+REGISTRY.gauge(
+    "finance_green_sse_subscribers",
+    "Open task event subscriptions (streams and :subscribe).",
+    function=lambda: task_store.subscriber_count(),
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    global participant_session, agent_card_cache
+    participant_session = create_session()
+    agent_card_cache = AgentCardCache(
+        ttl_seconds=float(
+            os.environ.get("FINANCE_GREEN_AGENT_CARD_TTL_SECONDS", DEFAULT_CARD_TTL_SECONDS)
+        )
+    )
+    try:
+        yield
+    finally:
+        for background in list(running_assessments.values()):
+            background.cancel()
+        if running_assessments:
+            await asyncio.wait(set(running_assessments.values()))
+        session, participant_session = participant_session, None
+        agent_card_cache = None
+        await session.close()
+
+
+app = FastAPI(title="finance-green-agent", lifespan=lifespan)
 
 
-app = FastAPI(title="finance-green-agent")
-task_store = InMemoryTaskStore()
+@app.middleware("http")
+async def record_http_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # The route template, not the raw path, keeps task ids out of the
+        # label values.
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or "unmatched"
+        HTTP_REQUESTS.inc(method=request.method, route=path, status=str(status))
+        HTTP_LATENCY.observe(
+            time.perf_counter() - started, method=request.method, route=path
+        )
 
 
 def _agent_url() -> str:
@@ -94,8 +182,14 @@ def _extract_message_text(message) -> str:
 
 
 def _summary_text(result: dict[str, Any]) -> str:
+    if result.get("cancelled"):
+        headline = "Evaluation cancelled; partial results."
+    elif result.get("partial"):
+        headline = "Evaluation failed; partial results."
+    else:
+        headline = "Evaluation complete."
     lines = [
-        "Evaluation complete.",
+        headline,
         f"Winner: {result.get('winner')}",
         f"Questions: {result.get('max_questions')}",
     ]
@@ -228,9 +322,113 @@ def _extract_jsonrpc_message_text(message: dict[str, Any]) -> str:
     return "\n".join(part for part in parts if part).strip()
 
 
-async def _handle_jsonrpc_send(
-    params: dict[str, Any], request_id: Any
-) -> Any:
+def _set_task_status(task: Task, state: TaskState, text: str) -> None:
+    message = new_message(
+        role=Role.agent,
+        parts=[new_text_part(text)],
+        context_id=task.context_id,
+        task_id=task.id,
+    )
+    task_store.update_status(task.id, state, message)
+
+
+def _progress_artifact_id(task: Task) -> str:
+    return f"progress-{task.id}"
+
+
+def _store_result(task: Task, result: dict[str, Any], metadata: dict[str, Any]) -> str:
+    # The final result holds every graded row, so the live progress artifact
+    # is dropped once it is stored.
+    task_store.remove_artifact(task.id, _progress_artifact_id(task))
+    summary_text = _summary_text(result)
+    artifact = new_artifact(
+        name="EvaluationResult",
+        parts=[new_text_part(summary_text), new_data_part(result)],
+        metadata=metadata,
+    )
+    task_store.add_artifact(task.id, artifact)
+    return summary_text
+
+
+def _store_partial_result(task: Task, progress: AssessmentProgress, **flags: bool) -> None:
+    result = progress.partial_result()
+    result.update(flags)
+    _store_result(task, result, {"config": progress.config.__dict__, "partial": True})
+
+
+def _record_cancellation(task: Task, progress: AssessmentProgress) -> None:
+    if progress.config is None:
+        _set_task_status(task, TaskState.cancelled, "Task cancelled by client.")
+        return
+    _store_partial_result(task, progress, cancelled=True)
+    _set_task_status(
+        task,
+        TaskState.cancelled,
+        f"Task cancelled by client after {progress.graded_count()} graded answers.",
+    )
+
+
+def _progress_publisher(task: Task):
+    # Every graded question is appended to one EvaluationProgress artifact, so
+    # stream subscribers see live scores while the assessment runs.
+    artifact_id = _progress_artifact_id(task)
+
+    def _publish(event: QuestionProgress) -> None:
+        chunk = Artifact(
+            artifact_id=artifact_id,
+            name="EvaluationProgress",
+            parts=[new_data_part(event.__dict__)],
+        )
+        task_store.add_artifact(task.id, chunk, append=True, last_chunk=False)
+
+    return _publish
+
+
+async def _execute_assessment(task: Task, request_text: str) -> None:
+    progress = AssessmentProgress()
+    progress.add_listener(_progress_publisher(task))
+    try:
+        result, config = await run_assessment(
+            request_text,
+            progress=progress,
+            session=participant_session,
+            card_cache=agent_card_cache,
+        )
+    except asyncio.CancelledError:
+        ASSESSMENTS_FINISHED.inc(outcome="cancelled")
+        _record_cancellation(task, progress)
+        raise
+    except ValueError as exc:
+        ASSESSMENTS_FINISHED.inc(outcome="rejected")
+        _set_task_status(task, TaskState.rejected, str(exc))
+        return
+    except Exception as exc:  # noqa: BLE001 - return failure to client
+        ASSESSMENTS_FINISHED.inc(outcome="failed")
+        if progress.config is not None:
+            _store_partial_result(task, progress)
+        _set_task_status(task, TaskState.failed, f"Evaluation failed: {exc}")
+        return
+
+    ASSESSMENTS_FINISHED.inc(outcome="completed")
+    summary_text = _store_result(task, result, {"config": config.__dict__})
+    _set_task_status(task, TaskState.completed, summary_text)
+
+
+def _start_background_assessment(task: Task, request_text: str) -> asyncio.Task:
+    background = asyncio.create_task(_execute_assessment(task, request_text))
+    running_assessments[task.id] = background
+    background.add_done_callback(lambda _: running_assessments.pop(task.id, None))
+    return background
+
+
+async def _run_assessment_to_completion(task: Task, request_text: str) -> None:
+    # Blocking requests still run the assessment as a tracked task so that
+    # cancel_task can stop it; a client disconnect leaves it running.
+    background = _start_background_assessment(task, request_text)
+    await asyncio.wait({background})
+
+
+def _create_jsonrpc_task(params: dict[str, Any], request_id: Any) -> tuple[Task, str]:
     message_payload = params.get("message", {}) if isinstance(params, dict) else {}
     context_id = message_payload.get("contextId") or f"context-{request_id or uuid4().hex}"
     request_text = _extract_jsonrpc_message_text(message_payload)
@@ -242,62 +440,55 @@ async def _handle_jsonrpc_send(
         task_id=message_payload.get("taskId"),
     )
     task = task_store.create_task(context_id=context_id, history=[incoming])
-    working_message = new_message(
-        role=Role.agent,
-        parts=[new_text_part("Starting assessment.")],
-        context_id=task.context_id,
-        task_id=task.id,
-    )
-    task_store.update_status(task.id, TaskState.working, working_message)
+    _set_task_status(task, TaskState.working, "Starting assessment.")
+    return task, request_text
 
+
+async def _handle_jsonrpc_send(
+    params: dict[str, Any], request_id: Any
+) -> Any:
+    task, request_text = _create_jsonrpc_task(params, request_id)
     if not request_text:
-        error_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part("Missing EvalRequest payload.")],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.rejected, error_message)
+        _set_task_status(task, TaskState.rejected, "Missing EvalRequest payload.")
         return task
 
-    try:
-        result, config = await run_assessment(request_text)
-    except ValueError as exc:
-        error_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part(str(exc))],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.rejected, error_message)
-        return task
-    except Exception as exc:  # noqa: BLE001 - return failure to client
-        error_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part(f"Evaluation failed: {exc}")],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.failed, error_message)
+    configuration = params.get("configuration") if isinstance(params, dict) else None
+    if isinstance(configuration, dict) and configuration.get("blocking") is False:
+        _start_background_assessment(task, request_text)
         return task
 
-    summary_text = _summary_text(result)
-    artifact = new_artifact(
-        name="EvaluationResult",
-        parts=[new_text_part(summary_text), new_data_part(result)],
-        metadata={"config": config.__dict__},
-    )
-    task_store.add_artifact(task.id, artifact)
-    summary_message = new_message(
-        role=Role.agent,
-        parts=[new_text_part(summary_text)],
-        context_id=task.context_id,
-        task_id=task.id,
-    )
-    task_store.update_status(task.id, TaskState.completed, summary_message)
+    await _run_assessment_to_completion(task, request_text)
     return task
 
 
+def _stream_event_to_jsonrpc(event: StreamResponse) -> dict[str, Any]:
+    if event.task is not None:
+        return _task_to_jsonrpc(event.task)
+    if event.status_update is not None:
+        update = event.status_update
+        status_payload = {"state": _state_to_jsonrpc(update.status.state)}
+        if update.status.message:
+            status_payload["message"] = _message_to_jsonrpc(update.status.message)
+        return {
+            "kind": "status-update",
+            "taskId": update.task_id,
+            "contextId": update.context_id,
+            "status": status_payload,
+            "final": bool(update.final),
+        }
+    if event.artifact_update is not None:
+        update = event.artifact_update
+        return {
+            "kind": "artifact-update",
+            "taskId": update.task_id,
+            "contextId": update.context_id,
+            "artifact": _artifact_to_jsonrpc(update.artifact),
+            "append": bool(update.append),
+            "lastChunk": bool(update.last_chunk),
+        }
+    return _message_to_jsonrpc(event.message)
+
+
 def _encode_sse(event: StreamResponse) -> str:
     payload = event.model_dump(by_alias=True, exclude_none=True)
     return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
@@ -318,6 +509,11 @@ async def manifest_alias() -> JSONResponse:
     return _json_response(_build_agent_card())
 
 
+@app.get("/metrics")
+async def metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.post("/", response_model=None)
 async def jsonrpc_endpoint(request: Request):
     payload = await request.json()
@@ -340,10 +536,20 @@ async def jsonrpc_endpoint(request: Request):
         )
 
     if method == "message/stream":
+        task, request_text = _create_jsonrpc_task(params, request_id)
+        subscription = task_store.subscribe(task.id)
+        if not request_text:
+            _set_task_status(task, TaskState.rejected, "Missing EvalRequest payload.")
+        else:
+            _start_background_assessment(task, request_text)
+
         async def event_generator() -> AsyncGenerator[str, None]:
-            task = await _handle_jsonrpc_send(params, request_id)
-            response = _jsonrpc_response(_task_to_jsonrpc(task), request_id)
-            yield f"data: {json.dumps(response, ensure_ascii=False)}\n\n"
+            try:
+                async for event in subscription:
+                    response = _jsonrpc_response(_stream_event_to_jsonrpc(event), request_id)
+                    yield f"data: {json.dumps(response, ensure_ascii=False)}\n\n"
+            finally:
+                task_store.unsubscribe(subscription)
 
         return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -368,61 +574,20 @@ async def message_send(payload: dict[str, Any]) -> JSONResponse:
         incoming.context_id = f"context-{incoming.message_id}"
 
     task = task_store.create_task(context_id=incoming.context_id, history=[incoming])
-    working_message = new_message(
-        role=Role.agent,
-        parts=[new_text_part("Starting assessment.")],
-        context_id=task.context_id,
-        task_id=task.id,
-    )
-    task_store.update_status(task.id, TaskState.working, working_message)
+    _set_task_status(task, TaskState.working, "Starting assessment.")
 
     request_text = _extract_message_text(incoming)
     if not request_text:
-        error_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part("Missing EvalRequest payload.")],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.rejected, error_message)
+        _set_task_status(task, TaskState.rejected, "Missing EvalRequest payload.")
         return _json_response(SendMessageResponse(task=task))
 
-    try:
-        result, config = await run_assessment(request_text)
-    except ValueError as exc:
-        error_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part(str(exc))],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.rejected, error_message)
+    if request.configuration is not None and request.configuration.blocking is False:
+        # Return the working task right away; clients poll /v1/tasks/{id}
+        # or subscribe for the outcome.
+        _start_background_assessment(task, request_text)
         return _json_response(SendMessageResponse(task=task))
-    except Exception as exc:  # noqa: BLE001 - return failure to client
-        error_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part(f"Evaluation failed: {exc}")],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.failed, error_message)
-        return _json_response(SendMessageResponse(task=task))
-
-    summary_text = _summary_text(result)
-    summary_message = new_message(
-        role=Role.agent,
-        parts=[new_text_part(summary_text)],
-        context_id=task.context_id,
-        task_id=task.id,
-    )
-    artifact = new_artifact(
-        name="EvaluationResult",
-        parts=[new_text_part(summary_text), new_data_part(result)],
-        metadata={"config": config.__dict__},
-    )
-    task_store.add_artifact(task.id, artifact)
-    task_store.update_status(task.id, TaskState.completed, summary_message)
 
+    await _run_assessment_to_completion(task, request_text)
     return _json_response(SendMessageResponse(task=task))
 
 
@@ -439,123 +604,22 @@ async def message_stream(request: Request) -> StreamingResponse:
         incoming.context_id = f"context-{incoming.message_id}"
 
     task = task_store.create_task(context_id=incoming.context_id, history=[incoming])
+    subscription = task_store.subscribe(task.id)
+    _set_task_status(task, TaskState.working, "Starting assessment.")
+    request_text = _extract_message_text(incoming)
+    if not request_text:
+        _set_task_status(task, TaskState.rejected, "Missing EvalRequest payload.")
+    else:
+        # The assessment outlives a disconnected stream; the task can still be
+        # polled or resubscribed to.
+        _start_background_assessment(task, request_text)
 
     async def event_generator() -> AsyncGenerator[str, None]:
-        yield _encode_sse(StreamResponse(task=task))
-
-        working_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part("Starting assessment.")],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.working, working_message)
-        status_update = TaskStatusUpdateEvent(
-            task_id=task.id,
-            context_id=task.context_id,
-            status=task.status,
-            final=False,
-        )
-        yield _encode_sse(StreamResponse(status_update=status_update))
-
-        request_text = _extract_message_text(incoming)
-        if not request_text:
-            error_message = new_message(
-                role=Role.agent,
-                parts=[new_text_part("Missing EvalRequest payload.")],
-                context_id=task.context_id,
-                task_id=task.id,
-            )
-            task_store.update_status(task.id, TaskState.rejected, error_message)
-            yield _encode_sse(
-                StreamResponse(
-                    status_update=TaskStatusUpdateEvent(
-                        task_id=task.id,
-                        context_id=task.context_id,
-                        status=task.status,
-                        final=True,
-                    )
-                )
-            )
-            return
-
         try:
-            result, config = await run_assessment(request_text)
-        except ValueError as exc:
-            error_message = new_message(
-                role=Role.agent,
-                parts=[new_text_part(str(exc))],
-                context_id=task.context_id,
-                task_id=task.id,
-            )
-            task_store.update_status(task.id, TaskState.rejected, error_message)
-            yield _encode_sse(
-                StreamResponse(
-                    status_update=TaskStatusUpdateEvent(
-                        task_id=task.id,
-                        context_id=task.context_id,
-                        status=task.status,
-                        final=True,
-                    )
-                )
-            )
-            return
-        except Exception as exc:  # noqa: BLE001 - return failure to client
-            error_message = new_message(
-                role=Role.agent,
-                parts=[new_text_part(f"Evaluation failed: {exc}")],
-                context_id=task.context_id,
-                task_id=task.id,
-            )
-            task_store.update_status(task.id, TaskState.failed, error_message)
-            yield _encode_sse(
-                StreamResponse(
-                    status_update=TaskStatusUpdateEvent(
-                        task_id=task.id,
-                        context_id=task.context_id,
-                        status=task.status,
-                        final=True,
-                    )
-                )
-            )
-            return
-
-        summary_text = _summary_text(result)
-        artifact = new_artifact(
-            name="EvaluationResult",
-            parts=[new_text_part(summary_text), new_data_part(result)],
-            metadata={"config": config.__dict__},
-        )
-        task_store.add_artifact(task.id, artifact)
-        yield _encode_sse(
-            StreamResponse(
-                artifact_update=TaskArtifactUpdateEvent(
-                    task_id=task.id,
-                    context_id=task.context_id,
-                    artifact=artifact,
-                    append=False,
-                    last_chunk=True,
-                )
-            )
-        )
-
-        summary_message = new_message(
-            role=Role.agent,
-            parts=[new_text_part(summary_text)],
-            context_id=task.context_id,
-            task_id=task.id,
-        )
-        task_store.update_status(task.id, TaskState.completed, summary_message)
-        yield _encode_sse(
-            StreamResponse(
-                status_update=TaskStatusUpdateEvent(
-                    task_id=task.id,
-                    context_id=task.context_id,
-                    status=task.status,
-                    final=True,
-                )
-            )
-        )
+            async for event in subscription:
+                yield _encode_sse(event)
+        finally:
+            task_store.unsubscribe(subscription)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -565,6 +629,24 @@ async def message_alias(payload: dict[str, Any]) -> JSONResponse:
     return await message_send(payload)
 
 
+# Registered before /v1/tasks/{task_id}, whose path parameter would otherwise
+# swallow the ":subscribe" suffix.
+@app.get("/v1/tasks/{task_id}:subscribe")
+async def subscribe_task(task_id: str) -> StreamingResponse:
+    subscription = task_store.subscribe(task_id)
+    if subscription is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        try:
+            async for event in subscription:
+                yield _encode_sse(event)
+        finally:
+            task_store.unsubscribe(subscription)
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
 @app.get("/v1/tasks/{task_id}")
 async def get_task(task_id: str, historyLength: int | None = None) -> JSONResponse:
     task = task_store.get_task(task_id)
@@ -585,6 +667,15 @@ async def cancel_task(task_id: str) -> JSONResponse:
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    background = running_assessments.get(task_id)
+    if background is not None:
+        # Cancelling stops in-flight participant calls; _execute_assessment
+        # stores the answers graded so far and marks the task cancelled.
+        background.cancel()
+        await asyncio.wait({background})
+        if task.status.state in TERMINAL_STATES:
+            return _json_response(task)
+
     cancel_message = new_message(
         role=Role.agent,
         parts=[new_text_part("Task cancelled by client.")],
@@ -595,18 +686,6 @@ async def cancel_task(task_id: str) -> JSONResponse:
     return _json_response(task)
 
 
-@app.get("/v1/tasks/{task_id}:subscribe")
-async def subscribe_task(task_id: str) -> StreamingResponse:
-    task = task_store.get_task(task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    async def event_generator() -> AsyncGenerator[str, None]:
-        yield _encode_sse(StreamResponse(task=task))
-
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
-
-
 @app.post("/v1/tasks/{task_id}/pushNotificationConfigs")
 async def create_push_config(task_id: str) -> JSONResponse:
     raise HTTPException(
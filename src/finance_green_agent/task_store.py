@@ -1,14 +1,105 @@
 from __future__ import annotations
 
-from typing import Dict
+import asyncio
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict
 from uuid import uuid4
 
-from .a2a_schemas import Artifact, Message, Task, TaskState, TaskStatus
+from .a2a_schemas import (
+    Artifact,
+    Message,
+    Role,
+    StreamResponse,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    new_message,
+    new_text_part,
+)
+
+TERMINAL_STATES = frozenset(
+    {TaskState.completed, TaskState.failed, TaskState.cancelled, TaskState.rejected}
+)
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+DEFAULT_MAX_FINISHED_TASKS = 1000
+DEFAULT_TASK_TTL_SECONDS = 3600.0
+DEFAULT_TASK_DB_PATH = "tasks.sqlite3"
+DEFAULT_WRITE_BATCH_SIZE = 64
+DEFAULT_WRITE_INTERVAL_SECONDS = 1.0
+ORPHANED_TASK_MESSAGE = "The agent restarted before this task finished."
+
+
+class TaskSubscription:
+    """Live event feed for one subscriber of a task.
+
+    Events are buffered in a bounded queue. A subscriber that falls more than
+    ``max_queue`` events behind is dropped (``overflowed`` is set and its
+    stream ends) instead of letting the buffer grow; it can resubscribe to
+    get a fresh snapshot.
+    """
+
+    def __init__(self, task_id: str, max_queue: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE):
+        self.task_id = task_id
+        self.max_queue = max(1, max_queue)
+        self.overflowed = False
+        self.closed = False
+        self._queue: asyncio.Queue[StreamResponse | None] = asyncio.Queue()
+
+    def publish(self, event: StreamResponse, final: bool = False) -> None:
+        if self.closed:
+            return
+        if self._queue.qsize() >= self.max_queue:
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self.close()
+            return
+        self._queue.put_nowait(event)
+        if final:
+            self.close()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(None)
+
+    async def __aiter__(self) -> AsyncIterator[StreamResponse]:
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                return
+            yield event
 
 
 class InMemoryTaskStore:
-    def __init__(self):
+    """Task store that keeps every task in process memory.
+
+    Running tasks are never evicted. Finished tasks are kept in LRU order and
+    dropped once more than ``max_finished_tasks`` of them are retained, or
+    once one has not been read for ``ttl_seconds``. ``None`` disables either
+    bound.
+    """
+
+    def __init__(
+        self,
+        subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        max_finished_tasks: int | None = DEFAULT_MAX_FINISHED_TASKS,
+        ttl_seconds: float | None = DEFAULT_TASK_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self._tasks: Dict[str, Task] = {}
+        self._subscribers: Dict[str, list[TaskSubscription]] = {}
+        # Finished task id -> last access time, least recently used first.
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        self.subscriber_queue_size = subscriber_queue_size
+        self.max_finished_tasks = max_finished_tasks
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
 
     def create_task(
         self,
@@ -23,24 +114,467 @@ class InMemoryTaskStore:
             history=history or [],
         )
         self._tasks[task_id] = task
+        self._saved(task)
+        self._evict()
         return task
 
     def get_task(self, task_id: str) -> Task | None:
-        return self._tasks.get(task_id)
+        task = self._tasks.get(task_id)
+        if task is not None and task_id in self._finished:
+            if self._expired(self._finished[task_id]):
+                self._drop(task_id)
+                return None
+            self._touch(task_id)
+        return task
+
+    def task_count(self) -> int:
+        return len(self._tasks)
 
     def update_status(
         self, task_id: str, state: TaskState, message: Message | None = None
     ) -> Task:
-        task = self._tasks[task_id]
+        task = self._require(task_id)
         task.status = TaskStatus(state=state, message=message)
+        final = state in TERMINAL_STATES
+        self._saved(task)
+        self._publish(
+            task_id,
+            StreamResponse(
+                status_update=TaskStatusUpdateEvent(
+                    task_id=task.id,
+                    context_id=task.context_id,
+                    status=task.status,
+                    final=final,
+                )
+            ),
+            final=final,
+        )
+        if final:
+            self._evict()
         return task
 
-    def add_artifact(self, task_id: str, artifact: Artifact) -> Task:
-        task = self._tasks[task_id]
-        task.artifacts.append(artifact)
+    def add_artifact(
+        self,
+        task_id: str,
+        artifact: Artifact,
+        append: bool = False,
+        last_chunk: bool = True,
+    ) -> Task:
+        """Store an artifact, or with ``append`` extend the one sharing its id.
+
+        Subscribers receive ``artifact`` itself as the update, i.e. only the
+        new parts when appending.
+        """
+        task = self._require(task_id)
+        existing = None
+        if append:
+            existing = next(
+                (item for item in task.artifacts if item.artifact_id == artifact.artifact_id),
+                None,
+            )
+        if existing is not None:
+            existing.parts.extend(artifact.parts)
+            self._artifact_appended(task, artifact)
+        else:
+            stored = artifact.model_copy(update={"parts": list(artifact.parts)})
+            task.artifacts.append(stored)
+            self._artifact_saved(task, stored)
+        self._publish(
+            task_id,
+            StreamResponse(
+                artifact_update=TaskArtifactUpdateEvent(
+                    task_id=task.id,
+                    context_id=task.context_id,
+                    artifact=artifact,
+                    append=append,
+                    last_chunk=last_chunk,
+                )
+            ),
+        )
+        return task
+
+    def remove_artifact(self, task_id: str, artifact_id: str) -> Task:
+        task = self._require(task_id)
+        task.artifacts = [item for item in task.artifacts if item.artifact_id != artifact_id]
+        self._artifact_removed(task, artifact_id)
         return task
 
     def add_history(self, task_id: str, message: Message) -> Task:
-        task = self._tasks[task_id]
+        task = self._require(task_id)
         task.history.append(message)
+        self._saved(task)
         return task
+
+    def subscribe(self, task_id: str) -> TaskSubscription | None:
+        """Subscribe to a task: a snapshot first, then every live update.
+
+        The feed ends after the task's final status update. Subscribing to a
+        task that already finished yields only the snapshot.
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        subscription = TaskSubscription(task_id, self.subscriber_queue_size)
+        finished = task.status.state in TERMINAL_STATES
+        subscription.publish(StreamResponse(task=task.model_copy(deep=True)), final=finished)
+        if not finished:
+            self._subscribers.setdefault(task_id, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TaskSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.task_id)
+        if subscribers and subscription in subscribers:
+            subscribers.remove(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.task_id]
+        subscription.close()
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _publish(self, task_id: str, event: StreamResponse, final: bool = False) -> None:
+        subscribers = self._subscribers.get(task_id)
+        if not subscribers:
+            return
+        for subscription in list(subscribers):
+            subscription.publish(event, final=final)
+            if subscription.closed:
+                subscribers.remove(subscription)
+        if not subscribers:
+            del self._subscribers[task_id]
+
+    # Persistence hooks. Mutations go through these so that subclasses can
+    # write tasks elsewhere while sharing the event fan-out above.
+
+    def _require(self, task_id: str) -> Task:
+        return self._tasks[task_id]
+
+    def _saved(self, task: Task) -> None:
+        if task.status.state in TERMINAL_STATES:
+            self._touch(task.id)
+        else:
+            self._finished.pop(task.id, None)
+
+    def _artifact_saved(self, task: Task, artifact: Artifact) -> None:
+        pass
+
+    def _artifact_appended(self, task: Task, chunk: Artifact) -> None:
+        pass
+
+    def _artifact_removed(self, task: Task, artifact_id: str) -> None:
+        pass
+
+    def _touch(self, task_id: str) -> None:
+        self._finished[task_id] = self._clock()
+        self._finished.move_to_end(task_id)
+
+    def _expired(self, accessed_at: float) -> bool:
+        return self.ttl_seconds is not None and self._clock() - accessed_at > self.ttl_seconds
+
+    def _drop(self, task_id: str) -> None:
+        self._tasks.pop(task_id, None)
+        self._finished.pop(task_id, None)
+
+    def _evict(self) -> None:
+        # Access times only grow along the LRU order, so both bounds can stop
+        # at the first finished task that is recent enough to keep.
+        while self._finished:
+            task_id, accessed_at = next(iter(self._finished.items()))
+            over_limit = (
+                self.max_finished_tasks is not None
+                and len(self._finished) > self.max_finished_tasks
+            )
+            if not over_limit and not self._expired(accessed_at):
+                break
+            self._drop(task_id)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    finished INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_finished_accessed ON tasks (finished, accessed_at);
+CREATE TABLE IF NOT EXISTS artifacts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL REFERENCES tasks (id) ON DELETE CASCADE,
+    artifact_id TEXT NOT NULL,
+    body TEXT NOT NULL,
+    UNIQUE (task_id, artifact_id)
+);
+CREATE TABLE IF NOT EXISTS artifact_chunks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL REFERENCES tasks (id) ON DELETE CASCADE,
+    artifact_id TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifact_chunks_task ON artifact_chunks (task_id, artifact_id);
+"""
+
+
+class SqliteTaskStore(InMemoryTaskStore):
+    """Task store persisted to a SQLite database.
+
+    Running tasks stay in memory so that live updates are cheap. Status
+    changes are written through; artifact writes are queued and committed
+    in one transaction once ``write_batch_size`` are pending, after
+    ``write_interval`` seconds, or with the next status change. Appended
+    chunks (progress rows) are inserted on their own instead of rewriting
+    the artifact. Once a task finishes it is written out and dropped from
+    memory; its artifacts live in their own tables and are only read back
+    when the task is requested. A small LRU of recently read finished tasks
+    absorbs polling. Eviction bounds apply to the database, using
+    wall-clock access times so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_TASK_DB_PATH,
+        subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        max_finished_tasks: int | None = DEFAULT_MAX_FINISHED_TASKS,
+        ttl_seconds: float | None = DEFAULT_TASK_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+        cache_size: int = 32,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        write_interval: float = DEFAULT_WRITE_INTERVAL_SECONDS,
+    ):
+        super().__init__(
+            subscriber_queue_size=subscriber_queue_size,
+            max_finished_tasks=max_finished_tasks,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+        )
+        self.path = path
+        self.cache_size = max(0, cache_size)
+        self._loaded: OrderedDict[str, Task] = OrderedDict()
+        self.write_batch_size = max(1, write_batch_size)
+        self.write_interval = write_interval
+        # Queued (statement, parameters), and when the oldest was queued.
+        self._pending: list[tuple[str, tuple]] = []
+        self._pending_since = 0.0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(_SCHEMA)
+        self._fail_orphans()
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+    def _fail_orphans(self) -> None:
+        # Tasks that were running when a previous process died will never
+        # finish. Mark them failed so readers and subscribers see a final
+        # state, and let them age out like other finished tasks.
+        orphans = self._db.execute("SELECT body FROM tasks WHERE finished = 0").fetchall()
+        for (body,) in orphans:
+            task = Task.model_validate_json(body)
+            task.status = TaskStatus(
+                state=TaskState.failed,
+                message=new_message(
+                    role=Role.agent,
+                    parts=[new_text_part(ORPHANED_TASK_MESSAGE)],
+                    context_id=task.context_id,
+                    task_id=task.id,
+                ),
+            )
+            self._queue(
+                "UPDATE tasks SET state = ?, finished = 1, body = ? WHERE id = ?",
+                (
+                    task.status.state.value,
+                    task.model_dump_json(by_alias=True, exclude={"artifacts"}),
+                    task.id,
+                ),
+            )
+        self.flush()
+
+    def flush(self) -> None:
+        """Commit every queued write in one transaction."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._db.execute("BEGIN")
+        try:
+            for statement, parameters in pending:
+                self._db.execute(statement, parameters)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _queue(self, statement: str, parameters: tuple) -> None:
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append((statement, parameters))
+        if (
+            len(self._pending) >= self.write_batch_size
+            or time.monotonic() - self._pending_since >= self.write_interval
+        ):
+            self.flush()
+
+    def get_task(self, task_id: str) -> Task | None:
+        task = self._tasks.get(task_id)
+        if task is not None:
+            return task
+        row = self._db.execute(
+            "SELECT accessed_at FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            self._loaded.pop(task_id, None)
+            return None
+        if self._expired(row[0]):
+            self._drop(task_id)
+            return None
+        self._db.execute(
+            "UPDATE tasks SET accessed_at = ? WHERE id = ?", (self._clock(), task_id)
+        )
+        task = self._loaded.get(task_id)
+        if task is None:
+            task = self._load(task_id)
+        self._cache(task)
+        return task
+
+    def task_count(self) -> int:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        return count
+
+    def _load(self, task_id: str) -> Task | None:
+        row = self._db.execute("SELECT body FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = Task.model_validate_json(row[0])
+        artifacts = {
+            artifact_id: Artifact.model_validate_json(body)
+            for artifact_id, body in self._db.execute(
+                "SELECT artifact_id, body FROM artifacts WHERE task_id = ? ORDER BY seq",
+                (task_id,),
+            )
+        }
+        for artifact_id, body in self._db.execute(
+            "SELECT artifact_id, body FROM artifact_chunks WHERE task_id = ? ORDER BY seq",
+            (task_id,),
+        ):
+            if artifact_id in artifacts:
+                artifacts[artifact_id].parts.extend(Artifact.model_validate_json(body).parts)
+        task.artifacts = list(artifacts.values())
+        return task
+
+    def _cache(self, task: Task) -> None:
+        if not self.cache_size:
+            return
+        self._loaded[task.id] = task
+        self._loaded.move_to_end(task.id)
+        while len(self._loaded) > self.cache_size:
+            self._loaded.popitem(last=False)
+
+    def _require(self, task_id: str) -> Task:
+        task = self._tasks.get(task_id) or self.get_task(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        return task
+
+    def _saved(self, task: Task) -> None:
+        finished = task.status.state in TERMINAL_STATES
+        self._queue(
+            "INSERT INTO tasks (id, state, finished, accessed_at, body) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET state = excluded.state, "
+            "finished = excluded.finished, accessed_at = excluded.accessed_at, "
+            "body = excluded.body",
+            (
+                task.id,
+                task.status.state.value,
+                int(finished),
+                self._clock(),
+                task.model_dump_json(by_alias=True, exclude={"artifacts"}),
+            ),
+        )
+        self.flush()
+        if finished:
+            if self._tasks.pop(task.id, None) is not None:
+                self._cache(task)
+        else:
+            self._tasks[task.id] = task
+            self._loaded.pop(task.id, None)
+
+    def _artifact_saved(self, task: Task, artifact: Artifact) -> None:
+        self._delete_chunks(task, artifact.artifact_id)
+        self._queue(
+            "INSERT INTO artifacts (task_id, artifact_id, body) VALUES (?, ?, ?) "
+            "ON CONFLICT (task_id, artifact_id) DO UPDATE SET body = excluded.body",
+            (task.id, artifact.artifact_id, artifact.model_dump_json(by_alias=True)),
+        )
+
+    def _artifact_appended(self, task: Task, chunk: Artifact) -> None:
+        self._queue(
+            "INSERT INTO artifact_chunks (task_id, artifact_id, body) VALUES (?, ?, ?)",
+            (task.id, chunk.artifact_id, chunk.model_dump_json(by_alias=True)),
+        )
+
+    def _artifact_removed(self, task: Task, artifact_id: str) -> None:
+        self._delete_chunks(task, artifact_id)
+        self._queue(
+            "DELETE FROM artifacts WHERE task_id = ? AND artifact_id = ?",
+            (task.id, artifact_id),
+        )
+
+    def _delete_chunks(self, task: Task, artifact_id: str) -> None:
+        self._queue(
+            "DELETE FROM artifact_chunks WHERE task_id = ? AND artifact_id = ?",
+            (task.id, artifact_id),
+        )
+
+    def _drop(self, task_id: str) -> None:
+        self._loaded.pop(task_id, None)
+        self._db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def _evict(self) -> None:
+        changes = self._db.total_changes
+        if self.ttl_seconds is not None:
+            self._db.execute(
+                "DELETE FROM tasks WHERE finished = 1 AND accessed_at < ?",
+                (self._clock() - self.ttl_seconds,),
+            )
+        if self.max_finished_tasks is not None:
+            self._db.execute(
+                "DELETE FROM tasks WHERE finished = 1 AND id NOT IN ("
+                "SELECT id FROM tasks WHERE finished = 1 "
+                "ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_finished_tasks,),
+            )
+        if self._db.total_changes == changes:
+            return
+        for task_id in list(self._loaded):
+            if not self._db.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone():
+                del self._loaded[task_id]
+
+
+def _env_number(name: str, default: float | None, cast: Callable[[str], float]) -> float | None:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    value = cast(raw)
+    return None if value <= 0 else value
+
+
+def create_task_store() -> InMemoryTaskStore:
+    """Build the task store selected by the ``FINANCE_GREEN_TASK_*`` env vars."""
+    backend = os.environ.get("FINANCE_GREEN_TASK_STORE", "memory").strip().lower()
+    options = {
+        "max_finished_tasks": _env_number(
+            "FINANCE_GREEN_TASK_MAX_FINISHED", DEFAULT_MAX_FINISHED_TASKS, int
+        ),
+        "ttl_seconds": _env_number(
+            "FINANCE_GREEN_TASK_TTL_SECONDS", DEFAULT_TASK_TTL_SECONDS, float
+        ),
+    }
+    if backend == "memory":
+        return InMemoryTaskStore(**options)
+    if backend == "sqlite":
+        path = os.environ.get("FINANCE_GREEN_TASK_DB", DEFAULT_TASK_DB_PATH)
+        return SqliteTaskStore(path, **options)
+    raise ValueError(f"Unknown FINANCE_GREEN_TASK_STORE backend: {backend!r}")
@@ -0,0 +1,215 @@
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .cache_manifest import CacheManifest, _default_cache_dir, default_build_dir, file_digest
+from .html_text import iter_file_text
+from .text_cache import (
+    DOCUMENTS_FILE,
+    EXTRACTOR_VERSION,
+    ExtractedTextCache,
+    file_signature,
+    load_documents,
+)
+
+
+# Short lines such as "PART II" or "Item 7A. Quantitative and Qualitative ...".
+_SECTION_PATTERN = re.compile(
+    r"^[ \t]*((?:part[ \t]+[ivx]+|item[ \t]+\d+[a-z]?)\b[^\n]{0,150})$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Longer lines cannot be headings (short of absurd runs of blanks), so
+# scan_text does not buffer them.
+_MAX_HEADING_LINE = 1024
+
+
+def find_sections(text: str) -> list[list]:
+    """``[heading, character offset]`` of each 10-K style part and item heading."""
+    return [[match.group(1).strip(), match.start(1)] for match in _SECTION_PATTERN.finditer(text)]
+
+
+def scan_text(chunks: Iterable[str]) -> tuple[int, list[list]]:
+    """Length and ``find_sections`` of text arriving in chunks, without joining it."""
+    length = 0
+    sections: list[list] = []
+    line: list[str] | None = []
+    line_size = 0
+    line_start = 0
+    for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find("\n", start)
+            piece = chunk[start:] if end < 0 else chunk[start:end]
+            if line is not None:
+                line_size += len(piece)
+                if line_size > _MAX_HEADING_LINE:
+                    line = None
+                else:
+                    line.append(piece)
+            if end < 0:
+                break
+            if line is not None:
+                sections += _line_sections(line, line_start)
+            line, line_size = [], 0
+            line_start = length + end + 1
+            start = end + 1
+        length += len(chunk)
+    if line is not None:
+        sections += _line_sections(line, line_start)
+    return length, sections
+
+
+def _line_sections(line: list[str], line_start: int) -> list[list]:
+    return [[heading, line_start + offset] for heading, offset in find_sections("".join(line))]
+
+
+def _extract_document(path: str, text_dir: str, force: bool = False) -> dict:
+    # Runs in a worker process. The text is streamed into the sidecar store
+    # and scanned back from it, so neither it nor the file is held whole.
+    # ``force`` re-extracts even when text for this content is stored.
+    signature = file_signature(path)
+    digest = file_digest(path)
+    store = ExtractedTextCache(text_dir, max_bytes=0)
+    if force or not store.has_sidecar(digest):
+        store.put_stream(digest, iter_file_text(path))
+        if file_signature(path) != signature:
+            store.discard(digest)
+            raise RuntimeError("file changed while being extracted")
+    length, sections = scan_text(store.iter_sidecar(digest))
+    return {"digest": digest, "length": length, "sections": sections}
+
+
+@dataclass
+class BuildReport:
+    build_dir: str
+    documents: int = 0
+    extracted: int = 0
+    reused: int = 0
+    missing: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    pruned: int = 0
+    manifest_compiled: bool = False
+    seconds: float = 0.0
+
+
+def build_cache(
+    cache_dir: str | None = None,
+    build_dir: str | None = None,
+    jobs: int | None = None,
+    force: bool = False,
+) -> BuildReport:
+    """Precompile ``cache_dir`` into ``build_dir`` for tools to load directly.
+
+    ``build_dir`` defaults to where tools look: ``FINANCE_GREEN_CACHE_BUILD_DIR``
+    or ``<cache_dir>/.build``. Writes the extracted text of every manifest
+    document (``text/``), the compiled manifest and search index
+    (``manifest.bin``) and per-document metadata (``documents.json``: source
+    path, mtime, size, content hash, text length and section offsets). Documents whose file is unchanged
+    since the last build are not read again, and ones whose content hash
+    is already stored are not parsed again; ``force`` redoes everything.
+    Extraction runs on a pool of ``jobs`` processes (default: all cores).
+    """
+    started = time.perf_counter()
+    cache_dir = cache_dir or _default_cache_dir()
+    build_dir = build_dir or default_build_dir(cache_dir)
+    text_dir = os.path.join(build_dir, "text")
+    report = BuildReport(build_dir=build_dir)
+    os.makedirs(build_dir, exist_ok=True)
+
+    manifest = CacheManifest(cache_dir, build_dir)
+    if force or not manifest.compiled:
+        if os.path.exists(manifest.manifest_path):
+            manifest.write_compiled()
+            report.manifest_compiled = True
+
+    previous = {} if force else load_documents(build_dir)
+    previous_by_path = {record["path"]: record for record in previous.values()}
+    store = ExtractedTextCache(text_dir, max_bytes=0)
+
+    documents: dict[str, dict] = {}
+    pending: dict[str, dict] = {}
+    for entry in manifest.entries:
+        if entry.source_id in documents or not entry.local_path:
+            continue
+        path = os.path.abspath(entry.local_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            report.missing.append(entry.source_id)
+            continue
+        record = {"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        documents[entry.source_id] = record
+        old = previous_by_path.get(path)
+        if (
+            old is not None
+            and old["mtime_ns"] == stat.st_mtime_ns
+            and old["size"] == stat.st_size
+            and store.has_sidecar(old["digest"])
+        ):
+            record.update(digest=old["digest"], length=old["length"], sections=old["sections"])
+            report.reused += 1
+        else:
+            pending.setdefault(path, record)
+
+    results = _extract_all(list(pending), text_dir, jobs, force)
+    for source_id, record in list(documents.items()):
+        if "digest" in record:
+            continue
+        outcome = results.get(record["path"])
+        if isinstance(outcome, dict):
+            record.update(outcome)
+            report.extracted += 1
+        else:
+            report.failed[source_id] = outcome or "not extracted"
+            del documents[source_id]
+    report.documents = len(documents)
+
+    _write_json(
+        os.path.join(build_dir, DOCUMENTS_FILE),
+        {"extractor_version": EXTRACTOR_VERSION, "documents": documents},
+    )
+    referenced = {f"{record['digest']}.txt" for record in documents.values()}
+    for path in store.sidecar_paths():
+        if os.path.basename(path) not in referenced:
+            os.unlink(path)
+            report.pruned += 1
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _extract_all(
+    paths: list[str], text_dir: str, jobs: int | None, force: bool = False
+) -> dict[str, dict | str]:
+    """Extraction record per path, or the error message if it failed."""
+    results: dict[str, dict | str] = {}
+    if not paths:
+        return results
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) == 1:
+        for path in paths:
+            try:
+                results[path] = _extract_document(path, text_dir, force)
+            except Exception as exc:  # noqa: BLE001 - reported per document
+                results[path] = f"{type(exc).__name__}: {exc}"
+        return results
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        futures = {
+            pool.submit(_extract_document, path, text_dir, force): path for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as exc:  # noqa: BLE001 - reported per document
+                results[futures[future]] = f"{type(exc).__name__}: {exc}"
+    return results
+
+
+def _write_json(path: str, payload: dict) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
@@ -1,9 +1,18 @@
+import hashlib
 import json
+import marshal
 import os
-from dataclasses import dataclass
+import sys
+import threading
+from dataclasses import astuple, dataclass
 from typing import Any
 
 
+# Layout of the compiled manifest written by ``cache build``; bump on change.
+COMPILED_FORMAT = 2
+COMPILED_MANIFEST = "manifest.bin"
+
+
 @dataclass
 class CacheEntry:
     source_id: str
@@ -15,17 +24,99 @@ class CacheEntry:
     metadata: dict[str, Any]
 
 
+def _default_cache_dir() -> str:
+    return os.environ.get("FINANCE_GREEN_CACHE_DIR", "cache")
+
+
+def default_build_dir(cache_dir: str) -> str:
+    """Where ``cache build`` output for ``cache_dir`` lives."""
+    return os.environ.get("FINANCE_GREEN_CACHE_BUILD_DIR") or os.path.join(cache_dir, ".build")
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 class CacheManifest:
-    def __init__(self, cache_dir: str | None = None):
-        self.cache_dir = cache_dir or os.environ.get("FINANCE_GREEN_CACHE_DIR", "cache")
+    def __init__(self, cache_dir: str | None = None, build_dir: str | None = None):
+        self.cache_dir = cache_dir or _default_cache_dir()
         self.manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        self.build_dir = build_dir or default_build_dir(self.cache_dir)
         self.entries: list[CacheEntry] = []
+        self.source_ids: frozenset[str] = frozenset()
+        self.by_source_id: dict[str, CacheEntry] = {}
+        # The search index is only needed by search_web/search_sec, so it is
+        # built (or unmarshalled from the compiled build) on first search.
+        self._index: _ManifestIndex | None = None
+        self._index_state: bytes | None = None
+        self._index_lock = threading.Lock()
+        self._signature: tuple[int, int] | None = None
+        # Whether the last load came from the compiled build output.
+        self.compiled = False
+        self._load()
+
+    def _stat_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.manifest_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self) -> bool:
+        """Reload the manifest when the file's mtime or size changed."""
+        if self._stat_signature() == self._signature:
+            return False
         self._load()
+        return True
+
+    def has_source(self, source_id: str) -> bool:
+        return source_id in self.source_ids
+
+    def get_entry(self, source_id: str) -> CacheEntry | None:
+        return self.by_source_id.get(source_id)
 
     def _load(self) -> None:
-        if not os.path.exists(self.manifest_path):
-            self.entries = []
-            return
+        signature = self._stat_signature()
+        if signature is None:
+            entries: list[CacheEntry] = []
+            index_state = None
+            compiled = False
+        else:
+            loaded = self._load_compiled(signature)
+            compiled = loaded is not None
+            entries, index_state = loaded if compiled else (self._parse_json(), None)
+        by_source_id: dict[str, CacheEntry] = {}
+        for entry in entries:
+            # First entry wins, as with the linear scan this replaces.
+            by_source_id.setdefault(entry.source_id, entry)
+        with self._index_lock:
+            self.entries = entries
+            self.source_ids = frozenset(by_source_id)
+            self.by_source_id = by_source_id
+            self._index = None
+            self._index_state = index_state
+            self._signature = signature
+            self.compiled = compiled
+
+    def _search_index(self) -> "_ManifestIndex":
+        index = self._index
+        if index is not None:
+            return index
+        with self._index_lock:
+            if self._index is None:
+                if self._index_state is not None:
+                    state = marshal.loads(self._index_state)
+                    self._index = _ManifestIndex.from_state(self.entries, state)
+                else:
+                    self._index = _ManifestIndex(self.entries)
+                self._index_state = None
+            return self._index
+
+    def _parse_json(self) -> list[CacheEntry]:
         with open(self.manifest_path, "r", encoding="utf-8") as f:
             raw = json.load(f)
 
@@ -42,25 +133,62 @@ class CacheManifest:
                     metadata=item.get("metadata") or {},
                 )
             )
-        self.entries = entries
+        return entries
+
+    def _compiled_path(self) -> str:
+        return os.path.join(self.build_dir, COMPILED_MANIFEST)
+
+    def _load_compiled(
+        self, signature: tuple[int, int]
+    ) -> tuple[list[CacheEntry], bytes] | None:
+        """Entries and marshalled index from ``cache build`` output, if it matches the JSON.
+
+        The build is trusted when manifest.json has the recorded mtime and
+        size, or failing that (e.g. after a copy) the recorded SHA-256.
+        Anything missing, stale or unreadable falls back to parsing the JSON.
+        """
+        try:
+            with open(self._compiled_path(), "rb") as f:
+                payload = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != COMPILED_FORMAT
+            or payload.get("python") != tuple(sys.version_info[:2])
+        ):
+            return None
+        if payload.get("signature") != signature:
+            try:
+                if payload.get("digest") != file_digest(self.manifest_path):
+                    return None
+            except OSError:
+                return None
+        entries = [CacheEntry(*fields) for fields in payload["entries"]]
+        return entries, payload["index"]
+
+    def write_compiled(self) -> str:
+        """Write the loaded entries and index where ``_load_compiled`` finds them."""
+        path = self._compiled_path()
+        payload = {
+            "format": COMPILED_FORMAT,
+            "python": tuple(sys.version_info[:2]),
+            "signature": self._signature,
+            "digest": file_digest(self.manifest_path),
+            "entries": [astuple(entry) for entry in self.entries],
+            "index": marshal.dumps(self._search_index().state()),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump(payload, f)
+        os.replace(tmp_path, path)
+        return path
 
     def search_web(self, query: str, top_n: int = 10) -> list[CacheEntry]:
-        query_lower = query.lower()
-        matches = []
-        for entry in self.entries:
-            if entry.source_type != "web":
-                continue
-            if query_lower in (entry.title or "").lower():
-                matches.append(entry)
-                continue
-            if query_lower in (entry.url or "").lower():
-                matches.append(entry)
-                continue
-            for q in entry.queries:
-                if query_lower in str(q).lower():
-                    matches.append(entry)
-                    break
-        return matches[:top_n]
+        index = self._search_index()
+        candidates = index.text_candidates("web", query.lower())
+        return index.collect(candidates, query.lower(), top_n)
 
     def search_sec(
         self,
@@ -69,30 +197,124 @@ class CacheManifest:
         ciks: list[str] | None,
         top_n: int = 10,
     ) -> list[CacheEntry]:
+        index = self._search_index()
         query_lower = query.lower()
-        matches = []
-        for entry in self.entries:
-            if entry.source_type != "sec":
-                continue
+        candidates = index.text_candidates("sec", query_lower)
+        if form_types:
+            allowed = index.lookup(index.form_types, (str(ft).lower() for ft in form_types))
+            candidates = [idx for idx in candidates if idx in allowed]
+        if ciks:
+            allowed = index.lookup(index.ciks, (str(cik) for cik in ciks))
+            candidates = [idx for idx in candidates if idx in allowed]
+        return index.collect(candidates, query_lower, top_n)
+
+
+_GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set[str]:
+    return {text[pos : pos + _GRAM_SIZE] for pos in range(len(text) - _GRAM_SIZE + 1)}
+
+
+class _ManifestIndex:
+    """Lookup structures built on the first search after a manifest load.
+
+    Title, URL and query strings are lowercased up front and indexed by
+    character trigrams, so a query only verifies entries containing every
+    trigram of the query. Verification is the original substring test, which
+    keeps results (and their manifest order) identical to a linear scan.
+    """
+
+    def __init__(self, entries: list[CacheEntry]):
+        self.entries = entries
+        self.texts: list[tuple[str, ...]] = []
+        self.by_type: dict[str, list[int]] = {}
+        self.grams: dict[str, dict[str, list[int]]] = {}
+        self.form_types: dict[str, set[int]] = {}
+        self.ciks: dict[str, set[int]] = {}
+
+        for idx, entry in enumerate(entries):
+            texts = (
+                (entry.title or "").lower(),
+                (entry.url or "").lower(),
+                *(str(q).lower() for q in entry.queries),
+            )
+            self.texts.append(texts)
+            self.by_type.setdefault(entry.source_type, []).append(idx)
+
+            postings = self.grams.setdefault(entry.source_type, {})
+            entry_grams: set[str] = set()
+            for text in texts:
+                entry_grams |= _grams(text)
+            for gram in entry_grams:
+                postings.setdefault(gram, []).append(idx)
+
             entry_meta = entry.metadata or {}
-            entry_forms = [ft.lower() for ft in entry_meta.get("form_types", [])]
-            entry_ciks = [str(cik) for cik in entry_meta.get("ciks", [])]
-
-            if form_types:
-                if not any(ft.lower() in entry_forms for ft in form_types):
-                    continue
-            if ciks:
-                if not any(str(cik) in entry_ciks for cik in ciks):
-                    continue
-
-            if query_lower in (entry.title or "").lower():
-                matches.append(entry)
-                continue
-            if query_lower in (entry.url or "").lower():
-                matches.append(entry)
-                continue
-            for q in entry.queries:
-                if query_lower in str(q).lower():
-                    matches.append(entry)
+            for form_type in entry_meta.get("form_types", []):
+                self.form_types.setdefault(str(form_type).lower(), set()).add(idx)
+            for cik in entry_meta.get("ciks", []):
+                self.ciks.setdefault(str(cik), set()).add(idx)
+
+    def state(self) -> tuple:
+        return (self.texts, self.by_type, self.grams, self.form_types, self.ciks)
+
+    @classmethod
+    def from_state(cls, entries: list[CacheEntry], state: tuple) -> "_ManifestIndex":
+        index = cls.__new__(cls)
+        index.entries = entries
+        index.texts, index.by_type, index.grams, index.form_types, index.ciks = state
+        return index
+
+    def text_candidates(self, source_type: str, query_lower: str) -> list[int]:
+        if len(query_lower) < _GRAM_SIZE:
+            return self.by_type.get(source_type, [])
+        postings = self.grams.get(source_type, {})
+        lists = sorted((postings.get(gram, []) for gram in _grams(query_lower)), key=len)
+        if not lists[0]:
+            return []
+        candidates = set(lists[0])
+        for posting in lists[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return sorted(candidates)
+
+    @staticmethod
+    def lookup(table: dict[str, set[int]], keys) -> set[int]:
+        found: set[int] = set()
+        for key in keys:
+            found |= table.get(key, set())
+        return found
+
+    def collect(
+        self, candidates: list[int], query_lower: str, top_n: int
+    ) -> list[CacheEntry]:
+        matches = []
+        for idx in candidates:
+            if any(query_lower in text for text in self.texts[idx]):
+                matches.append(self.entries[idx])
+                if top_n > 0 and len(matches) >= top_n:
                     break
         return matches[:top_n]
+
+
+_shared_manifests: dict[str, CacheManifest] = {}
+_shared_lock = threading.Lock()
+
+
+def get_manifest(cache_dir: str | None = None) -> CacheManifest:
+    """Return the process-wide manifest for ``cache_dir``.
+
+    One read-only instance is kept per cache directory and is re-parsed only
+    when ``manifest.json`` changes on disk. Callers must not mutate it.
+    """
+    cache_dir = cache_dir or _default_cache_dir()
+    key = os.path.abspath(cache_dir)
+    with _shared_lock:
+        manifest = _shared_manifests.get(key)
+        if manifest is None:
+            manifest = CacheManifest(cache_dir)
+            _shared_manifests[key] = manifest
+        else:
+            manifest.reload_if_changed()
+    return manifest
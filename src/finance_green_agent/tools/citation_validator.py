@@ -2,7 +2,7 @@ import json
 import re
 from typing import Any
 
-from .cache_manifest import CacheManifest
+from .cache_manifest import get_manifest
 
 
 def extract_citations(answer_text: str) -> list[dict[str, Any]]:
@@ -18,12 +18,11 @@ def extract_citations(answer_text: str) -> list[dict[str, Any]]:
 
 
 def validate_citations(answer_text: str) -> dict[str, Any]:
-    manifest = CacheManifest()
+    manifest = get_manifest()
     cited = extract_citations(answer_text)
-    manifest_ids = {entry.source_id for entry in manifest.entries}
     missing = []
     for source in cited:
         source_id = source.get("id") if isinstance(source, dict) else None
-        if source_id and source_id not in manifest_ids:
+        if source_id and not manifest.has_source(source_id):
             missing.append(source_id)
     return {"cited": cited, "missing": missing, "valid": len(missing) == 0}
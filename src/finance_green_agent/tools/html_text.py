@@ -0,0 +1,260 @@
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Iterator
+
+
+# Characters read per chunk; parser state stays proportional to this.
+CHUNK_SIZE = 256 * 1024
+
+# Text under these tags is not visible; BeautifulSoup types it as
+# Script/Stylesheet/TemplateString/RubyText and leaves it out of get_text().
+_HIDDEN_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+_PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link",
+    "menuitem", "meta", "param", "source", "track", "wbr", "basefont", "bgsound",
+    "command", "frame", "image", "isindex", "nextid", "spacer",
+})
+_ASCII_SPACES = " \n\t\x0c\r"
+
+# Entity names with and without the trailing semicolon, first spelling wins.
+_ENTITIES: dict[str, str] = {}
+for _name, _character in sorted(html5.items()):
+    _ENTITIES.setdefault(_name.removesuffix(";"), _character)
+
+# Where str.splitlines() breaks a line, or a double space.
+_BREAK = re.compile("[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]|  ")
+
+
+class _TextFolder:
+    """Streams ``"\\n".join(piece.strip() for each line for each "  "-split piece)``.
+
+    That is how extracted text has always been flattened; doing it as the
+    text arrives only needs to hold back the unfinished trailing whitespace.
+    """
+
+    def __init__(self):
+        self.parts: list[str] = []
+        self._pending = ""
+        self._in_piece = False
+        self._started = False
+
+    def write(self, text: str) -> None:
+        text = self._pending + text
+        start = 0
+        for match in _BREAK.finditer(text):
+            self._end_piece(text[start:match.start()])
+            start = match.end()
+        rest = text[start:]
+        if not self._in_piece:
+            rest = rest.lstrip()
+        body = rest.rstrip()
+        if body:
+            self._emit(body)
+            rest = rest[len(body):]
+        self._pending = rest
+
+    def close(self) -> None:
+        self._end_piece(self._pending)
+        self._pending = ""
+
+    def _end_piece(self, text: str) -> None:
+        text = text.rstrip() if self._in_piece else text.strip()
+        if text:
+            self._emit(text)
+        self._in_piece = False
+
+    def _emit(self, text: str) -> None:
+        if not self._in_piece:
+            if self._started:
+                self.parts.append("\n")
+            self._in_piece = self._started = True
+        self.parts.append(text)
+
+
+class TextExtractor(HTMLParser):
+    """Incremental visible-text extraction: ``feed`` chunks, ``take`` the text so far.
+
+    Produces what BeautifulSoup's ``html.parser`` tree gave with script and
+    style removed, including its entity handling and whitespace-only string
+    collapsing, but keeps only a tag name stack and the unparsed tail of
+    the last chunk instead of a tree.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self._folder = _TextFolder()
+        self._stack: list[str] = []
+        self._open: dict[str, int] = {}
+        self._hidden = 0
+        self._preserve = 0
+        self._closed_void: list[str] = []
+        # The current run of text between tags; while it is ASCII
+        # whitespace only it is held back, as it may collapse to one space.
+        self._in_string = False
+        self._blank: str | None = None
+
+    def take(self) -> str:
+        text = "".join(self._folder.parts)
+        self._folder.parts.clear()
+        return text
+
+    def close(self) -> None:
+        super().close()
+        self._end_string()
+        self._folder.close()
+
+    def handle_starttag(self, tag, attrs):
+        self._end_string()
+        self._push(tag)
+        if tag in _VOID_TAGS:
+            self._pop_to(tag)
+            self._closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._end_string()
+        self._push(tag)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void:
+            # The end tag of a void element already closed at its start.
+            self._closed_void.remove(tag)
+            return
+        self._end_string()
+        self._pop_to(tag)
+
+    def handle_data(self, data):
+        if self._hidden:
+            return
+        if self._preserve:
+            self._folder.write(data)
+            return
+        if not self._in_string:
+            self._in_string = True
+            self._blank = ""
+        if self._blank is not None:
+            if not data.strip(_ASCII_SPACES):
+                self._blank += data
+                return
+            self._folder.write(self._blank)
+            self._blank = None
+        self._folder.write(data)
+
+    def handle_charref(self, name):
+        codepoint = int(name.lstrip("xX"), 16) if name[0] in "xX" else int(name)
+        data = None
+        if codepoint < 256:
+            try:
+                data = bytes([codepoint]).decode("windows-1252")
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(codepoint)
+            except (ValueError, OverflowError):
+                pass
+        self.handle_data(data or "\N{REPLACEMENT CHARACTER}")
+
+    def handle_entityref(self, name):
+        character = _ENTITIES.get(name)
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_comment(self, data):
+        self._end_string()
+
+    def handle_decl(self, decl):
+        self._end_string()
+
+    def handle_pi(self, data):
+        self._end_string()
+
+    def unknown_decl(self, data):
+        self._end_string()
+        if data.upper().startswith("CDATA["):
+            # CDATA is its own string, visible even inside hidden tags.
+            data = data[len("CDATA["):]
+            if not self._preserve and not data.strip(_ASCII_SPACES):
+                data = "\n" if "\n" in data else " "
+            self._folder.write(data)
+
+    def _end_string(self) -> None:
+        if self._in_string and self._blank is not None:
+            self._folder.write("\n" if "\n" in self._blank else " ")
+        self._in_string = False
+        self._blank = None
+
+    def _push(self, tag: str) -> None:
+        self._stack.append(tag)
+        self._open[tag] = self._open.get(tag, 0) + 1
+        if tag in _HIDDEN_TAGS:
+            self._hidden += 1
+        elif tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve += 1
+
+    def _pop_to(self, tag: str) -> None:
+        if not self._open.get(tag):
+            return
+        while True:
+            popped = self._stack.pop()
+            self._open[popped] -= 1
+            if popped in _HIDDEN_TAGS:
+                self._hidden -= 1
+            elif popped in _PRESERVE_WHITESPACE_TAGS:
+                self._preserve -= 1
+            if popped == tag:
+                return
+
+
+def _is_markup(text: str) -> bool:
+    lowered = text.lower()
+    return "<html" in lowered or "<body" in lowered
+
+
+def extract_text(content: str) -> str:
+    """Visible text of an HTML document; anything else is returned as is."""
+    if not _is_markup(content):
+        return content
+    parser = TextExtractor()
+    for start in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[start:start + CHUNK_SIZE])
+    parser.close()
+    return parser.take()
+
+
+def iter_file_text(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """``extract_text`` of a file, read and yielded ``chunk_size`` characters at a time.
+
+    The file is decoded as UTF-8 ignoring errors, with universal newlines.
+    Whether it is HTML at all depends on the whole file, so a file is first
+    scanned up to its first ``<html``/``<body``; files without one are
+    streamed back unchanged.
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        chunks = iter(lambda: f.read(chunk_size), "")
+        tail = ""
+        for chunk in chunks:
+            if _is_markup(tail + chunk):
+                break
+            tail = chunk[-4:]
+        else:
+            f.seek(0)
+            yield from iter(lambda: f.read(chunk_size), "")
+            return
+
+        f.seek(0)
+        parser = TextExtractor()
+        for chunk in iter(lambda: f.read(chunk_size), ""):
+            parser.feed(chunk)
+            text = parser.take()
+            if text:
+                yield text
+        parser.close()
+        text = parser.take()
+        if text:
+            yield text
+
+
+def extract_file_text(path: str) -> str:
+    return "".join(iter_file_text(path))
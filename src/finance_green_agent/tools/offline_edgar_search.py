@@ -1,5 +1,5 @@
 from ..agent_core.tools_base import Tool
-from .cache_manifest import CacheManifest
+from .cache_manifest import CacheManifest, get_manifest
 
 
 class OfflineEdgarSearch(Tool):
@@ -47,9 +47,9 @@ class OfflineEdgarSearch(Tool):
         "top_n_results",
     ]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.manifest = CacheManifest()
+    @property
+    def manifest(self) -> CacheManifest:
+        return get_manifest()
 
     async def call_tool(self, arguments: dict) -> list[dict]:
         query = arguments.get("query", "")
@@ -1,8 +1,9 @@
 import os
-from bs4 import BeautifulSoup
 
 from ..agent_core.tools_base import Tool
-from .cache_manifest import CacheManifest
+from .cache_manifest import CacheManifest, file_digest, get_manifest
+from .html_text import extract_file_text
+from .text_cache import ExtractedTextCache, file_signature, get_text_cache
 
 
 class ParseCachedHtml(Tool):
@@ -15,9 +16,41 @@ class ParseCachedHtml(Tool):
     }
     required_arguments: list[str] = []
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.manifest = CacheManifest()
+    @property
+    def manifest(self) -> CacheManifest:
+        return get_manifest()
+
+    @property
+    def text_cache(self) -> ExtractedTextCache:
+        return get_text_cache(self.manifest.cache_dir)
+
+    def load_text(self, path: str) -> str:
+        """Extracted text of ``path``, parsed at most once per content version.
+
+        An unchanged file (same path, mtime and size) is served from memory
+        without being read; otherwise it is hashed, and only parsed if
+        neither the memory nor the on-disk cache has its digest. Hashing and
+        parsing both stream the file in chunks.
+        """
+        signature = file_signature(path)
+        if signature is None:
+            raise FileNotFoundError(f"Cached file not found: {path}")
+        cache = self.text_cache
+        digest = cache.digest_for(signature)
+        text = cache.get(digest) if digest is not None else None
+        if text is not None:
+            return text
+
+        digest = file_digest(path)
+        text = cache.get(digest)
+        if text is None:
+            text = extract_file_text(path)
+            if file_signature(path) != signature:
+                # Rewritten while being read: the text may not match the digest.
+                return text
+            cache.put(digest, text)
+        cache.remember_digest(signature, digest)
+        return text
 
     async def call_tool(self, arguments: dict, data_storage: dict) -> list[str]:
         source_id = arguments.get("source_id")
@@ -25,10 +58,9 @@ class ParseCachedHtml(Tool):
         key = arguments.get("key")
 
         if not path and source_id:
-            for entry in self.manifest.entries:
-                if entry.source_id == source_id:
-                    path = entry.local_path
-                    break
+            entry = self.manifest.get_entry(source_id)
+            if entry is not None:
+                path = entry.local_path
 
         if not path:
             raise ValueError("No path or source_id provided for cached parsing")
@@ -36,20 +68,7 @@ class ParseCachedHtml(Tool):
         if not os.path.exists(path):
             raise FileNotFoundError(f"Cached file not found: {path}")
 
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-
-        text = content
-        if "<html" in content.lower() or "<body" in content.lower():
-            soup = BeautifulSoup(content, "html.parser")
-            for script_or_style in soup(["script", "style"]):
-                script_or_style.extract()
-            text = "\n".join(
-                chunk.strip()
-                for line in soup.get_text().splitlines()
-                for chunk in line.split("  ")
-                if chunk.strip()
-            )
+        text = self.load_text(path)
 
         storage_key = key or source_id or os.path.basename(path)
         data_storage[storage_key] = text
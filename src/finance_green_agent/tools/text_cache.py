@@ -0,0 +1,223 @@
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator
+
+from .cache_manifest import default_build_dir
+
+
+# Bump whenever extraction output changes, so stale sidecar files are ignored.
+EXTRACTOR_VERSION = "2"
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+DOCUMENTS_FILE = "documents.json"
+
+
+class ExtractedTextCache:
+    """Extracted document text keyed by the SHA-256 of the source bytes.
+
+    An in-memory LRU holding at most ``max_bytes`` of UTF-8 text sits in
+    front of an on-disk sidecar store under ``store_dir``, one file per
+    digest and extractor version, so a filing is parsed once per version
+    across runs and processes. The disk store is best effort: any I/O
+    error leaves the memory layer working. ``store_dir`` None keeps the
+    cache in memory only.
+    """
+
+    def __init__(self, store_dir: str | None, max_bytes: int = DEFAULT_MEMORY_BYTES):
+        self.store_dir = store_dir
+        self.max_bytes = max(0, max_bytes)
+        self.size_bytes = 0
+        self._texts: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        # (path, mtime_ns, size) -> digest, so unchanged files are not rehashed.
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def digest_for(self, signature: tuple[str, int, int]) -> str | None:
+        """Digest recorded for a file signature, i.e. the same unchanged file."""
+        with self._lock:
+            return self._digests.get(signature)
+
+    def remember_digest(self, signature: tuple[str, int, int], digest: str) -> None:
+        with self._lock:
+            self._digests[signature] = digest
+
+    def has_sidecar(self, digest: str) -> bool:
+        path = self._sidecar_path(digest)
+        return path is not None and os.path.exists(path)
+
+    def sidecar_paths(self) -> list[str]:
+        """Every text file stored for the current extractor version."""
+        if not self.store_dir:
+            return []
+        root = os.path.join(self.store_dir, f"v{EXTRACTOR_VERSION}")
+        return [
+            os.path.join(folder, name)
+            for folder, _, names in os.walk(root)
+            for name in names
+        ]
+
+    def get(self, digest: str) -> str | None:
+        with self._lock:
+            cached = self._texts.get(digest)
+            if cached is not None:
+                self._texts.move_to_end(digest)
+                return cached[0]
+        stored = self._read_sidecar(digest)
+        if stored is None:
+            return None
+        text, size = stored
+        self._remember(digest, text, size)
+        return text
+
+    def put(self, digest: str, text: str) -> None:
+        size = self._write_sidecar(digest, text)
+        self._remember(digest, text, size if size is not None else _utf8_size(text))
+
+    def put_stream(self, digest: str, chunks: Iterable[str]) -> None:
+        """Write text straight to the sidecar store, bypassing memory.
+
+        Unlike ``put`` this raises if the file cannot be written.
+        """
+        path = self._sidecar_path(digest)
+        if path is None:
+            raise ValueError("put_stream needs an on-disk store")
+        _write_atomic(path, chunks)
+
+    def discard(self, digest: str) -> None:
+        with self._lock:
+            previous = self._texts.pop(digest, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+        path = self._sidecar_path(digest)
+        if path is not None and os.path.exists(path):
+            os.unlink(path)
+
+    def iter_sidecar(self, digest: str, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+        path = self._sidecar_path(digest)
+        if path is None:
+            raise FileNotFoundError(f"No stored text for {digest}")
+        with open(path, "r", encoding="utf-8", newline="") as handle:
+            yield from iter(lambda: handle.read(chunk_size), "")
+
+    def _remember(self, digest: str, text: str, size: int) -> None:
+        # ``size`` is the UTF-8 size of ``text``, i.e. of its sidecar file.
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._texts.pop(digest, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            self._texts[digest] = (text, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted) = self._texts.popitem(last=False)
+                self.size_bytes -= evicted
+
+    def _sidecar_path(self, digest: str) -> str | None:
+        if not self.store_dir:
+            return None
+        return os.path.join(self.store_dir, f"v{EXTRACTOR_VERSION}", digest[:2], f"{digest}.txt")
+
+    def _read_sidecar(self, digest: str) -> tuple[str, int] | None:
+        path = self._sidecar_path(digest)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as handle:
+                return handle.read(), os.fstat(handle.fileno()).st_size
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _write_sidecar(self, digest: str, text: str) -> int | None:
+        """Store ``text`` on disk; returns the file's size, or None if not stored."""
+        path = self._sidecar_path(digest)
+        if path is None:
+            return None
+        try:
+            return _write_atomic(path, (text,))
+        except OSError:
+            return None
+
+
+def _write_atomic(path: str, chunks: Iterable[str]) -> int:
+    """Write ``chunks`` to ``path`` as UTF-8 and return the file's size."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so concurrent readers never see a partial file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+            handle.flush()
+            size = os.fstat(handle.fileno()).st_size
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return size
+
+
+def _utf8_size(text: str, chunk_size: int = 1024 * 1024) -> int:
+    # Encoded a slice at a time, so sizing never copies the whole text.
+    if text.isascii():
+        return len(text)
+    return sum(
+        len(text[start:start + chunk_size].encode("utf-8"))
+        for start in range(0, len(text), chunk_size)
+    )
+
+
+def file_signature(path: str) -> tuple[str, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+_shared_caches: dict[str, ExtractedTextCache] = {}
+_shared_lock = threading.Lock()
+
+
+def load_documents(build_dir: str) -> dict[str, dict]:
+    """Per-document records written by ``cache build``, keyed by source id.
+
+    Records from another extractor version are ignored; a missing or
+    unreadable file yields none.
+    """
+    try:
+        with open(os.path.join(build_dir, DOCUMENTS_FILE), "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("extractor_version") != EXTRACTOR_VERSION:
+        return {}
+    documents = payload.get("documents")
+    return documents if isinstance(documents, dict) else {}
+
+
+def get_text_cache(cache_dir: str) -> ExtractedTextCache:
+    """Return the process-wide extracted-text cache for ``cache_dir``.
+
+    Sidecar files go to ``FINANCE_GREEN_TEXT_CACHE_DIR`` if set, else to
+    ``text/`` in the cache's build directory, which ``cache build`` fills
+    ahead of time; the digests it recorded are loaded so built documents
+    are served without reading or hashing the source file.
+    ``FINANCE_GREEN_TEXT_CACHE_BYTES`` sets the memory budget.
+    """
+    build_dir = default_build_dir(cache_dir)
+    store_dir = os.environ.get("FINANCE_GREEN_TEXT_CACHE_DIR") or os.path.join(build_dir, "text")
+    key = os.path.abspath(store_dir)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            raw_budget = os.environ.get("FINANCE_GREEN_TEXT_CACHE_BYTES", "").strip()
+            budget = int(raw_budget) if raw_budget else DEFAULT_MEMORY_BYTES
+            cache = ExtractedTextCache(store_dir, budget)
+            for record in load_documents(build_dir).values():
+                signature = (record["path"], record["mtime_ns"], record["size"])
+                cache.remember_digest(signature, record["digest"])
+            _shared_caches[key] = cache
+    return cache
@@ -1,19 +1,34 @@
 import re
+from typing import Iterable
+
+# Single-character rewrites applied with str.translate after lowercasing.
+_CHAR_TABLE = str.maketrans({",": None, "$": " usd ", "%": " percent "})
+
+# Multi-character unit spellings, rewritten in one regex pass. Order matters
+# only for "bps" before "bp"; no other alternatives can overlap.
+_UNIT_WORDS = {
+    "bps": " basis points ",
+    "bp": " basis points ",
+    "billion": " billion ",
+    "million": " million ",
+    "bn": " billion ",
+    "mn": " million ",
+}
+_UNIT_PATTERN = re.compile("|".join(map(re.escape, _UNIT_WORDS)))
+
+
+def _unit_replacement(match: re.Match) -> str:
+    return _UNIT_WORDS[match.group(0)]
 
 
 def normalize_text(text: str) -> str:
     if text is None:
         return ""
-    normalized = text.lower()
-    normalized = normalized.replace(",", "")
-    normalized = normalized.replace("$", " usd ")
-    normalized = normalized.replace("%", " percent ")
-    normalized = normalized.replace("bps", " basis points ")
-    normalized = normalized.replace("bp", " basis points ")
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    normalized = normalized.replace("billion", " billion ")
-    normalized = normalized.replace("million", " million ")
-    normalized = normalized.replace("bn", " billion ")
-    normalized = normalized.replace("mn", " million ")
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    return normalized
+    normalized = text.lower().translate(_CHAR_TABLE)
+    normalized = _UNIT_PATTERN.sub(_unit_replacement, normalized)
+    return " ".join(normalized.split())
+
+
+def normalize_texts(texts: Iterable[str]) -> list[str]:
+    """Normalize many texts at once, e.g. when regrading stored answers."""
+    return [normalize_text(text) for text in texts]
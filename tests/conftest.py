@@ -1,5 +1,10 @@
+import asyncio
+import csv
+import json
+
 import httpx
 import pytest
+from aiohttp import web
 
 
 def pytest_addoption(parser):
@@ -23,3 +28,159 @@ def agent_url(request):
         pytest.fail(f"Could not connect to agent at {url}: {exc}")
 
     return url
+
+
+@pytest.fixture()
+def write_dataset(tmp_path):
+    def _write(count: int) -> str:
+        path = tmp_path / "questions.csv"
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["Question", "Rubric"])
+            writer.writeheader()
+            for idx in range(count):
+                rubric = [{"operator": "correctness", "criteria": f"answer {idx}"}]
+                writer.writerow({"Question": f"question {idx}", "Rubric": repr(rubric)})
+        return str(path)
+
+    return _write
+
+
+class FakeParticipant:
+    def __init__(
+        self,
+        delays: dict[int, float] | None = None,
+        failures: dict[int, int] | None = None,
+        failure_status: int = 503,
+        straggle_once: bool = False,
+        streaming: bool = False,
+        padding: dict[int, int] | None = None,
+    ):
+        self.delays = delays or {}
+        # Only delay the first request per question, so a retry or hedge is fast.
+        self.straggle_once = straggle_once
+        self.streaming = streaming
+        self.methods: list[str] = []
+        # Question index -> bytes of filler metadata added to the answer.
+        self.padding = padding or {}
+        # Question index -> number of attempts answered with failure_status.
+        self.failures = failures or {}
+        self.failure_status = failure_status
+        self.attempts: dict[int, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.message_ids: list[str] = []
+        self.peers: set[tuple] = set()
+        self.url = ""
+        self.closing = asyncio.Event()
+
+    async def card(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"name": "fake", "url": self.url, "capabilities": {"streaming": self.streaming}}
+        )
+
+    async def rpc(self, request: web.Request) -> web.StreamResponse:
+        self.peers.add(request.transport.get_extra_info("peername"))
+        payload = await request.json()
+        self.methods.append(payload["method"])
+        message = payload["params"]["message"]
+        self.message_ids.append(message["messageId"])
+        question = message["parts"][0]["text"]
+        idx = int(question.rsplit(" ", 1)[-1])
+        self.attempts[idx] = self.attempts.get(idx, 0) + 1
+        if self.attempts[idx] <= self.failures.get(idx, 0):
+            return web.json_response({"error": "unavailable"}, status=self.failure_status)
+        if payload["method"] == "message/stream":
+            return await self._stream(request, payload, idx)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.delays.get(idx, 0.01)
+            if self.straggle_once and self.attempts[idx] > 1:
+                delay = 0.01
+            await asyncio.wait_for(self.closing.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.in_flight -= 1
+        return web.json_response(
+            {
+                "jsonrpc": "2.0",
+                "id": payload["id"],
+                "result": {
+                    "kind": "message",
+                    "messageId": f"reply-{idx}",
+                    "contextId": message["contextId"],
+                    "parts": [{"kind": "text", "text": f"answer {idx}"}],
+                    "metadata": {"filler": "x" * self.padding.get(idx, 0)},
+                },
+            }
+        )
+
+    async def _stream(
+        self, request: web.Request, payload: dict, idx: int
+    ) -> web.StreamResponse:
+        """Answer as status and artifact events, stalling after the first chunk."""
+        context_id = payload["params"]["message"]["contextId"]
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+
+        async def send(event: dict) -> None:
+            body = {"jsonrpc": "2.0", "id": payload["id"], "result": event}
+            await response.write(f"data: {json.dumps(body)}\n\n".encode())
+
+        def chunk(text: str, append: bool) -> dict:
+            return {
+                "kind": "artifact-update",
+                "contextId": context_id,
+                "artifact": {"artifactId": "answer", "parts": [{"kind": "text", "text": text}]},
+                "append": append,
+            }
+
+        def status(state: str) -> dict:
+            return {"kind": "status-update", "contextId": context_id, "status": {"state": state}}
+
+        await send({**status("submitted"), "kind": "task", "id": "t"})
+        await send(chunk("answer", append=False))
+        try:
+            await asyncio.wait_for(self.closing.wait(), self.delays.get(idx, 0.01))
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await send(chunk(f" {idx}", append=True))
+            await send({**status("completed"), "final": True})
+            await response.write_eof()
+        except ConnectionResetError:
+            pass  # the client gave up at its deadline
+        return response
+
+
+@pytest.fixture()
+async def participant_factory():
+    runners: list[web.AppRunner] = []
+    fakes: list[FakeParticipant] = []
+
+    async def _start(**kwargs) -> FakeParticipant:
+        fake = FakeParticipant(**kwargs)
+        fakes.append(fake)
+        app = web.Application()
+        app.router.add_get("/.well-known/agent-card.json", fake.card)
+        app.router.add_post("/", fake.rpc)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        runners.append(runner)
+        port = site._server.sockets[0].getsockname()[1]
+        fake.url = f"http://127.0.0.1:{port}"
+        return fake
+
+    yield _start
+    for fake in fakes:
+        fake.closing.set()
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.fixture()
+async def participant(participant_factory):
+    return await participant_factory()
@@ -0,0 +1,68 @@
+import aiohttp
+from aiohttp import web
+
+from finance_green_agent.agent_card_cache import AgentCardCache
+from finance_green_agent.http_pool import request_timeout
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _serve(handler) -> tuple[web.AppRunner, str]:
+    app = web.Application()
+    app.router.add_get("/.well-known/agent-card.json", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+async def test_cards_are_reused_then_revalidated_with_etag():
+    seen: list[str | None] = []
+
+    async def card(request: web.Request) -> web.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        headers = {"ETag": '"v1"', "Cache-Control": "max-age=60"}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers=headers)
+        return web.json_response({"name": "purple"}, headers=headers)
+
+    runner, url = await _serve(card)
+    clock = _Clock()
+    cache = AgentCardCache(ttl_seconds=5, clock=clock)
+    try:
+        async with aiohttp.ClientSession() as session:
+            first = await cache.get(session, url, request_timeout(5))
+            clock.now = 30
+            assert await cache.get(session, url + "/", request_timeout(5)) is first
+            clock.now = 61
+            assert await cache.get(session, url, request_timeout(5)) == {"name": "purple"}
+    finally:
+        await runner.cleanup()
+
+    assert seen == [None, '"v1"']
+
+
+async def test_no_store_cards_are_not_cached():
+    calls = []
+
+    async def card(request: web.Request) -> web.Response:
+        calls.append(1)
+        return web.json_response({"name": "purple"}, headers={"Cache-Control": "no-store"})
+
+    runner, url = await _serve(card)
+    cache = AgentCardCache()
+    try:
+        async with aiohttp.ClientSession() as session:
+            for _ in range(2):
+                await cache.get(session, url, request_timeout(5))
+    finally:
+        await runner.cleanup()
+
+    assert len(calls) == 2 and len(cache) == 0
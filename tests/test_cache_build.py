@@ -0,0 +1,169 @@
+import json
+import os
+
+import pytest
+
+from finance_green_agent import cli
+from finance_green_agent.tools import cache_build, parse_cached_html, text_cache
+from finance_green_agent.tools.cache_build import build_cache, find_sections, scan_text
+from finance_green_agent.tools.cache_manifest import CacheManifest
+from finance_green_agent.tools.html_text import extract_text
+from finance_green_agent.tools.parse_cached_html import ParseCachedHtml
+
+
+FILING = (
+    "<html><body>\n<h2>PART I</h2>\n<p>Business overview.</p>\n"
+    "<h2>Item 7. Management's Discussion</h2>\n<p>Revenue grew 12%.</p>\n"
+    "<script>track();</script>\n</body></html>"
+)
+
+
+@pytest.fixture()
+def cache_dir(tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache"
+    cache_path.mkdir()
+    entries = [
+        {
+            "source_id": f"sec-{idx}",
+            "type": "sec",
+            "title": f"Filing {idx} 10-K",
+            "url": f"https://sec.example/{idx}",
+            "queries": [f"filing {idx} annual report"],
+            "local_path": str(cache_path / f"sec{idx}.htm"),
+            "metadata": {"form_types": ["10-K"], "ciks": [f"000{idx}"]},
+        }
+        for idx in range(3)
+    ]
+    entries.append(
+        {
+            "source_id": "web-missing",
+            "type": "web",
+            "title": "Gone",
+            "url": "https://example.com/gone",
+            "local_path": str(cache_path / "gone.html"),
+        }
+    )
+    (cache_path / "manifest.json").write_text(json.dumps({"entries": entries}), encoding="utf-8")
+    for idx in range(3):
+        (cache_path / f"sec{idx}.htm").write_text(
+            FILING.replace("12%", f"{idx}%"), encoding="utf-8"
+        )
+    monkeypatch.setenv("FINANCE_GREEN_CACHE_DIR", str(cache_path))
+    monkeypatch.delenv("FINANCE_GREEN_CACHE_BUILD_DIR", raising=False)
+    monkeypatch.delenv("FINANCE_GREEN_TEXT_CACHE_DIR", raising=False)
+    monkeypatch.setattr(text_cache, "_shared_caches", {})
+    return cache_path
+
+
+def _documents(cache_dir) -> dict:
+    with open(cache_dir / ".build" / "documents.json", encoding="utf-8") as f:
+        return json.load(f)["documents"]
+
+
+def test_find_sections():
+    text = "PART I\nItem 1. Business\nWe sell things.\nItem 7A. Market Risk"
+    assert find_sections(text) == [
+        ["PART I", 0],
+        ["Item 1. Business", 7],
+        ["Item 7A. Market Risk", 40],
+    ]
+    chunks = ["PART I\nIte", "m 1. Business\nWe sell ", "x" * 2000 + "\n", "Item 7A. Market Risk"]
+    assert scan_text(chunks) == (len("".join(chunks)), find_sections("".join(chunks)))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_writes_text_metadata_and_compiled_manifest(cache_dir, jobs):
+    report = build_cache(str(cache_dir), jobs=jobs)
+
+    assert report.documents == 3
+    assert report.extracted == 3
+    assert report.missing == ["web-missing"]
+    assert not report.failed
+    assert report.manifest_compiled
+
+    documents = _documents(cache_dir)
+    record = documents["sec-1"]
+    assert record["path"] == str(cache_dir / "sec1.htm")
+    assert record["size"] == os.path.getsize(cache_dir / "sec1.htm")
+    expected = extract_text(FILING.replace("12%", "1%"))
+    assert record["length"] == len(expected)
+    assert [heading for heading, _ in record["sections"]] == [
+        "PART I",
+        "Item 7. Management's Discussion",
+    ]
+
+    plain = CacheManifest(str(cache_dir), build_dir=str(cache_dir / "missing"))
+    compiled = CacheManifest(str(cache_dir))
+    assert compiled.compiled and not plain.compiled
+    assert compiled.entries == plain.entries
+    assert compiled.search_sec("filing 2", ["10-K"], None) == plain.search_sec(
+        "filing 2", ["10-K"], None
+    )
+
+
+def test_rebuild_only_extracts_changed_documents(cache_dir):
+    build_cache(str(cache_dir), jobs=1)
+    report = build_cache(str(cache_dir), jobs=1)
+    assert (report.extracted, report.reused, report.manifest_compiled) == (0, 3, False)
+
+    (cache_dir / "sec0.htm").write_text("<html><body>Restated</body></html>", encoding="utf-8")
+    report = build_cache(str(cache_dir), jobs=1)
+    assert (report.extracted, report.reused, report.pruned) == (1, 2, 1)
+    assert _documents(cache_dir)["sec-0"]["length"] == len("Restated")
+
+    report = build_cache(str(cache_dir), jobs=1, force=True)
+    assert (report.extracted, report.reused, report.manifest_compiled) == (3, 0, True)
+
+
+def test_stale_compiled_manifest_falls_back_to_json(cache_dir):
+    build_cache(str(cache_dir), jobs=1)
+    manifest = json.loads((cache_dir / "manifest.json").read_text(encoding="utf-8"))
+    manifest["entries"] = manifest["entries"][:1]
+    (cache_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    loaded = CacheManifest(str(cache_dir))
+    assert not loaded.compiled
+    assert [entry.source_id for entry in loaded.entries] == ["sec-0"]
+
+
+def test_built_documents_are_served_without_parsing(cache_dir, monkeypatch):
+    build_cache(str(cache_dir), jobs=1)
+
+    def fail(path):
+        raise AssertionError("document was parsed again")
+
+    monkeypatch.setattr(parse_cached_html, "extract_file_text", fail)
+    text = ParseCachedHtml().load_text(str(cache_dir / "sec2.htm"))
+    assert "Revenue grew 2%." in text
+    assert "track()" not in text
+
+
+def test_cli_cache_build(cache_dir, capsys):
+    out = cache_dir / "out"
+    status = cli.main(
+        ["cache", "build", "--cache-dir", str(cache_dir), "--out", str(out), "--jobs", "1"]
+    )
+    assert status == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["documents"] == 3
+    assert (out / "manifest.bin").exists()
+    assert (out / "documents.json").exists()
+
+
+def test_cli_force_rewrites_stored_text(cache_dir, monkeypatch):
+    args = ["cache", "build", "--cache-dir", str(cache_dir), "--jobs", "1"]
+    store = text_cache.ExtractedTextCache(str(cache_dir / ".build" / "text"), max_bytes=0)
+
+    def stored_text() -> str:
+        return "".join(store.iter_sidecar(_documents(cache_dir)["sec-0"]["digest"]))
+
+    assert cli.main(args) == 0
+    assert "Revenue grew 0%." in stored_text()
+
+    # A changed extractor must reach content whose text is already stored.
+    monkeypatch.setattr(cache_build, "iter_file_text", lambda path: iter(["Re-extracted"]))
+    assert cli.main(args) == 0
+    assert "Revenue grew 0%." in stored_text()
+    assert cli.main(args + ["--force"]) == 0
+    assert stored_text() == "Re-extracted"
+    assert _documents(cache_dir)["sec-0"]["length"] == len("Re-extracted")
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from finance_green_agent.agent_card_cache import AgentCardCache
+from finance_green_agent.green_eval import AssessmentProgress, parse_eval_config, run_assessment
+from finance_green_agent.http_pool import create_session
+
+
+async def test_concurrent_dispatch_preserves_dataset_order(participant, write_dataset):
+    dataset = write_dataset(6)
+    participant.delays = {0: 0.2, 1: 0.15, 2: 0.1}
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": dataset, "maxQuestions": 6, "maxConcurrency": 3},
+    }
+
+    result, config = await run_assessment(json.dumps(request))
+
+    assert config.max_concurrency == 3
+    assert participant.max_in_flight == 3
+    rows = result["participants"]["participant"]["results"]
+    assert [row["question"] for row in rows] == [f"question {idx}" for idx in range(6)]
+    assert all(row["score"]["passed"] for row in rows)
+    assert sorted(participant.message_ids) == sorted(
+        f"msg-42-participant-{idx}" for idx in range(6)
+    )
+
+
+async def test_participants_are_evaluated_in_parallel(participant_factory, write_dataset):
+    dataset = write_dataset(4)
+    slow = await participant_factory(delays={idx: 0.2 for idx in range(4)})
+    fast = await participant_factory()
+    request = {
+        "participants": {"participant": slow.url, "challenger": fast.url},
+        "config": {
+            "datasetPath": dataset,
+            "maxQuestions": 4,
+            "maxConcurrency": 2,
+            "maxInFlight": 3,
+        },
+    }
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result, _ = await run_assessment(json.dumps(request))
+    elapsed = loop.time() - started
+
+    assert slow.max_in_flight <= 2
+    assert fast.max_in_flight <= 2
+    assert elapsed < 0.8
+    for role in ("participant", "challenger"):
+        assert result["participants"][role]["summary"]["passed"] == 4
+
+
+async def test_progress_events_follow_graded_questions(participant, write_dataset):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(3), "maxQuestions": 3},
+    }
+    progress = AssessmentProgress()
+
+    async def collect():
+        return [event async for event in progress.events()]
+
+    collector = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    await run_assessment(json.dumps(request), progress=progress)
+    events = await collector
+
+    assert [(event.index, event.graded) for event in events] == [(0, 1), (1, 2), (2, 3)]
+    assert events[-1].total == 3
+    assert events[-1].running_score == 1.0
+
+
+async def test_shared_session_reuses_connections_across_assessments(
+    participant, write_dataset
+):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(3), "maxQuestions": 3},
+    }
+
+    async with create_session() as session:
+        for _ in range(2):
+            result, _ = await run_assessment(json.dumps(request), session=session)
+            assert result["participants"]["participant"]["summary"]["passed"] == 3
+        assert not session.closed
+
+    assert len(participant.peers) == 1
+
+
+def test_request_timeout_separates_connect_and_read():
+    config = parse_eval_config({"timeoutSeconds": 30, "connectTimeoutSeconds": 2})
+
+    timeout = config.request_timeout
+
+    assert (timeout.connect, timeout.sock_read, timeout.total) == (2, 30, 32)
+
+
+async def test_transient_errors_are_retried(participant_factory, write_dataset):
+    fake = await participant_factory(failures={0: 2, 1: 5}, failure_status=503)
+    request = {
+        "participants": {"participant": fake.url},
+        "config": {
+            "datasetPath": write_dataset(3),
+            "maxQuestions": 3,
+            "maxRetries": 2,
+            "retryBackoffSeconds": 0.01,
+        },
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    rows = result["participants"]["participant"]["results"]
+    assert [row["attempts"] for row in rows] == [3, 3, 1]
+    assert rows[0]["score"]["passed"] and rows[2]["score"]["passed"]
+    assert "503" in rows[1]["error"]
+
+
+async def test_circuit_breaker_fails_remaining_questions_fast(
+    participant_factory, write_dataset
+):
+    fake = await participant_factory(failures={idx: 99 for idx in range(5)}, failure_status=500)
+    request = {
+        "participants": {"participant": fake.url},
+        "config": {
+            "datasetPath": write_dataset(5),
+            "maxQuestions": 5,
+            "maxRetries": 0,
+            "circuitBreakerThreshold": 2,
+        },
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    rows = result["participants"]["participant"]["results"]
+    assert [row["circuit_open"] for row in rows] == [False, False, True, True, True]
+    assert [row["attempts"] for row in rows] == [1, 1, 0, 0, 0]
+    assert sum(fake.attempts.values()) == 2
+
+
+async def test_straggling_questions_are_hedged_within_budget(
+    participant_factory, write_dataset
+):
+    # Questions 0-2 set the hedge delay at their 0.2s latency; question 3
+    # answers in 0.01s and the stragglers take 0.6s, so only the stragglers
+    # can cross it, however much the scheduler jitters.
+    fake = await participant_factory(
+        delays={0: 0.2, 1: 0.2, 2: 0.2, 4: 0.6, 5: 0.6}, straggle_once=True
+    )
+    request = {
+        "participants": {"participant": fake.url},
+        "config": {
+            "datasetPath": write_dataset(6),
+            "maxQuestions": 6,
+            "hedge": True,
+            "hedgePercentile": 50,
+            "hedgeMinSamples": 3,
+            "maxHedges": 1,
+        },
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    rows = result["participants"]["participant"]["results"]
+    assert [row["hedge_winner"] for row in rows] == [None] * 4 + ["hedge", None]
+    assert [row["hedged"] for row in rows] == [False] * 4 + [True, False]
+    # The hedged question is timed from its first send, not from the hedge.
+    assert rows[4]["latency_seconds"] >= 0.2 > rows[4]["attempt_latency_seconds"]
+    assert all(row["score"]["passed"] for row in rows)
+    hedges = [message_id for message_id in fake.message_ids if message_id.endswith("-hedge")]
+    assert hedges == ["msg-42-participant-4-hedge"]
+
+
+async def test_streaming_participants_are_read_over_sse(participant_factory, write_dataset):
+    fake = await participant_factory(streaming=True, delays={1: 5.0})
+    request = {
+        "participants": {"participant": fake.url},
+        "config": {"datasetPath": write_dataset(2), "maxQuestions": 2, "timeoutSeconds": 0.3},
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    assert fake.methods == ["message/stream", "message/stream"]
+    complete, cut_off = result["participants"]["participant"]["results"]
+    assert complete["answer"] == "answer 0" and complete["score"]["passed"]
+    assert complete["streamed"] and not complete["truncated"]
+    assert 0 < complete["time_to_first_event"] <= complete["latency_seconds"]
+    assert cut_off["answer"] == "answer" and cut_off["truncated"]
+    assert cut_off["error"] is None
+
+
+async def test_oversized_responses_are_rejected(participant_factory, write_dataset):
+    fake = await participant_factory(padding={1: 50_000})
+    request = {
+        "participants": {"participant": fake.url},
+        "config": {"datasetPath": write_dataset(2), "maxQuestions": 2, "maxResponseBytes": 4096},
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    ok, oversized = result["participants"]["participant"]["results"]
+    assert ok["score"]["passed"] and "raw" not in ok
+    assert "4096 bytes" in oversized["error"]
+    assert oversized["attempts"] == 1
+
+
+async def test_debug_keeps_raw_payload(participant, write_dataset):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(1), "maxQuestions": 1, "debug": True},
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    row = result["participants"]["participant"]["results"][0]
+    assert row["raw"]["result"]["messageId"] == "reply-0"
+
+
+async def test_unreachable_participant_fails_in_preflight(participant, write_dataset):
+    request = {
+        "participants": {"participant": participant.url, "challenger": "http://127.0.0.1:9"},
+        "config": {"datasetPath": write_dataset(2), "maxQuestions": 2},
+    }
+
+    result, _ = await run_assessment(json.dumps(request), card_cache=AgentCardCache())
+
+    challenger = result["participants"]["challenger"]
+    assert challenger["error"] and challenger["results"] == []
+    assert result["participants"]["participant"]["summary"]["passed"] == 2
+    assert result["winner"] == "participant"
+
+
+async def test_summary_reports_latency_throughput_and_timeouts(participant, write_dataset):
+    participant.delays = {2: 5.0}
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {
+            "datasetPath": write_dataset(3),
+            "maxQuestions": 3,
+            "timeoutSeconds": 0.3,
+            "maxRetries": 0,
+        },
+    }
+
+    result, _ = await run_assessment(json.dumps(request))
+
+    evaluation = result["participants"]["participant"]
+    rows, summary = evaluation["results"], evaluation["summary"]
+    assert all(row["sent_at"] <= row["received_at"] <= row["graded_at"] for row in rows)
+    assert rows[2]["timed_out"] and rows[2]["error"]
+    assert summary["timeouts"] == 1
+    assert summary["bytes_received"] == sum(row["bytes_received"] for row in rows[:2]) > 0
+    assert 0 < summary["latency_p50_seconds"] <= summary["latency_max_seconds"] < 0.3
+    assert summary["questions_per_minute"] > 0
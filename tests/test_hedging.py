@@ -0,0 +1,22 @@
+import asyncio
+
+from finance_green_agent.hedging import HEDGE, PRIMARY, Hedger
+
+
+async def test_losing_copy_is_finished_before_the_result_is_returned():
+    hedger = Hedger(percentile=50, min_samples=1, max_hedges=1)
+    hedger.record(0.01)
+    released: list[str] = []
+
+    async def call(copy: str) -> str:
+        try:
+            await asyncio.sleep(5.0 if copy == PRIMARY else 0.02)
+            return copy
+        finally:
+            await asyncio.sleep(0)
+            released.append(copy)
+
+    result, winner = await hedger.run(call, lambda _: True)
+
+    assert (result, winner) == (HEDGE, HEDGE)
+    assert sorted(released) == [HEDGE, PRIMARY]
@@ -0,0 +1,97 @@
+import tracemalloc
+
+import pytest
+
+from finance_green_agent.tools.html_text import (
+    TextExtractor,
+    extract_file_text,
+    extract_text,
+    iter_file_text,
+)
+
+
+DOCUMENTS = [
+    "<html><body>Hello</body></html>",
+    "<html><body><b>a</b>   <b>b</b> x  y\r\nz &amp; &foo; &#150; &#x2019; &nbsp;&nbsp;q</body></html>",
+    "<html><!-- note --><body>a<!-- x -->b<![CDATA[ cd ]]><![CDATA[   ]]>e</body></html>",
+    "<html><body><pre>  a   b\n\n  c  </pre> <textarea>  </textarea> </body></html>",
+    "<html><template><p>hidden</p></template><ruby>kan<rt>ka</rt><rp>(</rp></ruby>shown",
+    "<html><br>a</br>b<br/>c<br>d<br/>e</br>f<script>x</script><style>y",
+    "<html><p>a<span>b<pre>c   d</span>  e</pre>   f</p>",
+    "<!DOCTYPE html><html><head><style>td { color: red }</style>"
+    "<script>var s = '</div>';</script></head>"
+    "<body><h2>Item 7. MD&amp;A</h2>\n<table><tr><td>Revenue</td><td>1,234</td></tr>"
+    "\n<tr><td>Net   income</td><td>(56)</td></tr></table></body></html>",
+    "Plain text, no markup:  kept   as is.\n",
+]
+
+
+def _reference(content: str) -> str:
+    # The BeautifulSoup extraction the streaming extractor replaced.
+    bs4 = pytest.importorskip("bs4")
+    if "<html" not in content.lower() and "<body" not in content.lower():
+        return content
+    soup = bs4.BeautifulSoup(content, "html.parser")
+    for script_or_style in soup(["script", "style"]):
+        script_or_style.extract()
+    return "\n".join(
+        chunk.strip()
+        for line in soup.get_text().splitlines()
+        for chunk in line.split("  ")
+        if chunk.strip()
+    )
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_extract_text_matches_beautifulsoup(document):
+    assert extract_text(document) == _reference(document)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+@pytest.mark.parametrize("document", DOCUMENTS[:-1])
+def test_chunk_boundaries_do_not_change_output(document, chunk_size):
+    parser = TextExtractor()
+    parts = []
+    for start in range(0, len(document), chunk_size):
+        parser.feed(document[start:start + chunk_size])
+        parts.append(parser.take())
+    parser.close()
+    parts.append(parser.take())
+    assert "".join(parts) == extract_text(document)
+
+
+def test_file_text_decodes_like_reading_the_file(tmp_path):
+    html = tmp_path / "page.html"
+    html.write_bytes(b"<html><body>caf\xc3\xa9\r\nbad \xff byte\r</body></html>")
+    assert extract_file_text(str(html)) == "café\nbad\nbyte"
+
+    text = tmp_path / "filing.txt"
+    text.write_bytes(b"SEC filing\r\n  indented\r\n")
+    chunks = list(iter_file_text(str(text), chunk_size=4))
+    assert chunks == ["SEC ", "fili", "ng\n ", " ind", "ente", "d\n"]
+
+
+def test_file_text_memory_is_bounded_by_chunk(tmp_path):
+    block = (
+        "<p>Revenue was $4.2 billion, up 12% year over year.</p>"
+        "<table><tr><td>Net income</td><td>1,234</td></tr></table>"
+        "<script>track('x');</script>\n"
+    )
+    path = tmp_path / "large.html"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<html><body>\n")
+        for _ in range(4_000):
+            f.write(block)
+        f.write("</body></html>")
+    size = path.stat().st_size
+    assert size > 500_000
+
+    chunk_size = 8 * 1024
+    tracemalloc.start()
+    try:
+        length = sum(len(text) for text in iter_file_text(str(path), chunk_size=chunk_size))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert length > 0
+    assert peak < 16 * chunk_size < size / 4
@@ -0,0 +1,60 @@
+import pytest
+
+from finance_green_agent.metrics import MetricsRegistry, _Metric
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", labels=("route",), buckets=(0.1, 1))
+    for value in (0.05, 0.1, 5):
+        latency.observe(value, route="/v1/tasks/{task_id}")
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/v1/tasks/{task_id}",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/v1/tasks/{task_id}",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/v1/tasks/{task_id}",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/v1/tasks/{task_id}"} 3' in lines
+    assert 'latency_seconds_sum{route="/v1/tasks/{task_id}"} 5.15' in lines
+
+
+def test_counter_escapes_labels_and_rejects_wrong_labels():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", labels=("route",))
+    requests.inc(route='say "hi"\n')
+    requests.inc(2, route="/")
+
+    text = registry.render()
+
+    assert 'requests_total{route="say \\"hi\\"\\n"} 1' in text
+    assert 'requests_total{route="/"} 2' in text
+    with pytest.raises(ValueError):
+        requests.inc(path="/")
+    with pytest.raises(ValueError):
+        requests.inc(-1, route="/")
+
+
+def test_registration_is_idempotent_and_gauges_read_callbacks():
+    registry = MetricsRegistry()
+    size = [3]
+    gauge = registry.gauge("tasks", "Tasks.", function=lambda: size[0])
+
+    assert registry.gauge("tasks", "Tasks.") is gauge
+    with pytest.raises(ValueError):
+        registry.counter("tasks", "Tasks.")
+    size[0] = 5
+    assert "tasks 5" in registry.render().splitlines()
+
+    queued = registry.gauge("queued", "Queued.")
+    with queued.track():
+        assert queued.value() == 1
+    assert queued.value() == 0
+
+
+def test_metric_without_samples_fails_at_creation():
+    class Incomplete(_Metric):
+        kind = "untyped"
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "Missing samples.")
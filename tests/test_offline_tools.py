@@ -3,9 +3,13 @@ import os
 
 import pytest
 
+from finance_green_agent.tools.cache_manifest import get_manifest
+from finance_green_agent.tools.citation_validator import validate_citations
 from finance_green_agent.tools.offline_web_search import OfflineGoogleWebSearch
 from finance_green_agent.tools.offline_edgar_search import OfflineEdgarSearch
+from finance_green_agent.tools import parse_cached_html
 from finance_green_agent.tools.parse_cached_html import ParseCachedHtml
+from finance_green_agent.tools.text_cache import ExtractedTextCache
 
 
 @pytest.fixture()
@@ -74,3 +78,100 @@ async def test_parse_cached_html(cache_dir):
     assert "doc" in data_storage
     assert "Hello" in data_storage["doc"]
     assert result
+
+
+@pytest.mark.asyncio
+async def test_parse_cached_html_parses_each_version_once(cache_dir, monkeypatch):
+    calls = []
+    extract = parse_cached_html.extract_file_text
+
+    def counting_extract(path):
+        calls.append(path)
+        return extract(path)
+
+    monkeypatch.setattr(parse_cached_html, "extract_file_text", counting_extract)
+    tool = ParseCachedHtml()
+    storage = {}
+    await tool.call_tool({"source_id": "web-1"}, storage)
+    await tool.call_tool({"source_id": "web-1", "key": "again"}, storage)
+    assert storage["web-1"] == storage["again"] == "Hello"
+    assert len(calls) == 1
+    assert list((cache_dir / ".build" / "text").rglob("*.txt"))
+
+    # A fresh process finds the sidecar file instead of parsing.
+    monkeypatch.setattr(parse_cached_html, "get_text_cache", lambda _: fresh)
+    fresh = ExtractedTextCache(str(cache_dir / ".build" / "text"))
+    await tool.call_tool({"source_id": "web-1"}, storage)
+    assert len(calls) == 1
+
+    (cache_dir / "web1.html").write_text("<html><body>Changed page</body></html>")
+    await tool.call_tool({"source_id": "web-1"}, storage)
+    assert storage["web-1"] == "Changed page"
+    assert len(calls) == 2
+
+
+def test_text_cache_evicts_least_recently_used_within_budget():
+    cache = ExtractedTextCache(None, max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+    cache.put("c", "cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.size_bytes == 8
+    cache.put("big", "x" * 11)
+    assert cache.get("big") is None
+
+
+def test_text_cache_counts_utf8_bytes_from_the_sidecar(tmp_path):
+    text = "café 10-K\r\n€"
+    size = len(text.encode("utf-8"))
+    memory_only = ExtractedTextCache(None)
+    memory_only.put("m", text)
+    assert memory_only.size_bytes == size
+
+    cache = ExtractedTextCache(str(tmp_path))
+    cache.put("d", text)
+    assert cache.size_bytes == size
+
+    fresh = ExtractedTextCache(str(tmp_path))
+    assert fresh.get("d") == text
+    assert fresh.size_bytes == size
+
+
+def test_shared_manifest_reloads_on_change(cache_dir):
+    manifest = get_manifest()
+    assert get_manifest(str(cache_dir)) is manifest
+    assert manifest.has_source("web-1")
+
+    answer = 'FINAL ANSWER: ok\n{"sources": [{"id": "web-2"}]}'
+    assert validate_citations(answer)["missing"] == ["web-2"]
+
+    manifest_path = cache_dir / "manifest.json"
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    data["entries"].append({"source_id": "web-2", "type": "web", "title": "Second"})
+    manifest_path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert get_manifest() is manifest
+    assert manifest.has_source("web-2")
+    assert validate_citations(answer)["valid"]
+
+
+
+def test_manifest_builds_search_index_on_first_search(cache_dir):
+    manifest = get_manifest()
+    answer = 'FINAL ANSWER: ok\n{"sources": [{"id": "web-1"}]}'
+    assert validate_citations(answer)["valid"]
+    assert manifest._index is None
+
+    assert [e.source_id for e in manifest.search_web("example")] == ["web-1"]
+    assert manifest._index is not None
+
+def test_manifest_search_keeps_substring_semantics(cache_dir):
+    manifest = get_manifest()
+    assert [e.source_id for e in manifest.search_web("XAMPLE Q")] == ["web-1"]
+    assert [e.source_id for e in manifest.search_web("ex")] == ["web-1"]
+    assert manifest.search_web("missing phrase") == []
+    assert [e.source_id for e in manifest.search_sec("weak", ["10-k"], ["0001"])] == ["sec-1"]
+    assert manifest.search_sec("weak", ["8-K"], None) == []
+    assert manifest.search_sec("weak", None, ["0002"]) == []
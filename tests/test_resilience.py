@@ -0,0 +1,40 @@
+import asyncio
+
+import aiohttp
+from yarl import URL
+
+from finance_green_agent.resilience import CircuitBreaker, is_transient
+
+
+def _response_error(status: int) -> aiohttp.ClientResponseError:
+    info = aiohttp.RequestInfo(URL("http://agent/"), "POST", {}, URL("http://agent/"))
+    return aiohttp.ClientResponseError(info, (), status=status)
+
+
+def test_transient_errors_are_classified():
+    assert is_transient(_response_error(503))
+    assert is_transient(_response_error(429))
+    assert not is_transient(_response_error(400))
+    assert is_transient(aiohttp.ServerDisconnectedError())
+    assert not is_transient(aiohttp.ServerTimeoutError())
+    assert not is_transient(asyncio.TimeoutError())
+
+
+def test_circuit_breaker_half_opens_after_reset():
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open and not breaker.allow()
+
+    now[0] = 10.0
+    assert breaker.allow()  # the probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.trips == 2 and not breaker.allow()
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open and breaker.allow()
@@ -0,0 +1,64 @@
+import csv
+
+import pytest
+
+from finance_green_agent.eval.matcher import MultiPatternMatcher
+from finance_green_agent.eval.question_bank import load_question_bank
+from finance_green_agent.eval.rubric import compile_rubric, evaluate_answer
+from finance_green_agent.tools.unit_normalizer import normalize_text, normalize_texts
+
+RUBRIC = repr(
+    [
+        {"operator": "correctness", "criteria": "Revenue was $1.2bn"},
+        {"operator": "contradiction", "criteria": "revenue declined"},
+    ]
+)
+
+
+def test_compiled_rubric_matches_string_rubric():
+    answer = "Revenue was $1.2 billion, up 5%."
+    compiled = compile_rubric(RUBRIC)
+    assert compiled.items[0].normalized_criteria == "revenue was usd 1.2 billion"
+    assert evaluate_answer(answer, compiled) == evaluate_answer(answer, RUBRIC)
+    assert evaluate_answer(answer, compiled)["passed"]
+    assert evaluate_answer(answer, "") == {"passed": False, "score": 0.0, "details": []}
+
+
+def test_question_bank_is_cached_until_file_changes(tmp_path):
+    path = tmp_path / "questions.csv"
+
+    def write(rows):
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["Question", "Rubric"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    write([{"Question": "Q1", "Rubric": RUBRIC}])
+    bank = load_question_bank(str(path))
+    assert load_question_bank(str(path)) is bank
+    assert bank.questions[0].rubric.items[1].operator == "contradiction"
+
+    write([{"Question": "Q1", "Rubric": RUBRIC}, {"Question": "Q2", "Rubric": ""}])
+    reloaded = load_question_bank(str(path))
+    assert reloaded is not bank
+    assert [q.question for q in reloaded.questions] == ["Q1", "Q2"]
+    assert reloaded.rows()[1] == {"Question": "Q2", "Rubric": ""}
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_multi_pattern_matcher_matches_substring_search(use_automaton):
+    patterns = ["he", "she", "his", "hers", "", "usd 5", "hers", "zebra"]
+    matcher = MultiPatternMatcher(patterns)
+    matcher.use_automaton = use_automaton
+    for text in ["ushers", "usd 5 million for his", "", "she sells"]:
+        expected = {idx for idx, pattern in enumerate(patterns) if pattern in text}
+        assert matcher.find(text) == expected
+
+
+def test_normalize_text_rewrites_units():
+    assert normalize_text("Margin up 25bps to 1,234.5bn ($) and 3%") == (
+        "margin up 25 basis points to 1234.5 billion ( usd ) and 3 percent"
+    )
+    assert normalize_text("  5Mn\tvs 2 BP ") == "5 million vs 2 basis points"
+    assert normalize_text(None) == ""
+    assert normalize_texts(["$1 Billion", ""]) == ["usd 1 billion", ""]
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from finance_green_agent.scheduler import FairScheduler
+
+
+async def test_slots_are_granted_round_robin():
+    scheduler = FairScheduler(max_in_flight=1)
+    order: list[str] = []
+
+    await scheduler.acquire("blocker")
+
+    async def worker(key: str) -> None:
+        async with scheduler.slot(key):
+            order.append(key)
+
+    tasks = [asyncio.create_task(worker("slow")) for _ in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(worker("fast")) for _ in range(2)]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["slow", "fast", "slow", "fast", "slow"]
+    assert scheduler.in_flight == 0
+
+
+async def test_cancelled_waiter_does_not_leak_slot():
+    scheduler = FairScheduler(max_in_flight=1)
+    await scheduler.acquire("a")
+    waiter = asyncio.create_task(scheduler.acquire("b"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+    assert scheduler.in_flight == 0
+    assert scheduler.waiting == 0
+    await asyncio.wait_for(scheduler.acquire("c"), timeout=1)
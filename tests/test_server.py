@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from finance_green_agent.server import app, running_assessments
+
+
+def _send_payload(request: dict[str, Any], blocking: bool | None = None) -> dict[str, Any]:
+    configuration: dict[str, Any] = {"acceptedOutputModes": ["text"]}
+    if blocking is not None:
+        configuration["blocking"] = blocking
+    return {
+        "message": {
+            "messageId": uuid4().hex,
+            "role": "ROLE_USER",
+            "content": [{"text": json.dumps(request)}],
+        },
+        "configuration": configuration,
+    }
+
+
+def _sse_events(body: str) -> list[dict[str, Any]]:
+    return [
+        json.loads(line[len("data: ") :])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@pytest.fixture()
+async def client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://green") as http:
+        yield http
+
+
+async def _wait_for_state(client: httpx.AsyncClient, task_id: str, state: str) -> dict:
+    for _ in range(200):
+        task = (await client.get(f"/v1/tasks/{task_id}")).json()
+        if task["status"]["state"] == state:
+            return task
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"task {task_id} never reached {state}")
+
+
+async def test_non_blocking_send_returns_working_task(client, participant, write_dataset):
+    participant.delays = {0: 0.2}
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(2), "maxQuestions": 2},
+    }
+
+    response = await client.post("/v1/message:send", json=_send_payload(request, blocking=False))
+
+    task = response.json()["task"]
+    assert task["status"]["state"] == "TASK_STATE_WORKING"
+    assert task["id"] in running_assessments
+    finished = await _wait_for_state(client, task["id"], "TASK_STATE_COMPLETED")
+    assert finished["artifacts"][0]["name"] == "EvaluationResult"
+    assert task["id"] not in running_assessments
+
+
+async def test_jsonrpc_non_blocking_send(client, participant, write_dataset):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(1), "maxQuestions": 1},
+    }
+    payload = {
+        "jsonrpc": "2.0",
+        "id": "1",
+        "method": "message/send",
+        "params": {
+            "message": {
+                "kind": "message",
+                "messageId": uuid4().hex,
+                "role": "user",
+                "parts": [{"kind": "text", "text": json.dumps(request)}],
+            },
+            "configuration": {"blocking": False},
+        },
+    }
+
+    response = await client.post("/", json=payload)
+
+    task = response.json()["result"]
+    assert task["status"]["state"] == "working"
+    await _wait_for_state(client, task["id"], "TASK_STATE_COMPLETED")
+
+
+async def test_blocking_send_still_waits_for_result(client, participant, write_dataset):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(1), "maxQuestions": 1},
+    }
+
+    response = await client.post("/v1/message:send", json=_send_payload(request))
+
+    assert response.json()["task"]["status"]["state"] == "TASK_STATE_COMPLETED"
+
+
+async def test_subscribe_streams_live_updates(client, participant, write_dataset):
+    participant.delays = {0: 0.1}
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(1), "maxQuestions": 1},
+    }
+    response = await client.post("/v1/message:send", json=_send_payload(request, blocking=False))
+    task_id = response.json()["task"]["id"]
+
+    response = await client.get(f"/v1/tasks/{task_id}:subscribe")
+
+    events = _sse_events(response.text)
+    assert events[0]["task"]["status"]["state"] == "TASK_STATE_WORKING"
+    assert events[1]["artifactUpdate"]["artifact"]["name"] == "EvaluationProgress"
+    assert events[-2]["artifactUpdate"]["artifact"]["name"] == "EvaluationResult"
+    assert events[-1]["statusUpdate"]["status"]["state"] == "TASK_STATE_COMPLETED"
+    assert events[-1]["statusUpdate"]["final"] is True
+
+
+async def test_cancel_stops_running_assessment_and_keeps_partial_results(
+    client, participant, write_dataset
+):
+    participant.delays = {1: 5.0, 2: 5.0}
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(3), "maxQuestions": 3},
+    }
+    response = await client.post("/v1/message:send", json=_send_payload(request, blocking=False))
+    task_id = response.json()["task"]["id"]
+    # Question 1 is only sent once question 0 has been answered and graded.
+    for _ in range(100):
+        if "msg-42-participant-1" in participant.message_ids:
+            break
+        await asyncio.sleep(0.02)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    response = await client.post(f"/v1/tasks/{task_id}:cancel")
+
+    assert loop.time() - started < 1.0
+    task = response.json()
+    assert task["status"]["state"] == "TASK_STATE_CANCELLED"
+    assert task_id not in running_assessments
+    artifact = task["artifacts"][0]
+    assert artifact["metadata"]["partial"] is True
+    result = artifact["parts"][1]["data"]["data"]
+    assert result["cancelled"] is True
+    rows = result["participants"]["participant"]["results"]
+    assert [row["question"] for row in rows] == ["question 0"]
+    assert participant.message_ids == ["msg-42-participant-0", "msg-42-participant-1"]
+
+
+async def test_message_stream_emits_progress_per_question(client, participant, write_dataset):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(3), "maxQuestions": 3},
+    }
+
+    response = await client.post("/v1/message:stream", json=_send_payload(request))
+
+    events = _sse_events(response.text)
+    assert events[0]["task"]["status"]["state"] == "TASK_STATE_SUBMITTED"
+    assert events[1]["statusUpdate"]["status"]["state"] == "TASK_STATE_WORKING"
+    progress = [
+        event["artifactUpdate"]
+        for event in events
+        if "artifactUpdate" in event
+        and event["artifactUpdate"]["artifact"]["name"] == "EvaluationProgress"
+    ]
+    assert len(progress) == 3
+    assert all(update["append"] for update in progress)
+    chunk = progress[-1]["artifact"]["parts"][0]["data"]["data"]
+    assert chunk["graded"] == 3
+    assert chunk["running_score"] == 1.0
+    assert events[-1]["statusUpdate"]["final"] is True
+
+    task_id = events[0]["task"]["id"]
+    task = (await client.get(f"/v1/tasks/{task_id}")).json()
+    assert [artifact["name"] for artifact in task["artifacts"]] == ["EvaluationResult"]
+
+
+async def test_jsonrpc_stream_emits_status_and_artifact_updates(
+    client, participant, write_dataset
+):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(2), "maxQuestions": 2},
+    }
+    payload = {
+        "jsonrpc": "2.0",
+        "id": "7",
+        "method": "message/stream",
+        "params": {
+            "message": {
+                "kind": "message",
+                "messageId": uuid4().hex,
+                "role": "user",
+                "parts": [{"kind": "text", "text": json.dumps(request)}],
+            }
+        },
+    }
+
+    response = await client.post("/", json=payload)
+
+    results = [event["result"] for event in _sse_events(response.text)]
+    assert results[0]["kind"] == "task"
+    assert [r["kind"] for r in results[1:3]] == ["artifact-update", "artifact-update"]
+    assert results[-1]["kind"] == "status-update"
+    assert results[-1]["status"]["state"] == "completed"
+    assert results[-1]["final"] is True
+
+
+async def test_lifespan_owns_participant_pool():
+    from finance_green_agent import server
+
+    async with server.lifespan(app):
+        session = server.participant_session
+        assert session is not None and not session.closed
+
+    assert session.closed
+    assert server.participant_session is None
+
+
+async def test_metrics_endpoint_reports_routes_and_assessments(
+    client, participant, write_dataset
+):
+    request = {
+        "participants": {"participant": participant.url},
+        "config": {"datasetPath": write_dataset(2), "maxQuestions": 2},
+    }
+    await client.post("/v1/message:send", json=_send_payload(request))
+    await client.get("/v1/tasks/missing")
+
+    response = await client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+
+    def has_series(prefix: str) -> bool:
+        return any(line.startswith(prefix + " ") for line in lines)
+
+    # Series are labelled with the route template, never the raw task id.
+    assert has_series(
+        'finance_green_http_requests_total{method="GET",route="/v1/tasks/{task_id}",status="404"}'
+    )
+    assert not any("missing" in line for line in lines)
+    assert has_series('finance_green_assessments_total{outcome="completed"}')
+    assert has_series(
+        'finance_green_participant_answer_seconds_count{role="participant",outcome="ok"}'
+    )
+    assert has_series("finance_green_grading_seconds_count")
+    assert "finance_green_assessments_running 0" in lines
+    assert "finance_green_questions_in_flight 0" in lines
@@ -0,0 +1,168 @@
+from finance_green_agent.a2a_schemas import Role, TaskState, new_artifact, new_message, new_text_part
+from finance_green_agent.task_store import (
+    ORPHANED_TASK_MESSAGE,
+    InMemoryTaskStore,
+    SqliteTaskStore,
+)
+
+
+def _message(text: str):
+    return new_message(role=Role.agent, parts=[new_text_part(text)])
+
+
+async def _drain(subscription) -> list:
+    return [event async for event in subscription]
+
+
+async def test_subscribers_receive_snapshot_then_live_events():
+    store = InMemoryTaskStore()
+    task = store.create_task(context_id="ctx")
+    early = store.subscribe(task.id)
+    store.update_status(task.id, TaskState.working, _message("working"))
+    late = store.subscribe(task.id)
+    store.add_artifact(task.id, new_artifact(name="result", parts=[new_text_part("done")]))
+    store.update_status(task.id, TaskState.completed, _message("done"))
+
+    early_events = await _drain(early)
+    late_events = await _drain(late)
+
+    assert early_events[0].task.status.state == TaskState.submitted
+    assert [e.status_update.status.state for e in early_events[1:] if e.status_update] == [
+        TaskState.working,
+        TaskState.completed,
+    ]
+    assert late_events[0].task.status.state == TaskState.working
+    assert late_events[1].artifact_update.artifact.name == "result"
+    assert late_events[-1].status_update.final is True
+    assert store.subscriber_count() == 0
+
+
+async def test_finished_task_yields_only_snapshot():
+    store = InMemoryTaskStore()
+    task = store.create_task()
+    store.update_status(task.id, TaskState.failed, _message("boom"))
+
+    events = await _drain(store.subscribe(task.id))
+
+    assert len(events) == 1
+    assert events[0].task.status.state == TaskState.failed
+    assert store.subscribe("missing") is None
+
+
+async def test_slow_subscriber_is_dropped_when_queue_fills():
+    store = InMemoryTaskStore(subscriber_queue_size=3)
+    task = store.create_task()
+    slow = store.subscribe(task.id)
+    for idx in range(5):
+        store.update_status(task.id, TaskState.working, _message(f"step {idx}"))
+
+    assert slow.overflowed
+    assert await _drain(slow) == []
+    assert store.subscriber_count() == 0
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _finish(store, text: str = "done"):
+    task = store.create_task()
+    store.add_artifact(task.id, new_artifact(name="result", parts=[new_text_part(text)]))
+    store.update_status(task.id, TaskState.completed, _message(text))
+    return task
+
+
+def test_finished_tasks_are_evicted_lru_and_by_ttl():
+    clock = _Clock()
+    store = InMemoryTaskStore(max_finished_tasks=2, ttl_seconds=60, clock=clock)
+    running = store.create_task()
+    first, second = _finish(store), _finish(store)
+    assert store.get_task(first.id) is first  # now most recently used
+
+    third = _finish(store)
+
+    assert store.get_task(second.id) is None
+    assert store.get_task(first.id) is first
+    clock.now += 61
+    assert store.get_task(third.id) is None
+    assert store.get_task(running.id) is running
+
+
+def test_sqlite_store_persists_finished_tasks(tmp_path):
+    path = str(tmp_path / "tasks.sqlite3")
+    store = SqliteTaskStore(path, cache_size=0)
+    task = _finish(store, "persisted")
+    running = store.create_task(context_id="ctx")
+    store.update_status(running.id, TaskState.working)
+    store.close()
+
+    reopened = SqliteTaskStore(path)
+    loaded = reopened.get_task(task.id)
+
+    assert loaded is not task
+    assert loaded.status.state == TaskState.completed
+    assert loaded.artifacts[0].parts[0].text == "persisted"
+    assert reopened.get_task(running.id).context_id == "ctx"
+    assert reopened.get_task("missing") is None
+
+
+
+async def test_sqlite_store_fails_tasks_orphaned_by_a_restart(tmp_path):
+    path = str(tmp_path / "tasks.sqlite3")
+    store = SqliteTaskStore(path)
+    running = store.create_task()
+    store.update_status(running.id, TaskState.working)
+    store.close()
+
+    reopened = SqliteTaskStore(path)
+    (state,) = reopened._db.execute(
+        "SELECT state FROM tasks WHERE id = ?", (running.id,)
+    ).fetchone()
+    status = reopened.get_task(running.id).status
+    events = await _drain(reopened.subscribe(running.id))
+
+    assert state == TaskState.failed.value
+    assert status.state == TaskState.failed
+    assert status.message.content[0].text == ORPHANED_TASK_MESSAGE
+    assert [event.task.status.state for event in events] == [TaskState.failed]
+    assert reopened.subscriber_count() == 0
+
+def test_sqlite_store_evicts_finished_tasks(tmp_path):
+    clock = _Clock()
+    store = SqliteTaskStore(
+        str(tmp_path / "tasks.sqlite3"), max_finished_tasks=1, ttl_seconds=60, clock=clock
+    )
+    old, new = _finish(store), _finish(store)
+
+    assert store.get_task(old.id) is None
+    assert store.get_task(new.id).status.state == TaskState.completed
+    clock.now += 61
+    assert store.get_task(new.id) is None
+    assert store.task_count() == 0
+
+
+def test_sqlite_store_batches_appended_progress_rows(tmp_path):
+    path = str(tmp_path / "tasks.sqlite3")
+    store = SqliteTaskStore(path, cache_size=0, write_batch_size=1000, write_interval=60)
+    task = store.create_task()
+    store.update_status(task.id, TaskState.working)
+    progress = new_artifact(name="progress", parts=[new_text_part("row 0")])
+    store.add_artifact(task.id, progress)
+    for index in range(1, 50):
+        chunk = progress.model_copy(update={"parts": [new_text_part(f"row {index}")]})
+        store.add_artifact(task.id, chunk, append=True)
+
+    def count(table):
+        return store._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    assert (count("artifacts"), count("artifact_chunks")) == (0, 0)
+    store.update_status(task.id, TaskState.completed, _message("done"))
+    assert (count("artifacts"), count("artifact_chunks")) == (1, 49)
+    store.close()
+
+    loaded = SqliteTaskStore(path).get_task(task.id)
+    assert [part.text for part in loaded.artifacts[0].parts] == [f"row {i}" for i in range(50)]